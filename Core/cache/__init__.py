@@ -0,0 +1,13 @@
+from .world_cache import DiskStore, LRUByteCache, WorldCache, canonical_hash, code_version, file_digest
+from .world_store import WorldStore, default_store_path
+
+__all__ = [
+    "DiskStore",
+    "LRUByteCache",
+    "WorldCache",
+    "WorldStore",
+    "canonical_hash",
+    "code_version",
+    "default_store_path",
+    "file_digest"
+]
@@ -0,0 +1,233 @@
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+import contextlib, hashlib, json, os, tempfile, threading
+
+import numpy as np
+
+from Utilities import configAble
+from Core.metrics.generation_metrics import GenerationMetrics
+
+# Stage outputs are stored as a mapping of World layer name -> array.
+Layers = Dict[str, np.ndarray]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules and packages whose source determines generation output: the stages and their settings.
+# Code that only reads finished Worlds (jobs, metrics, contours, sampling) is left out.
+CODE_PATHS = ('Core/noise_ops', 'Core/climate', 'data_models/biome.py', 'data_models/generation.py', 'factories')
+
+
+def canonical_hash(*parts: Any) -> str:
+    """
+    Hashes JSON-serializable parts into a stable hex digest.
+
+    Keys are sorted and separators fixed so equal values always hash equally.
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """Returns the sha256 of a file's content, or None if it does not exist. Cached by mtime and size."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _file_digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Digest of the generation source code, so cached results never outlive the code that made them."""
+    digest = hashlib.sha256()
+    for code_path in CODE_PATHS:
+        root = REPO_ROOT / code_path
+        for path in ([root] if root.is_file() else sorted(root.rglob('*.py'))):
+            digest.update(str(path.relative_to(REPO_ROOT)).encode('utf-8'))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _layers_nbytes(layers: Layers) -> int:
+    return sum(array.nbytes for array in layers.values())
+
+
+class LRUByteCache:
+    """
+    In-memory LRU cache bounded by the total byte size of the stored arrays.
+
+    Stored arrays are marked read-only and returned without copying.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, Layers]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Layers]:
+        with self._lock:
+            layers = self._entries.get(key)
+            if layers is not None:
+                self._entries.move_to_end(key)
+            return layers
+
+    def put(self, key: str, layers: Layers) -> None:
+        # Read-only whether or not the layers fit, so callers cannot rely on mutating them
+        for array in layers.values():
+            array.flags.writeable = False
+        size = _layers_nbytes(layers)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= _layers_nbytes(previous)
+            self._entries[key] = layers
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= _layers_nbytes(evicted)
+
+
+class DiskStore:
+    """
+    On-disk store of stage outputs, one uncompressed .npz file per key.
+
+    Writes go to a temporary file first and are renamed into place, so
+    concurrent workers never read a partial entry. Instead of on every put,
+    the directory is scanned once per `max_bytes` / SCAN_FRACTION bytes
+    written, and the least recently used files are then removed until that
+    many bytes are free below `max_bytes`. Each process sharing the directory
+    scans on its own writes, so the store exceeds `max_bytes` by at most that
+    amount per process.
+    """
+
+    SCAN_FRACTION = 16
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._unscanned_bytes = 0  # Written by this process since the last scan
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[Layers]:
+        entry = self._entry_path(key)
+        try:
+            with np.load(entry) as data:
+                layers = {name: data[name] for name in data.files}
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry)  # Recency for eviction; another worker may have evicted it since
+        return layers
+
+    def put(self, key: str, layers: Layers) -> None:
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez(file, **layers)
+                self._unscanned_bytes += file.tell()
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        if self._unscanned_bytes > self.max_bytes // self.SCAN_FRACTION:
+            self._evict()
+
+    def _evict(self) -> None:
+        self._unscanned_bytes = 0
+        target = self.max_bytes - self.max_bytes // self.SCAN_FRACTION
+        entries = []
+        for path in self.path.rglob('*.npz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class WorldCache:
+    """
+    Two-tier, content-addressed cache of generation stage outputs.
+
+    Lookups try the in-memory LRU first, then the disk store; disk hits are
+    promoted to memory. Keys are built by WorldFactory with `root_key` and
+    `stage_key` so every stage's output is addressed by everything it depends on.
+    """
+
+    config_manager = configAble.ConfigAble(config_path='config.yaml')
+    log = config_manager.get_logger()
+
+    def __init__(
+            self,
+            memory_bytes: Optional[int] = None,
+            disk_path: Optional[str] = None,
+            disk_bytes: Optional[int] = None
+        ):
+        get_config = self.config_manager.get_config
+        memory_bytes = memory_bytes or get_config('WorldCache.memory_bytes', default=512 * 1024 ** 2)
+        disk_path    = disk_path    or get_config('WorldCache.disk_path', default='Cache/worlds')
+        disk_bytes   = disk_bytes   or get_config('WorldCache.disk_bytes', default=8 * 1024 ** 3)
+
+        self.memory = LRUByteCache(memory_bytes)
+        self.disk = DiskStore(disk_path, disk_bytes) if disk_path else None
+        self.stats: Dict[str, int] = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def root_key(self, seed: int, width: int, height: int) -> str:
+        """Key shared by every stage of a world: code version and the world's seed and size."""
+        return canonical_hash(code_version(), seed, width, height)
+
+    @staticmethod
+    def stage_key(parent_key: str, stage: str, fingerprint: Any) -> str:
+        """Key of a stage's output given the key of the stage before it."""
+        return canonical_hash(parent_key, stage, fingerprint)
+
+    def get(self, key: str) -> Optional[Layers]:
+        layers = self.memory.get(key)
+        GenerationMetrics.inc('cache_requests', tier='memory', result='hit' if layers is not None else 'miss')
+        if layers is not None:
+            self.stats['memory_hits'] += 1
+            return layers
+        if self.disk is not None:
+            layers = self.disk.get(key)
+            GenerationMetrics.inc('cache_requests', tier='disk', result='hit' if layers is not None else 'miss')
+            if layers is not None:
+                self.stats['disk_hits'] += 1
+                self.memory.put(key, layers)
+                return layers
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key: str, layers: Layers) -> None:
+        self.memory.put(key, layers)
+        if self.disk is not None:
+            try:
+                self.disk.put(key, layers)
+            except OSError as e:
+                self.log.warning(f"Failed to write cache entry {key}: {e}")
@@ -0,0 +1,234 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import fcntl, json, os, re, shutil, tempfile, threading
+
+import numpy as np
+
+from Utilities import configAble
+from Core.metrics.generation_metrics import GenerationMetrics
+from data_models.world import World
+
+# World layers kept in the store; the rest of a World is small and goes in meta.json
+STORED_LAYERS = ('height_map', 'land_mask', 'temperature_map', 'moisture_map', 'biome_map')
+META_FIELDS = ('width', 'height', 'seed', 'name')
+
+_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+def default_store_path() -> str:
+    """A directory on tmpfs where available, so stored worlds are in RAM once and never touch disk."""
+    shm = Path('/dev/shm')
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else Path(tempfile.gettempdir())
+    return str(base / 'fmg-worlds')
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class WorldStore:
+    """
+    Read-only Worlds shared by every process on the machine.
+
+    Each World is a directory of .npy files, one per layer, under `path`
+    (tmpfs by default). Processes attach by memory-mapping the files, so a
+    World's arrays are in memory once however many API workers serve it, and
+    `attach` returns a World of zero-copy, read-only views. Editing a layer
+    (`World.edit_layer`) copies it first.
+
+    References are counted per process with a lease file for each attached
+    process; leases of processes that have exited are ignored. When the store
+    grows past `max_bytes` the least recently attached Worlds that no live
+    process holds are removed. Worlds are published by renaming a finished
+    directory into place and all structural changes hold a file lock, so
+    readers never see a partial World.
+    """
+
+    config_manager = configAble.ConfigAble(config_path='config.yaml')
+    log = config_manager.get_logger()
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        get_config = self.config_manager.get_config
+        self.path = Path(path or get_config('WorldStore.path', default=None) or default_store_path())
+        self.max_bytes: int = max_bytes or get_config('WorldStore.max_bytes', default=4 * 1024 ** 3)
+        self.path.mkdir(parents=True, exist_ok=True)
+        # world id -> (attached World, references held by this process)
+        self._attached: Dict[str, Tuple[World, int]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Handed to pool workers, which attach on their own
+        return {'path': str(self.path), 'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def _world_dir(self, world_id: str) -> Path:
+        if not _ID_PATTERN.match(world_id):
+            raise ValueError(f"Invalid world id: {world_id!r}")
+        return self.path / world_id
+
+    @contextmanager
+    def _locked(self, shared: bool) -> Iterator[None]:
+        with open(self.path / '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def __contains__(self, world_id: str) -> bool:
+        return (self._world_dir(world_id) / 'meta.json').exists()
+
+    def list_worlds(self) -> List[str]:
+        return sorted(entry.name for entry in self.path.iterdir() if entry.is_dir() and not entry.name.startswith('.'))
+
+    def put(self, world_id: str, world: World) -> bool:
+        """
+        Publishes a World's layers under `world_id`, then evicts to make room.
+
+        Returns:
+            bool: False if a World with this id was already stored; it is left as it is.
+        """
+        target = self._world_dir(world_id)
+        if target.exists():
+            return False
+        staging = Path(tempfile.mkdtemp(dir=self.path, prefix=f'.tmp-{os.getpid()}-'))
+        try:
+            layers = []
+            for layer in STORED_LAYERS:
+                array = getattr(world, layer)
+                if array is not None:
+                    np.save(staging / f'{layer}.npy', np.ascontiguousarray(array), allow_pickle=False)
+                    layers.append(layer)
+            (staging / 'leases').mkdir()
+            with open(staging / 'meta.json', 'w') as file:
+                json.dump({**{field: getattr(world, field) for field in META_FIELDS}, 'layers': layers}, file)
+            with self._locked(shared=True):
+                try:
+                    os.rename(staging, target)
+                except OSError:
+                    return False  # Published by another process in the meantime
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict(keep=world_id)
+        return True
+
+    def attach(self, world_id: str) -> World:
+        """
+        Returns the stored World as read-only views of the shared files and
+        takes a reference to it for this process. Pair with `release`.
+
+        Raises:
+            KeyError: If no World is stored under `world_id`.
+        """
+        with self._lock:
+            attached = self._attached.get(world_id)
+            if attached is not None:
+                self._attached[world_id] = (attached[0], attached[1] + 1)
+                GenerationMetrics.inc('cache_requests', tier='shared', result='hit')
+                return attached[0]
+            world_dir = self._world_dir(world_id)
+            with self._locked(shared=True):
+                try:
+                    with open(world_dir / 'meta.json', 'r') as file:
+                        meta = json.load(file)
+                    layers = {layer: np.asarray(np.load(world_dir / f'{layer}.npy', mmap_mode='r')) for layer in meta.pop('layers')}
+                    (world_dir / 'leases' / str(os.getpid())).touch()
+                except FileNotFoundError:
+                    GenerationMetrics.inc('cache_requests', tier='shared', result='miss')
+                    raise KeyError(world_id) from None
+                os.utime(world_dir / 'meta.json')  # Recency for eviction
+            world = World(**meta, **layers)
+            self._attached[world_id] = (world, 1)
+            GenerationMetrics.inc('cache_requests', tier='shared', result='hit')
+            return world
+
+    def release(self, world_id: str) -> None:
+        """Drops a reference taken by `attach`; the process' lease ends with its last reference."""
+        with self._lock:
+            world, count = self._attached.get(world_id, (None, 0))
+            if count > 1:
+                self._attached[world_id] = (world, count - 1)
+                return
+            if self._attached.pop(world_id, None) is not None:
+                (self._world_dir(world_id) / 'leases' / str(os.getpid())).unlink(missing_ok=True)
+
+    @contextmanager
+    def open(self, world_id: str) -> Iterator[World]:
+        """Attaches for the duration of a block."""
+        world = self.attach(world_id)
+        try:
+            yield world
+        finally:
+            self.release(world_id)
+
+    def refcount(self, world_id: str) -> int:
+        """Number of live processes holding the World."""
+        leases = self._world_dir(world_id) / 'leases'
+        try:
+            return sum(1 for lease in leases.iterdir() if _pid_alive(int(lease.name)))
+        except FileNotFoundError:
+            return 0
+
+    def nbytes(self, world_id: str) -> int:
+        try:
+            return sum(entry.stat().st_size for entry in self._world_dir(world_id).glob('*.npy'))
+        except FileNotFoundError:
+            return 0
+
+    def remove(self, world_id: str) -> bool:
+        """
+        Deletes a World that no live process holds. Processes that still have
+        it mapped keep their views; the memory is freed when they let go.
+
+        Returns:
+            bool: Whether the World was removed.
+        """
+        with self._locked(shared=False):
+            if self.refcount(world_id) > 0:
+                return False
+            shutil.rmtree(self._world_dir(world_id), ignore_errors=True)
+            return True
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Removes the least recently attached unreferenced Worlds until the
+        store fits in `max_bytes`, and staging directories of dead processes.
+
+        Returns:
+            int: Number of Worlds removed.
+        """
+        removed = 0
+        with self._locked(shared=False):
+            entries = []
+            for entry in self.path.iterdir():
+                if entry.name.startswith('.tmp-'):
+                    if not _pid_alive(int(entry.name.split('-')[2])):
+                        shutil.rmtree(entry, ignore_errors=True)
+                    continue
+                if not entry.is_dir() or entry.name.startswith('.'):
+                    continue
+                try:
+                    entries.append((entry.joinpath('meta.json').stat().st_mtime, entry.name, self.nbytes(entry.name)))
+                except FileNotFoundError:
+                    continue
+            total = sum(size for _, _, size in entries)
+            for _, world_id, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if world_id == keep or self.refcount(world_id) > 0:
+                    continue
+                shutil.rmtree(self.path / world_id, ignore_errors=True)
+                total -= size
+                removed += 1
+        if removed:
+            self.log.info(f"WorldStore evicted {removed} worlds")
+        return removed
@@ -0,0 +1,14 @@
+from .climate_model import (
+    climate_reach, coastal_reach, distance_to_water, elevation, latitudes, moisture_map, precipitation_sweep, temperature_map
+)
+
+__all__ = [
+    "climate_reach",
+    "coastal_reach",
+    "distance_to_water",
+    "elevation",
+    "latitudes",
+    "moisture_map",
+    "precipitation_sweep",
+    "temperature_map"
+]
@@ -0,0 +1,267 @@
+from typing import Optional, Tuple
+import math
+import numpy as np
+
+from Core.noise_ops import NoiseGenerator
+from data_models.generation import ClimateSettings
+from data_models.world import Rect
+
+# Columns per block of the precipitation sweep. Within a block the running
+# product of retention factors stays well inside float64 range.
+SWEEP_BLOCK = 128
+
+# Cap on the per-cell rainout exponent so even cliffs keep exp(-x) ** SWEEP_BLOCK representable
+MAX_RAINOUT = 4.0
+
+
+def _climate_noise(shape: Tuple[int, int], rect: Rect, settings: ClimateSettings, seed: Optional[int]) -> np.ndarray:
+    """fBm noise in [-1, 1] for perturbing the climate maps, for the `rect` window of a map of `shape`."""
+    zeros = np.zeros(rect.shape, dtype=np.float32)
+    return NoiseGenerator.execute_op(
+        "fbm", zeros, {"scale": settings.noise_scale, "octaves": 3},
+        seed=seed, origin=(rect.top, rect.left), full_shape=shape
+    )
+
+
+def coastal_reach(settings: ClimateSettings) -> int:
+    """Cells beyond which the coastal bonus is negligible (under 1% of its peak)."""
+    return math.ceil(5 * settings.coastal_distance)
+
+
+def climate_reach(rect: Rect, settings: ClimateSettings, shape: Tuple[int, int]) -> Rect:
+    """
+    The region of the climate maps affected by a change to the height map in `rect`.
+
+    The coastal bonus spreads `coastal_reach` cells in every direction and a
+    changed rainout carries on downwind to the edge of the map.
+    """
+    reach = rect.expand(coastal_reach(settings), shape)
+    if settings.wind_from == "west":
+        return reach._replace(right=shape[1])
+    if settings.wind_from == "east":
+        return reach._replace(left=0)
+    if settings.wind_from == "north":
+        return reach._replace(bottom=shape[0])
+    return reach._replace(top=0)
+
+
+def elevation(height_map: np.ndarray, sea_level: float, settings: ClimateSettings) -> np.ndarray:
+    """Height above sea level in metres; zero over water."""
+    metres = height_map - np.float32(sea_level)
+    np.maximum(metres, 0.0, out=metres)
+    metres *= np.float32(settings.elevation_scale)
+    return metres
+
+
+def latitudes(rows: int, settings: ClimateSettings) -> np.ndarray:
+    """Latitude in degrees of the centre of each row."""
+    top, bottom = settings.latitude_range
+    return top + (bottom - top) * (np.arange(rows, dtype=np.float32) + 0.5) / rows
+
+
+def temperature_map(
+        height_map: np.ndarray,
+        sea_level: float,
+        settings: ClimateSettings,
+        seed: Optional[int] = None,
+        window: Optional[Rect] = None
+    ) -> np.ndarray:
+    """
+    Computes temperature from latitude, elevation and noise.
+
+    The sea-level temperature falls from the equator to the poles with the
+    cosine of latitude, land cools by `lapse_rate` per 1000 m, and fBm noise
+    of `temperature_noise` degrees breaks up the bands.
+
+    Args:
+        height_map (np.ndarray)     : The 2D height map.
+        sea_level  (float)          : Heights above this are land.
+        settings   (ClimateSettings): The climate settings.
+        seed       (int, optional)  : Seed for the noise.
+        window     (Rect, optional) : Only compute this part of the map.
+
+    Returns:
+        np.ndarray: float32 temperature map in degrees Celsius, the size of `window` if given.
+    """
+    rect = window or Rect.full(height_map.shape)
+    band = np.cos(np.radians(latitudes(height_map.shape[0], settings)[rect.top:rect.bottom]))
+    sea_level_temp = (settings.pole_temperature + (settings.equator_temperature - settings.pole_temperature) * band)
+
+    temperature = elevation(height_map[rect.slices], sea_level, settings)
+    temperature *= np.float32(-settings.lapse_rate / 1000.0)
+    temperature += sea_level_temp.astype(np.float32)[:, None]
+    if settings.temperature_noise > 0:
+        noise = _climate_noise(height_map.shape, rect, settings, seed)
+        noise *= np.float32(settings.temperature_noise)
+        temperature += noise
+    return temperature
+
+
+def _to_wind_frame(array: np.ndarray, wind_from: str) -> np.ndarray:
+    """Returns a view of `array` in which the wind blows along axis 1 towards higher columns."""
+    if wind_from == "east":
+        return array[:, ::-1]
+    if wind_from == "north":
+        return array.T
+    if wind_from == "south":
+        return array[::-1].T
+    return array
+
+
+def _from_wind_frame(array: np.ndarray, wind_from: str) -> np.ndarray:
+    """Inverse of `_to_wind_frame`."""
+    if wind_from == "east":
+        return array[:, ::-1]
+    if wind_from == "north":
+        return array.T
+    if wind_from == "south":
+        return array.T[::-1]
+    return array
+
+
+def precipitation_sweep(
+        height_map: np.ndarray,
+        water: np.ndarray,
+        settings: ClimateSettings
+    ) -> np.ndarray:
+    """
+    Carries moisture along the prevailing wind and returns the rain per cell.
+
+    Air entering a cell carries moisture M; over water it picks up
+    evaporation e, then a fraction p of what it carries falls as rain:
+
+        M[x] = (M[x-1] + e[x]) * (1 - p[x])
+
+    Over land p grows with the uphill slope along the wind, so windward
+    slopes are wet and the lee lies in a rain shadow. The recurrence is
+    linear, so each block of columns is solved at once with cumulative
+    products and sums; only the block carry is a Python loop.
+
+    Moisture is in units of saturated air (1.0). The returned rain is scaled
+    so flat land under saturated air receives about 1.0. Distances are in
+    cells, so the result does not depend on the size of the map.
+
+    Args:
+        height_map (np.ndarray)     : The 2D height map.
+        water      (np.ndarray)     : Boolean mask, True over water.
+        settings   (ClimateSettings): The climate settings.
+
+    Returns:
+        np.ndarray: float32 rain map in the orientation of `height_map`.
+    """
+    heights = _to_wind_frame(height_map, settings.wind_from)
+    wet = _to_wind_frame(water, settings.wind_from)
+    rows, cols = heights.shape
+
+    land_rate = 1.0 / settings.rain_distance
+    ocean_rate = 1.0 / settings.saturation_distance
+    lift = settings.orographic_lift * settings.elevation_scale / 1000.0
+    # Evaporation that makes saturated air (M = 1) the equilibrium over water
+    ocean_keep = np.exp(-ocean_rate)
+    evaporation = (1.0 - ocean_keep) / ocean_keep
+
+    rain = np.empty((rows, cols), dtype=np.float32)
+    carry = np.zeros(rows, dtype=np.float64)
+    for start in range(0, cols, SWEEP_BLOCK):
+        stop = min(start + SWEEP_BLOCK, cols)
+        block_water = wet[:, start:stop]
+        # Climb into each cell along the wind; the first column has no upwind neighbour
+        upwind = heights[:, max(start - 1, 0):stop]
+        uphill = np.diff(upwind, axis=1, prepend=upwind[:, :1]) if start == 0 else np.diff(upwind, axis=1)
+        uphill = np.maximum(uphill, 0.0, dtype=np.float64)
+        uphill *= lift
+        exponent = np.where(block_water, ocean_rate, land_rate + uphill)
+        np.minimum(exponent, MAX_RAINOUT, out=exponent)
+        keep = np.exp(-exponent)
+        pickup = np.where(block_water, evaporation, 0.0)
+
+        # M[x] = K[x] * (carry + sum_{k<=x} keep[k] * pickup[k] / K[k]), K = cumulative product of keep
+        retained = np.cumprod(keep, axis=1)
+        moisture = np.cumsum(keep * pickup / retained, axis=1)
+        moisture += carry[:, None]
+        moisture *= retained
+
+        incoming = np.empty_like(moisture)
+        incoming[:, 0] = carry
+        incoming[:, 1:] = moisture[:, :-1]
+        incoming += pickup
+        rain[:, start:stop] = incoming * (1.0 - keep) * settings.rain_distance
+        carry = moisture[:, -1]
+    return np.ascontiguousarray(_from_wind_frame(rain, settings.wind_from))
+
+
+def distance_to_water(water: np.ndarray) -> np.ndarray:
+    """
+    Distance in cells from each cell to the nearest water cell along its row
+    or column (an upper bound on the Euclidean distance).
+
+    Each direction is one running maximum of the index of the last water
+    cell seen. Maps without water get a distance larger than the map.
+    """
+    rows, cols = water.shape
+    far = rows + cols
+
+    def since_last_water(mask: np.ndarray, axis: int) -> np.ndarray:
+        index = np.arange(mask.shape[axis], dtype=np.int32)
+        index = index[:, None] if axis == 0 else index[None, :]
+        last = np.where(mask, index, np.int32(-far))
+        np.maximum.accumulate(last, axis=axis, out=last)
+        np.subtract(index, last, out=last)
+        return last
+
+    distance = since_last_water(water, 1)
+    np.minimum(distance, since_last_water(water[:, ::-1], 1)[:, ::-1], out=distance)
+    np.minimum(distance, since_last_water(water, 0), out=distance)
+    np.minimum(distance, since_last_water(water[::-1], 0)[::-1], out=distance)
+    return distance
+
+
+def moisture_map(
+        height_map: np.ndarray,
+        sea_level: float,
+        settings: ClimateSettings,
+        seed: Optional[int] = None,
+        window: Optional[Rect] = None
+    ) -> np.ndarray:
+    """
+    Computes yearly precipitation from the prevailing-wind sweep, distance
+    to water and noise, capped at `precipitation_cap`.
+
+    Args:
+        height_map (np.ndarray)     : The 2D height map.
+        sea_level  (float)          : Heights at or below this are water.
+        settings   (ClimateSettings): The climate settings.
+        seed       (int, optional)  : Seed for the noise.
+        window     (Rect, optional) : Only compute this part of the map. The sweep still
+                                      runs from the upwind edge for the rows (or columns) it covers.
+
+    Returns:
+        np.ndarray: float32 moisture map in mm of precipitation per year, the size of `window` if given.
+    """
+    shape = height_map.shape
+    rect = window or Rect.full(shape)
+    # Full-length strips along the wind so the sweep sees everything upwind
+    if settings.wind_from in ("west", "east"):
+        strip = Rect(rect.top, 0, rect.bottom, shape[1])
+    else:
+        strip = Rect(0, rect.left, shape[0], rect.right)
+    within = (slice(rect.top - strip.top, rect.bottom - strip.top), slice(rect.left - strip.left, rect.right - strip.left))
+    strip_heights = height_map[strip.slices]
+    moisture = precipitation_sweep(strip_heights, strip_heights <= sea_level, settings)[within]
+    moisture *= np.float32(settings.max_precipitation)
+
+    if settings.coastal_precipitation > 0:
+        box = rect.expand(coastal_reach(settings), shape) if window is not None else rect
+        inner = (slice(rect.top - box.top, rect.bottom - box.top), slice(rect.left - box.left, rect.right - box.left))
+        falloff = distance_to_water(height_map[box.slices] <= sea_level)[inner].astype(np.float32)
+        falloff *= np.float32(-1.0 / settings.coastal_distance)
+        np.exp(falloff, out=falloff)
+        falloff *= np.float32(settings.coastal_precipitation)
+        moisture += falloff
+    if settings.moisture_noise > 0:
+        noise = _climate_noise(shape, rect, settings, seed)
+        noise *= np.float32(settings.moisture_noise)
+        noise += np.float32(1.0)
+        moisture *= noise
+    np.clip(moisture, 0.0, settings.precipitation_cap, out=moisture)
+    return moisture
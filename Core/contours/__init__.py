@@ -0,0 +1,13 @@
+from .vector_export import write_geojson, write_svg
+from .isoline_tracer import Polyline, coastlines, isolines, marching_squares, simplify, trace
+
+__all__ = [
+    "Polyline",
+    "coastlines",
+    "isolines",
+    "marching_squares",
+    "simplify",
+    "trace",
+    "write_geojson",
+    "write_svg"
+]
@@ -0,0 +1,297 @@
+from typing import Iterable, Iterator, NamedTuple, Tuple
+import numpy as np
+
+from Core.metrics import GenerationMetrics
+from data_models.world import World
+
+# Square edges, corners and their positions in a unit square with x right and y down
+TOP, RIGHT, BOTTOM, LEFT = range(4)
+_EDGE_POINTS = np.array([(0.5, 0.0), (1.0, 0.5), (0.5, 1.0), (0.0, 0.5)])
+_CORNER_POINTS = np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])  # top-left, top-right, bottom-right, bottom-left
+# Case bits: the top pair of corners in bits 3-2 and the bottom pair in 1-0, each pair left to right
+_CORNER_BITS = (8, 4, 1, 2)
+_CORNER_EDGES = ((TOP, LEFT), (TOP, RIGHT), (RIGHT, BOTTOM), (BOTTOM, LEFT))
+_EDGE_CORNERS = ((0, 1), (1, 2), (3, 2), (0, 3))
+# Offset of each edge from the square's top-left corner and whether it is a vertical edge
+_EDGE_ROW = np.array([0, 0, 1, 0])
+_EDGE_COL = np.array([0, 1, 0, 0])
+_EDGE_VERTICAL = np.array([False, True, False, True])
+# Saddles whose centre is above the level use these rows of the table
+_SADDLE_HIGH = {6: 16, 9: 17}
+
+
+class Polyline(NamedTuple):
+    """One traced isoline. Points are (x, y) in cells, y downwards; closed rings repeat their first point."""
+    level : float
+    points: np.ndarray
+    closed: bool
+
+
+def _segment_table() -> np.ndarray:
+    """
+    Segments per marching-squares case as (from edge, to edge), -1 where a
+    case has fewer than two. Segments run with the ground above the level on
+    their left, so rings around high ground are anticlockwise as drawn.
+    """
+    table = np.full((18, 2, 2), -1, dtype=np.int8)
+
+    def oriented(edges: Tuple[int, int], corner: int, high: bool) -> Tuple[int, int]:
+        first, second = _EDGE_POINTS[edges[0]], _EDGE_POINTS[edges[1]]
+        direction, offset = second - first, _CORNER_POINTS[corner] - first
+        on_left = direction[0] * offset[1] - direction[1] * offset[0] < 0
+        return edges if on_left == high else edges[::-1]
+
+    for case in range(16):
+        high = [bool(case & bit) for bit in _CORNER_BITS]
+        crossed = tuple(edge for edge, (a, b) in enumerate(_EDGE_CORNERS) if high[a] != high[b])
+        if len(crossed) == 2:
+            table[case, 0] = oriented(crossed, 0, high[0])
+        elif len(crossed) == 4:
+            for row, centre_high in ((case, False), (_SADDLE_HIGH[case], True)):
+                # The segments cut off the two corners on the other side of the level from the centre
+                cut = [corner for corner in range(4) if high[corner] != centre_high]
+                for slot, corner in enumerate(cut):
+                    table[row, slot] = oriented(_CORNER_EDGES[corner], corner, high[corner])
+    return table
+
+
+_SEGMENTS = _segment_table()
+
+
+def _edge_ids(rows: np.ndarray, cols: np.ndarray, edges: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+    """Global ids of square edges: horizontal edges first, row-major, then vertical edges."""
+    height, width = shape
+    row = rows + _EDGE_ROW[edges]
+    col = cols + _EDGE_COL[edges]
+    return np.where(_EDGE_VERTICAL[edges], height * (width - 1) + row * width + col, row * (width - 1) + col)
+
+
+def _edge_points(array: np.ndarray, level: float, ids: np.ndarray) -> np.ndarray:
+    """Where the level crosses each edge, interpolated linearly between the edge's two cells."""
+    height, width = array.shape
+    flat = array.ravel()
+    horizontal = ids < height * (width - 1)
+    vertical_ids = ids - height * (width - 1)
+    row = np.where(horizontal, ids // (width - 1), vertical_ids // width)
+    col = np.where(horizontal, ids % (width - 1), vertical_ids % width)
+    first = row * width + col
+    second = first + np.where(horizontal, 1, width)
+    low, high = flat[first].astype(np.float64), flat[second].astype(np.float64)
+    t = (level - low) / (high - low)
+    points = np.empty((len(ids), 2), dtype=np.float64)
+    points[:, 0] = col + np.where(horizontal, t, 0.0)
+    points[:, 1] = row + np.where(horizontal, 0.0, t)
+    return points
+
+
+def marching_squares(array: np.ndarray, level: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the isoline segments of a 2D array at `level` in one pass over all
+    squares of four neighbouring cells.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (from, to) edge ids of every segment.
+                                       Each edge a segment ends on starts the next one.
+    """
+    above = (array > level).view(np.uint8)
+    pairs = above[:, :-1] * np.uint8(2)
+    pairs |= above[:, 1:]
+    case = pairs[:-1] * np.uint8(4)
+    case |= pairs[1:]
+    # Cases 1-14 are crossed; the uint8 subtraction wraps case 0 round to 255
+    squares = np.flatnonzero((case - np.uint8(1)) < 14)
+    rows, cols = np.divmod(squares, case.shape[1])
+    cases = case.ravel()[squares].astype(np.intp)
+
+    saddle = np.flatnonzero((cases == 6) | (cases == 9))
+    if len(saddle):
+        s_rows, s_cols = rows[saddle], cols[saddle]
+        centre = (array[s_rows, s_cols].astype(np.float64) + array[s_rows, s_cols + 1]
+                  + array[s_rows + 1, s_cols] + array[s_rows + 1, s_cols + 1]) / 4.0
+        high = saddle[centre > level]
+        cases[high] = np.where(cases[high] == 6, _SADDLE_HIGH[6], _SADDLE_HIGH[9])
+
+    segments = _SEGMENTS[cases]
+    second = segments[:, 1, 0] >= 0
+    rows = np.concatenate([rows, rows[second]])
+    cols = np.concatenate([cols, cols[second]])
+    edges = np.concatenate([segments[:, 0], segments[second, 1]]).astype(np.intp)
+    return _edge_ids(rows, cols, edges[:, 0], array.shape), _edge_ids(rows, cols, edges[:, 1], array.shape)
+
+
+def _distance_to_end(successor: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pointer jumping: for every node of a successor list, the last node it
+    reaches and how many steps away it is.
+
+    Nodes on cycles never reach an end and are reported as not `ended`; for
+    them `lowest` is the smallest node on their cycle.
+    """
+    index = np.arange(len(successor), dtype=successor.dtype)
+    jump = np.where(successor < 0, index, successor)
+    distance = (successor >= 0).astype(successor.dtype)
+    lowest = index.copy()
+    count = -1
+    while True:
+        np.minimum(lowest, lowest[jump], out=lowest)
+        distance += distance[jump]
+        jump = jump[jump]
+        ended = successor[jump] < 0
+        # While a chain is unresolved each round ends at least one more node, and once
+        # every window spans its cycle all nodes of a cycle agree on its smallest node
+        new_count = ended.sum()
+        if new_count == count:
+            cycle = np.flatnonzero(~ended)
+            if (lowest[cycle] == lowest[successor[cycle]]).all():
+                return jump, distance, ended, lowest
+        count = new_count
+
+
+def _link(successor: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Orders a successor list into chains: the last node and distance to it of
+    every node. Cycles are cut before their smallest node, which becomes
+    their start; the nodes that were cut are returned too.
+    """
+    last, distance, ended, lowest = _distance_to_end(successor)
+    cycle = np.flatnonzero(~ended)
+    if not len(cycle):
+        return last, distance, cycle
+    cut = cycle[successor[cycle] == lowest[cycle]]
+    successor[cut] = -1
+    # Only the nodes on cycles change, so only they are ranked again
+    local = np.full(len(successor), -1, dtype=successor.dtype)
+    local[cycle] = np.arange(len(cycle))
+    cycle_successor = np.where(successor[cycle] < 0, -1, local[successor[cycle]]).astype(successor.dtype)
+    cycle_last, cycle_distance, _, _ = _distance_to_end(cycle_successor)
+    last[cycle] = cycle[cycle_last]
+    distance[cycle] = cycle_distance
+    return last, distance, cut
+
+
+def trace(array: np.ndarray, level: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Traces the isolines of a 2D array at `level` into polylines.
+
+    Segments are linked through the edges they share into chains without a
+    Python loop: pointer jumping gives each segment its chain's last segment
+    and its distance to it, and sorting by both puts every chain in order.
+
+    Args:
+        array (np.ndarray): The 2D field, e.g. a height map.
+        level (float)     : The value to trace.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The concatenated (x, y) points, the offsets
+                                                   of each polyline into them (one more than
+                                                   polylines) and whether each is a closed ring.
+    """
+    starts, ends = marching_squares(array, level)
+    if not len(starts):
+        return np.empty((0, 2)), np.zeros(1, dtype=np.intp), np.zeros(0, dtype=bool)
+
+    order = np.argsort(starts)
+    sorted_starts = starts[order]
+    position = np.minimum(np.searchsorted(sorted_starts, ends), len(starts) - 1)
+    # int32 halves the memory traffic of pointer jumping
+    successor = np.where(sorted_starts[position] == ends, order[position], -1).astype(np.int32)
+
+    last, distance, cut = _link(successor)
+
+    chain = np.lexsort((-distance, last))
+    last = last[chain]
+    boundaries = np.flatnonzero(np.diff(last)) + 1
+    chain_ends = np.append(boundaries, len(chain))
+    # Each chain visits the start edge of every segment, then the end edge of its last one
+    edge_ids = np.insert(starts[chain], chain_ends, ends[chain[chain_ends - 1]])
+    offsets = np.concatenate([[0], chain_ends + np.arange(1, len(chain_ends) + 1)])
+    closed = np.isin(last[chain_ends - 1], cut)
+    return _edge_points(array, level, edge_ids), offsets, closed
+
+
+def simplify(points: np.ndarray, offsets: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Douglas–Peucker simplification of many polylines at once.
+
+    Every round handles the open ranges of all polylines together: the point
+    furthest from each range's chord is found with reduceat and, if it is
+    more than `tolerance` away, kept and used to split the range in two.
+
+    Args:
+        points    (np.ndarray): Concatenated (x, y) points.
+        offsets   (np.ndarray): Start of each polyline in `points`, plus the total.
+        tolerance (float)     : Largest allowed distance of a dropped point from the result.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept points and their offsets.
+    """
+    if tolerance <= 0 or not len(points):
+        return points, offsets
+    keep = np.zeros(len(points), dtype=bool)
+    keep[offsets[:-1]] = True
+    keep[offsets[1:] - 1] = True
+    first, last = offsets[:-1], offsets[1:] - 1
+    open_ranges = last - first > 1
+    first, last = first[open_ranges], last[open_ranges]
+    tolerance_sq = tolerance * tolerance
+    x, y = np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+
+    while len(first):
+        interior = last - first - 1
+        range_starts = np.cumsum(interior) - interior
+        index = np.arange(interior.sum()) + np.repeat(first + 1 - range_starts, interior)
+
+        # Per range: the chord and 1 / its squared length, zero for the closing chord of a ring
+        start_x, start_y = x[first], y[first]
+        chord_x, chord_y = x[last] - start_x, y[last] - start_y
+        chord_sq = chord_x * chord_x + chord_y * chord_y
+        inverse = np.divide(1.0, chord_sq, out=np.zeros_like(chord_sq), where=chord_sq > 0)
+
+        offset_x = x[index] - np.repeat(start_x, interior)
+        offset_y = y[index] - np.repeat(start_y, interior)
+        cross = offset_y * np.repeat(chord_x, interior)
+        cross -= offset_x * np.repeat(chord_y, interior)
+        distance_sq = cross * cross
+        distance_sq *= np.repeat(inverse, interior)
+        degenerate = chord_sq == 0
+        if degenerate.any():
+            # Rings start and end on the same point: measure from it instead
+            ring = np.repeat(degenerate, interior)
+            distance_sq[ring] = offset_x[ring] ** 2 + offset_y[ring] ** 2
+
+        furthest = np.maximum.reduceat(distance_sq, range_starts)
+        split = np.minimum.reduceat(np.where(distance_sq == np.repeat(furthest, interior), index, len(points)), range_starts)
+        splitting = furthest > tolerance_sq
+        keep[split[splitting]] = True
+
+        first, last, split = first[splitting], last[splitting], split[splitting]
+        first, last = np.concatenate([first, split]), np.concatenate([split, last])
+        open_ranges = last - first > 1
+        first, last = first[open_ranges], last[open_ranges]
+
+    counts = np.add.reduceat(keep.astype(np.intp), offsets[:-1]) if len(offsets) > 1 else np.zeros(0, dtype=np.intp)
+    return points[keep], np.concatenate([[0], np.cumsum(counts)])
+
+
+def isolines(array: np.ndarray, levels: Iterable[float], tolerance: float = 0.0) -> Iterator[Polyline]:
+    """
+    Yields the isolines of a 2D array, one polyline at a time, level by level.
+
+    Args:
+        array     (np.ndarray): The 2D field, e.g. a height map.
+        levels    (Iterable[float]): The values to trace.
+        tolerance (float, optional): Douglas–Peucker tolerance in cells. Defaults to 0 (no simplification).
+    """
+    for level in levels:
+        with GenerationMetrics.time('contour_seconds'):
+            points, offsets, closed = trace(array, level)
+            points, offsets = simplify(points, offsets, tolerance)
+        for index in range(len(closed)):
+            yield Polyline(float(level), points[offsets[index]:offsets[index + 1]], bool(closed[index]))
+
+
+def coastlines(world: World, sea_level: float = 0.0, tolerance: float = 0.5) -> Iterator[Polyline]:
+    """Yields the coastlines of a World: the isolines of its height map at sea level, land on the left."""
+    if world.height_map is None:
+        raise ValueError("Height map has not been initialized.")
+    return isolines(world.height_map, [sea_level], tolerance)
@@ -0,0 +1,95 @@
+from typing import Iterable, Optional, TextIO, Tuple
+import json
+import numpy as np
+
+from .isoline_tracer import Polyline
+
+
+def _coordinates(points: np.ndarray, precision: int) -> str:
+    """Space-separated x y pairs, rounded to `precision` decimals."""
+    return ' '.join(map(str, points.round(precision).ravel().tolist()))
+
+
+def write_svg(
+        polylines: Iterable[Polyline],
+        file: TextIO,
+        shape: Tuple[int, int],
+        stroke: str = "black",
+        stroke_width: float = 1.0,
+        precision: int = 2
+    ) -> int:
+    """
+    Writes polylines as an SVG document, one <path> per polyline as it arrives.
+
+    The view box is the map in cells, so the image lines up with the array it
+    was traced from.
+
+    Args:
+        polylines    (Iterable[Polyline]): The polylines; consumed lazily.
+        file         (TextIO)            : Where to write.
+        shape        (Tuple[int, int])   : (height, width) of the traced map.
+        stroke       (str, optional)     : Line colour. Defaults to "black".
+        stroke_width (float, optional)   : Line width in cells. Defaults to 1.
+        precision    (int, optional)     : Decimals per coordinate. Defaults to 2.
+
+    Returns:
+        int: The number of paths written.
+    """
+    height, width = shape
+    file.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="{width}" height="{height}">\n'
+        f'<g fill="none" stroke="{stroke}" stroke-width="{stroke_width}" stroke-linejoin="round">\n'
+    )
+    count = 0
+    for polyline in polylines:
+        points = polyline.points[:-1] if polyline.closed else polyline.points
+        # Pairs after the first are implicit line-tos
+        file.write(f'<path data-level="{polyline.level:g}" d="M{_coordinates(points, precision)}{" Z" if polyline.closed else ""}"/>\n')
+        count += 1
+    file.write('</g>\n</svg>\n')
+    return count
+
+
+def write_geojson(
+        polylines: Iterable[Polyline],
+        file: TextIO,
+        shape: Optional[Tuple[int, int]] = None,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        precision: int = 6
+    ) -> int:
+    """
+    Writes polylines as a GeoJSON FeatureCollection of LineStrings, one
+    feature per polyline as it arrives, with `level` and `closed` properties.
+
+    Args:
+        polylines (Iterable[Polyline]): The polylines; consumed lazily.
+        file      (TextIO)            : Where to write.
+        shape     (Tuple[int, int], optional): (height, width) of the traced map. Required with `bounds`.
+        bounds    (Tuple[float, float, float, float], optional): (west, south, east, north) covered by the map.
+                                       Without it coordinates are (x, y) in cells, y downwards.
+        precision (int, optional)     : Decimals per coordinate. Defaults to 6.
+
+    Returns:
+        int: The number of features written.
+    """
+    if bounds is not None and shape is None:
+        raise ValueError("shape is required to map cells to bounds")
+    if bounds is not None:
+        west, south, east, north = bounds
+        height, width = shape
+        scale = np.array([(east - west) / width, (south - north) / height])
+        origin = np.array([west, north]) + scale * 0.5  # Cell centres
+
+    file.write('{"type": "FeatureCollection", "features": [')
+    count = 0
+    for polyline in polylines:
+        points = polyline.points if bounds is None else polyline.points * scale + origin
+        feature = {
+            "type": "Feature",
+            "properties": {"level": polyline.level, "closed": polyline.closed},
+            "geometry": {"type": "LineString", "coordinates": points.round(precision).tolist()},
+        }
+        file.write((",\n" if count else "\n") + json.dumps(feature))
+        count += 1
+    file.write('\n]}\n')
+    return count
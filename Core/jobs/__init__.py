@@ -0,0 +1,12 @@
+from .job_manager import JobCancelledError, JobManager, JobQueueFullError
+from .worker import WORKER_PRELOAD, default_start_method, init_worker, worker_context
+
+__all__ = [
+    "JobCancelledError",
+    "JobManager",
+    "JobQueueFullError",
+    "WORKER_PRELOAD",
+    "default_start_method",
+    "init_worker",
+    "worker_context"
+]
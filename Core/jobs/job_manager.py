@@ -0,0 +1,338 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+import os, queue, threading, time, uuid
+
+from Utilities import configAble
+from Core.cache import WorldCache, WorldStore
+from Core.jobs.worker import default_start_method, init_worker, worker_context
+from Core.metrics import GenerationMetrics, maybe_profile, peak_rss_bytes, reset_peak_rss
+from data_models.enums import JobStatus
+from data_models.generation import GenerationSettings
+from data_models.job import Job, JobProgress
+from data_models.world import World
+from factories.world_factory import WorldFactory
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobCancelledError(RuntimeError):
+    """Raised inside a worker to abort a job that was cancelled while running."""
+
+
+# Per-worker stage cache; each pool process has its own memory tier and shares the disk tier.
+_worker_cache: Optional[WorldCache] = None
+
+
+def _get_worker_cache() -> Optional[WorldCache]:
+    global _worker_cache
+    if _worker_cache is None and JobManager.config_manager.get_config('WorldCache.enabled', default=True):
+        _worker_cache = WorldCache()
+    return _worker_cache
+
+
+def _run_generation(
+        job_id: str,
+        settings: GenerationSettings,
+        progress_queue: Any,
+        cancel_flags: Any,
+        store: Optional[WorldStore] = None
+    ) -> Tuple[Optional[World], List[Any]]:
+    """
+    Worker entry point. Generates a World and reports each stage on the progress queue.
+
+    Cancellation is cooperative: the cancel flag is checked before every stage.
+    Metrics recorded in the worker are returned with the World so the parent
+    can publish them. With a store the World is put there under the job id
+    and None is returned in its place.
+    """
+    started = time.monotonic()
+
+    def report(stage: str, index: int, total: int) -> None:
+        if cancel_flags.get(job_id, False):
+            raise JobCancelledError(f"Job {job_id} was cancelled")
+        progress_queue.put((job_id, stage, index, total, time.monotonic() - started))
+
+    GenerationMetrics.start_buffering()
+    reset_peak_rss()
+    with maybe_profile(job_id):
+        world = WorldFactory.create_world(settings, progress=report, cache=_get_worker_cache())
+    GenerationMetrics.observe('job_peak_rss_bytes', peak_rss_bytes())
+    if store is not None:
+        # The parent attaches to the shared copy instead of unpickling the arrays
+        store.put(job_id, world)
+        world = None
+    return world, GenerationMetrics.drain()
+
+
+class JobManager:
+    """
+    Runs world-generation jobs in a bounded process pool.
+
+    Generation is CPU-bound, so it never runs on the caller's thread: jobs are
+    queued on a ProcessPoolExecutor and tracked here. Submission is rejected
+    once `max_queue_depth` jobs are queued or running, or when a job asks for
+    more than `max_cells` cells. Finished jobs are kept until more than
+    `max_finished_jobs` have accumulated, oldest first.
+
+    With a WorldStore (`WorldStore.enabled`) workers publish finished Worlds
+    to it and results are read-only views of the shared copy, which every API
+    worker process can serve without holding its own. At most
+    `max_stored_results` finished jobs are then kept, and a job's World is
+    removed from the store when the job is evicted or the manager shuts down.
+
+    The pool, progress queue and cancel flags are created on first submit. If
+    a worker dies the pool breaks and the jobs in it fail; the next submit
+    starts a new pool.
+    """
+
+    config_manager = configAble.ConfigAble(config_path='config.yaml')
+    log = config_manager.get_logger()
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            max_queue_depth: Optional[int] = None,
+            max_cells: Optional[int] = None,
+            max_finished_jobs: Optional[int] = None,
+            start_method: Optional[str] = None,
+            store: Optional[WorldStore] = None
+        ):
+        get_config = self.config_manager.get_config
+        self.max_workers: int       = max_workers or get_config('JobManager.max_workers', default=os.cpu_count() or 1)
+        self.max_queue_depth: int   = max_queue_depth or get_config('JobManager.max_queue_depth', default=self.max_workers * 4)
+        self.max_cells: int         = max_cells or get_config('JobManager.max_cells', default=4096 * 4096)
+        self.max_finished_jobs: int = max_finished_jobs or get_config('JobManager.max_finished_jobs', default=256)
+        self.start_method: str      = start_method or get_config('JobManager.start_method', default=default_start_method())
+        self.store: Optional[WorldStore] = store or (WorldStore() if get_config('WorldStore.enabled', default=False) else None)
+        self.max_stored_results: int = get_config('WorldStore.max_results', default=32)
+
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._results: Dict[str, World]     = {}
+        self._futures: Dict[str, Future]    = {}
+        self._changed = threading.Condition(threading.Lock())
+        self._closed = False
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._context = None
+        self._manager = None
+        self._progress_queue = None
+        self._cancel_flags = None
+        self._reader: Optional[threading.Thread] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs that are queued or running."""
+        return sum(1 for job in self._jobs.values() if not job.is_finished)
+
+    def _ensure_started(self) -> None:
+        if self._executor is not None:
+            return
+        self._context = worker_context(self.start_method, ['Core.jobs.job_manager'])
+        self._manager = self._context.Manager()
+        self._progress_queue = self._manager.Queue()
+        self._cancel_flags = self._manager.dict()
+        self._executor = self._new_executor()
+        self._reader = threading.Thread(target=self._read_progress, name="JobManager-progress", daemon=True)
+        self._reader.start()
+        self.log.info(f"JobManager started with {self.max_workers} workers ({self.start_method})")
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._context,
+            initializer=init_worker,
+            initargs=(self.config_manager.config, self.config_manager.share_logger())
+        )
+
+    def _restart_executor(self) -> None:
+        """Replaces a pool that broke because a worker died, e.g. when it was killed for using too much memory."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._new_executor()
+        self.log.warning("JobManager process pool was broken by a worker exiting; started a new one")
+
+    def submit(self, settings: GenerationSettings) -> Job:
+        """
+        Queues a generation job.
+
+        Args:
+            settings (GenerationSettings): The generation settings.
+
+        Raises:
+            ValueError       : If the requested world is larger than `max_cells`.
+            JobQueueFullError: If `max_queue_depth` jobs are already queued or running.
+
+        Returns:
+            Job: A snapshot of the queued job.
+        """
+        cells = settings.width * settings.height
+        if cells > self.max_cells:
+            raise ValueError(f"Requested {cells} cells, the limit is {self.max_cells}")
+
+        with self._changed:
+            if self._closed:
+                raise RuntimeError("JobManager has been shut down")
+            if self.queue_depth >= self.max_queue_depth:
+                raise JobQueueFullError(f"Job queue is full ({self.max_queue_depth} jobs queued or running)")
+            self._ensure_started()
+            job = Job(id=uuid.uuid4().hex, settings=settings, created_at=time.time())
+            args = (job.id, settings, self._progress_queue, self._cancel_flags, self.store)
+            try:
+                future = self._executor.submit(_run_generation, *args)
+            except BrokenProcessPool:
+                self._restart_executor()
+                future = self._executor.submit(_run_generation, *args)
+            # Tracked only once queued, so a failed submit never counts towards the queue depth
+            self._jobs[job.id] = job
+            self._futures[job.id] = future
+            snapshot = self._snapshot(job)
+
+        # Outside the lock: the callback runs immediately if the future is already done.
+        future.add_done_callback(lambda done, job_id=job.id: self._on_done(job_id, done))
+        self.log.info(f"Queued job {job.id} ({settings.width}x{settings.height})")
+        return snapshot
+
+    def get_job(self, job_id: str) -> Job:
+        """
+        Returns a snapshot of the job.
+
+        Raises:
+            KeyError: If the job is unknown or has been evicted.
+        """
+        with self._changed:
+            return self._snapshot(self._jobs[job_id])
+
+    def get_result(self, job_id: str) -> Optional[World]:
+        """
+        Returns the generated World, or None if the job has not completed.
+
+        Raises:
+            KeyError: If the job is unknown or has been evicted.
+        """
+        with self._changed:
+            if job_id not in self._jobs:
+                raise KeyError(job_id)
+            return self._results.get(job_id)
+
+    def cancel(self, job_id: str) -> Job:
+        """
+        Cancels a job. Queued jobs are dropped immediately; running jobs stop
+        before their next stage.
+
+        Raises:
+            KeyError: If the job is unknown or has been evicted.
+        """
+        with self._changed:
+            job = self._jobs[job_id]
+            if job.is_finished:
+                return self._snapshot(job)
+            self._cancel_flags[job_id] = True
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()
+        return self.get_job(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """
+        Blocks until the job finishes or the timeout expires.
+
+        Raises:
+            KeyError: If the job is unknown or has been evicted.
+        """
+        with self._changed:
+            job = self._jobs[job_id]
+            self._changed.wait_for(lambda: job.is_finished, timeout)
+            return self._snapshot(job)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancels outstanding jobs and stops the pool and progress reader."""
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            outstanding = list(self._futures)
+        if self._executor is None:
+            return
+        for job_id in outstanding:
+            self._cancel_flags[job_id] = True
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._progress_queue.put(None)
+        self._reader.join(timeout=5)
+        self._manager.shutdown()
+        with self._changed:
+            for job_id in list(self._results):
+                self._discard_result(job_id)
+        self.log.info("JobManager shut down")
+
+    @staticmethod
+    def _snapshot(job: Job) -> Job:
+        return job.model_copy(update={'progress': list(job.progress)})
+
+    def _on_done(self, job_id: str, future: Future) -> None:
+        with self._changed:
+            self._futures.pop(job_id, None)
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.finished_at = time.time()
+            if future.cancelled():
+                job.status = JobStatus.CANCELLED
+            elif isinstance(future.exception(), JobCancelledError):
+                job.status = JobStatus.CANCELLED
+            elif future.exception() is not None:
+                job.status = JobStatus.FAILED
+                job.error = repr(future.exception())
+                self.log.error(f"Job {job_id} failed: {job.error}")
+            else:
+                world, samples = future.result()
+                GenerationMetrics.replay(samples)
+                try:
+                    self._results[job_id] = world if world is not None else self.store.attach(job_id)
+                    job.status = JobStatus.COMPLETED
+                except KeyError:
+                    job.status = JobStatus.FAILED
+                    job.error = "Result was evicted from the WorldStore before it could be attached"
+                    self.log.error(f"Job {job_id} failed: {job.error}")
+            if self._closed:
+                self._discard_result(job_id)  # Finished after shutdown collected the results
+            self._evict_finished()
+            self._changed.notify_all()
+        self.log.info(f"Job {job_id} finished: {job.status.value}")
+
+    def _evict_finished(self) -> None:
+        # Stored Worlds live in shared memory, so fewer of them are kept
+        keep = min(self.max_finished_jobs, self.max_stored_results) if self.store is not None else self.max_finished_jobs
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[:max(0, len(finished) - keep)]:
+            del self._jobs[job_id]
+            self._discard_result(job_id)
+
+    def _discard_result(self, job_id: str) -> None:
+        """Drops a job's World, and removes it from the store unless another process still holds it."""
+        if self._results.pop(job_id, None) is not None and self.store is not None:
+            self.store.release(job_id)
+            self.store.remove(job_id)
+
+    def _read_progress(self) -> None:
+        while True:
+            try:
+                item = self._progress_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            job_id, stage, index, total, elapsed = item
+            with self._changed:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                if job.status == JobStatus.QUEUED:
+                    job.status = JobStatus.RUNNING
+                    job.started_at = time.time() - elapsed
+                job.progress.append(JobProgress(stage=stage, index=index, total=total, elapsed=elapsed))
+                self._changed.notify_all()
@@ -0,0 +1,41 @@
+from typing import Any, Dict, Optional, Sequence
+import multiprocessing as mp
+
+from Utilities import configAble
+
+# Modules a forkserver imports once so that pool workers fork with them already loaded.
+WORKER_PRELOAD = ['Core.jobs.worker', 'factories.world_factory']
+
+
+def default_start_method() -> str:
+    """Returns 'forkserver' where the platform supports it, otherwise 'spawn'."""
+    return 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+
+
+def worker_context(start_method: str, preload: Sequence[str] = ()) -> Any:
+    """
+    Returns the multiprocessing context for a generation pool. Under forkserver
+    the server preloads WORKER_PRELOAD plus the caller's own modules.
+
+    Args:
+        start_method (str)          : A multiprocessing start method.
+        preload      (Sequence[str]): Extra modules holding the pool's task functions.
+
+    Returns:
+        BaseContext: The context to pass as a pool's mp_context.
+    """
+    context = mp.get_context(start_method)
+    if start_method == 'forkserver':
+        context.set_forkserver_preload([*WORKER_PRELOAD, *preload])
+    return context
+
+
+def init_worker(config: Dict[str, Any], logger: Optional[Any]) -> None:
+    """
+    Pool initializer: reuse the parent's configuration instead of re-reading
+    config.yaml, and log through the parent's enqueued sinks. Without a shared
+    logger (`Logger.enqueue` off) the worker configures its own on first use.
+    """
+    config_manager = configAble.ConfigAble()
+    config_manager.config = config
+    config_manager.adopt_logger(logger)
@@ -0,0 +1,9 @@
+from .generation_metrics import GenerationMetrics, peak_rss_bytes, reset_peak_rss
+from .profiling import maybe_profile
+
+__all__ = [
+    "GenerationMetrics",
+    "maybe_profile",
+    "peak_rss_bytes",
+    "reset_peak_rss"
+]
@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import resource, sys, threading, time
+
+# (kind, metric name, labels, value)
+Sample = Tuple[str, str, Dict[str, str], float]
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+THROUGHPUT_BUCKETS = (1e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7, 1e8, 1e9)
+POINT_BUCKETS = (1, 10, 100, 1e3, 1e4, 1e5, 1e6)
+RSS_BUCKETS = tuple(float(2 ** power) for power in range(26, 36))  # 64 MiB .. 32 GiB
+
+
+class GenerationMetrics:
+    """
+    Prometheus metrics for the generation hot paths.
+
+    All metrics live in the default prometheus_client registry and so are
+    served by the Instrumentator's /metrics endpoint. Pool workers cannot write
+    to the API process' registry: they call `start_buffering`, hand the
+    `drain`ed samples back with their result, and the parent `replay`s them.
+
+    prometheus_client is imported and the metrics created on first record (or
+    by `register_all`), so buffering workers never import it.
+    """
+
+    # name -> (kind, prometheus name, documentation, label names, buckets)
+    specs: Dict[str, Tuple[str, str, str, Tuple[str, ...], Optional[Tuple[float, ...]]]] = {
+        'noise_op_seconds'     : ('histogram', 'fmg_noise_op_duration_seconds', 'Duration of NoiseGenerator.execute_op', ('op',), DURATION_BUCKETS),
+        'stage_seconds'        : ('histogram', 'fmg_stage_duration_seconds', 'Duration of a World generation stage', ('stage', 'cached'), DURATION_BUCKETS),
+        'stage_update_seconds' : ('histogram', 'fmg_stage_update_duration_seconds', 'Duration of a partial stage update after an edit', ('stage',), DURATION_BUCKETS),
+        'generation_seconds'   : ('histogram', 'fmg_generation_duration_seconds', 'Duration of WorldFactory.create_world', (), DURATION_BUCKETS),
+        'serialization_seconds': ('histogram', 'fmg_serialization_duration_seconds', 'Duration of Utils.serialize_model_to_dict', ('mode',), DURATION_BUCKETS),
+        'cells_per_second'     : ('histogram', 'fmg_generation_cells_per_second', 'World cells generated per second', (), THROUGHPUT_BUCKETS),
+        'job_peak_rss_bytes'   : ('histogram', 'fmg_job_peak_rss_bytes', 'Peak resident set size of a generation job', (), RSS_BUCKETS),
+        'sample_seconds'       : ('histogram', 'fmg_sample_duration_seconds', 'Duration of a batch point-sampling request', (), DURATION_BUCKETS),
+        'sampled_points'       : ('histogram', 'fmg_sampled_points', 'Points per batch point-sampling request', (), POINT_BUCKETS),
+        'contour_seconds'      : ('histogram', 'fmg_contour_duration_seconds', 'Duration of tracing and simplifying one isoline level', (), DURATION_BUCKETS),
+        'cache_requests'       : ('counter', 'fmg_cache_requests', 'WorldCache lookups by tier and result', ('tier', 'result'), None),
+    }
+
+    _metrics: Dict[str, Any] = {}
+    _metrics_lock = threading.Lock()
+    _buffer: Optional[List[Sample]] = None
+
+    @classmethod
+    def register_all(cls) -> None:
+        """Creates every metric up front so /metrics lists them before the first job."""
+        for name in cls.specs:
+            cls._metric(name)
+
+    @classmethod
+    def _metric(cls, name: str) -> Any:
+        metric = cls._metrics.get(name)
+        if metric is None:
+            with cls._metrics_lock:
+                metric = cls._metrics.get(name)
+                if metric is None:
+                    from prometheus_client import Counter, Histogram
+                    kind, metric_name, documentation, labels, buckets = cls.specs[name]
+                    if kind == 'histogram':
+                        metric = Histogram(metric_name, documentation, labels, buckets=buckets)
+                    else:
+                        metric = Counter(metric_name, documentation, labels)
+                    cls._metrics[name] = metric
+        return metric
+
+    @classmethod
+    def observe(cls, name: str, value: float, **labels: str) -> None:
+        """Records a histogram observation."""
+        cls._record('histogram', name, labels, value)
+
+    @classmethod
+    def inc(cls, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Increments a counter."""
+        cls._record('counter', name, labels, amount)
+
+    @classmethod
+    @contextmanager
+    def time(cls, name: str, **labels: str) -> Iterator[None]:
+        """Observes the wall-clock duration of the block into a histogram."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.observe(name, time.perf_counter() - started, **labels)
+
+    @classmethod
+    def start_buffering(cls) -> None:
+        """Buffers samples in this process instead of recording them."""
+        cls._buffer = []
+
+    @classmethod
+    def drain(cls) -> List[Sample]:
+        """Stops buffering and returns the buffered samples."""
+        samples, cls._buffer = cls._buffer or [], None
+        return samples
+
+    @classmethod
+    def replay(cls, samples: List[Sample]) -> None:
+        """Records samples buffered by another process."""
+        for kind, name, labels, value in samples:
+            cls._apply(kind, name, labels, value)
+
+    @classmethod
+    def _record(cls, kind: str, name: str, labels: Dict[str, str], value: float) -> None:
+        if cls._buffer is not None:
+            cls._buffer.append((kind, name, labels, value))
+        else:
+            cls._apply(kind, name, labels, value)
+
+    @classmethod
+    def _apply(cls, kind: str, name: str, labels: Dict[str, str], value: float) -> None:
+        metric = cls._metric(name)
+        if labels:
+            metric = metric.labels(**labels)
+        if kind == 'histogram':
+            metric.observe(value)
+        else:
+            metric.inc(value)
+
+
+def reset_peak_rss() -> None:
+    """Resets the process' peak RSS (VmHWM) so the next reading covers only what follows. Linux only."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as file:
+            file.write('5')
+    except OSError:
+        pass
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process in bytes, since the last `reset_peak_rss` where supported."""
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
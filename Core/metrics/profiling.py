@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+import random
+
+from Utilities import configAble
+
+config_manager = configAble.ConfigAble(config_path='config.yaml')
+log = config_manager.get_logger()
+
+
+@contextmanager
+def maybe_profile(job_id: str) -> Iterator[bool]:
+    """
+    Profiles the block for a sampled fraction of jobs.
+
+    Controlled by the Metrics section of config.yaml:
+        profile_sample_rate (float): Fraction of jobs to profile, 0 disables. Defaults to 0.
+        profile_dir         (str)  : Where `<job_id>.prof` (cProfile) and
+                                     `<job_id>.tracemalloc.txt` are written. Defaults to "Logs/profiles".
+        tracemalloc         (bool) : Also capture the top allocation sites. Defaults to False.
+
+    Yields:
+        bool: Whether this job is being profiled.
+    """
+    sample_rate = float(config_manager.get_config('Metrics.profile_sample_rate', default=0.0))
+    if sample_rate <= 0 or random.random() >= sample_rate:
+        yield False
+        return
+
+    profile_dir = Path(config_manager.get_config('Metrics.profile_dir', default='Logs/profiles'))
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    trace_memory = bool(config_manager.get_config('Metrics.tracemalloc', default=False))
+    import cProfile, tracemalloc
+
+    profiler = cProfile.Profile()
+    if trace_memory:
+        tracemalloc.start()
+    profiler.enable()
+    try:
+        yield True
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_dir / f"{job_id}.prof")
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            with open(profile_dir / f"{job_id}.tracemalloc.txt", 'w') as file:
+                for stat in snapshot.statistics('lineno')[:50]:
+                    file.write(f"{stat}\n")
+        log.info(f"Profiled job {job_id} into {profile_dir}")
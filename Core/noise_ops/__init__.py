@@ -0,0 +1,16 @@
+from .noise_generator import NoiseGenerator
+from .fbm import fbm_noise
+from .erosion import thermal_erosion, hydraulic_erosion
+from .tiling import apply_tiled
+
+NoiseGenerator.register_op("fbm", fbm_noise)
+NoiseGenerator.register_op("thermal_erosion", thermal_erosion)
+NoiseGenerator.register_op("hydraulic_erosion", hydraulic_erosion)
+
+__all__ = [
+    "NoiseGenerator",
+    "fbm_noise",
+    "thermal_erosion",
+    "hydraulic_erosion",
+    "apply_tiled"
+]
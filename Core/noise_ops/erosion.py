@@ -0,0 +1,240 @@
+from typing import Any, Dict, Optional
+import os, time
+import numpy as np
+
+from .noise_generator import NoiseGenerator
+from .tiling import apply_tiled, iter_tiles
+
+
+def _float32_buffer(map_data: np.ndarray) -> np.ndarray:
+    """Returns `map_data` itself when it can be eroded in place, otherwise a writable float32 copy."""
+    if map_data.dtype == np.float32 and map_data.flags.writeable and map_data.flags.c_contiguous:
+        return map_data
+    return np.array(map_data, dtype=np.float32, order='C')
+
+
+def _out_of_time(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.perf_counter() >= deadline
+
+
+def _tiled_iterations(op, map_data: np.ndarray, settings: Dict[str, Any], iterations: int, tile_size: int, workers: int, time_budget: float, **kwargs) -> int:
+    """
+    Largest number of iterations, up to `iterations`, that every tile can run
+    within `time_budget`. One iteration is timed on a small and a large tile
+    to split its cost into a fixed part and a part per cell; a candidate count
+    then costs its iterations over the largest tile its own halo gives, with
+    tiles run `workers` at a time, or one per CPU if there are fewer CPUs.
+    """
+    deadline = time.perf_counter() + time_budget
+    parallel = max(min(workers, os.cpu_count() or 1), 1)
+    one_iteration = {**settings, 'iterations': 1, 'time_budget': None, 'tile_size': 0}
+    timings = []
+    for halo in (1, 2 * tile_size):
+        _, padded, _ = next(iter_tiles(map_data.shape, tile_size, halo))
+        sample = map_data[padded]
+        best = float('inf')
+        for _ in range(2):  # The first call also warms up allocations
+            started = time.perf_counter()
+            op(np.array(sample, dtype=np.float32), one_iteration, **kwargs)
+            best = min(best, time.perf_counter() - started)
+        timings.append((sample.size, best))
+    (small, small_seconds), (large, large_seconds) = timings
+    cell_seconds = max((large_seconds - small_seconds) / (large - small), 0.0) if large > small else 0.0
+    fixed_seconds = max(small_seconds - cell_seconds * small, 1e-9)
+
+    def seconds(count: int) -> float:
+        tiles = list(iter_tiles(map_data.shape, tile_size, int(settings.get('halo', count + 1))))
+        largest = max((rows.stop - rows.start) * (columns.stop - columns.start) for _, (rows, columns), _ in tiles)
+        return count * (fixed_seconds + cell_seconds * largest) * -(-len(tiles) // parallel)
+
+    remaining = deadline - time.perf_counter()
+    low, high = 0, iterations
+    while low < high:
+        middle = (low + high + 1) // 2
+        if seconds(middle) <= remaining:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _maybe_tiled(op, map_data: np.ndarray, settings: Dict[str, Any], iterations: int, **kwargs) -> Optional[np.ndarray]:
+    """
+    Dispatches to `apply_tiled` when `tile_size` is set. The default halo of
+    iterations + 1 cells makes the tiled result match the untiled one.
+
+    A `time_budget` is turned into one iteration count for all tiles before
+    they start: tiles stopping at different iterations would leave seams.
+    """
+    tile_size = int(settings.get('tile_size', 0))
+    if tile_size <= 0 or (tile_size >= map_data.shape[0] and tile_size >= map_data.shape[1]):
+        return None
+    workers = int(settings.get('workers') or NoiseGenerator.num_processes)
+    time_budget = settings.get('time_budget')
+    if time_budget is not None:
+        iterations = _tiled_iterations(op, map_data, settings, iterations, tile_size, workers, float(time_budget), **kwargs)
+        settings = {**settings, 'iterations': iterations, 'time_budget': None}
+    halo = int(settings.get('halo', iterations + 1))
+    return apply_tiled(op, _float32_buffer(map_data), settings, tile_size, halo, max_workers=workers, **kwargs)
+
+
+def thermal_erosion(map_data: np.ndarray, settings: Optional[Dict[str, Any]] = None, **kwargs) -> np.ndarray:
+    """
+    Thermal (talus) erosion: material slides from a cell to each 4-neighbour
+    whose height difference exceeds the talus threshold.
+
+    Each iteration is a handful of whole-array operations on the horizontal
+    and vertical neighbour pairs, written into preallocated buffers. Every
+    pair moves the same amount out of one cell and into the other, so total
+    height is conserved.
+
+    Args:
+        map_data (np.ndarray): The 2D map to erode. Eroded in place when it is a writable float32 array.
+        settings (Dict[str, Any], optional):
+            iterations  (int)  : Number of iterations. Defaults to 50.
+            talus       (float): Height difference between neighbours that is stable. Defaults to 0.004.
+            rate        (float): Fraction (0-1] of the excess moved per iteration. Defaults to 0.5.
+            time_budget (float): Seconds after which remaining iterations are skipped. Defaults to no limit.
+            tile_size   (int)  : Process in tiles of this many cells on the thread pool. Defaults to 0 (off).
+            halo        (int)  : Overlap between tiles. Defaults to iterations + 1.
+            workers     (int)  : Threads for tiled runs. Defaults to NoiseGenerator.num_processes.
+
+    Returns:
+        np.ndarray: The eroded float32 map.
+    """
+    settings = settings or {}
+    iterations  = int(settings.get('iterations', 50))
+    talus       = np.float32(settings.get('talus', 0.004))
+    rate        = float(settings.get('rate', 0.5))
+    time_budget = settings.get('time_budget')
+
+    tiled = _maybe_tiled(thermal_erosion, map_data, settings, iterations, **kwargs)
+    if tiled is not None:
+        return tiled
+
+    height = _float32_buffer(map_data)
+    rows, cols = height.shape
+    # A cell takes part in up to four pairs; moving 1/8 of each pair's excess keeps the step stable
+    factor = np.float32(min(max(rate, 0.0), 1.0) / 8.0)
+    dx, cx = np.empty((rows, cols - 1), np.float32), np.empty((rows, cols - 1), np.float32)
+    dy, cy = np.empty((rows - 1, cols), np.float32), np.empty((rows - 1, cols), np.float32)
+    deadline = None if time_budget is None else time.perf_counter() + float(time_budget)
+
+    for _ in range(iterations):
+        if _out_of_time(deadline):
+            break
+        # Excess over the talus, signed towards the lower cell: d - clip(d, -talus, talus)
+        np.subtract(height[:, :-1], height[:, 1:], out=dx)
+        np.clip(dx, -talus, talus, out=cx)
+        dx -= cx
+        dx *= factor
+        np.subtract(height[:-1], height[1:], out=dy)
+        np.clip(dy, -talus, talus, out=cy)
+        dy -= cy
+        dy *= factor
+
+        height[:, :-1] -= dx
+        height[:, 1:] += dx
+        height[:-1] -= dy
+        height[1:] += dy
+    return height
+
+
+def hydraulic_erosion(map_data: np.ndarray, settings: Optional[Dict[str, Any]] = None, **kwargs) -> np.ndarray:
+    """
+    Grid-based hydraulic erosion: every cell holds water and suspended
+    sediment instead of simulating individual droplets.
+
+    Each iteration rains on the whole map, moves water (and the sediment it
+    carries) to lower 4-neighbours in proportion to the drop in water
+    surface, erodes or deposits towards the water's carrying capacity, and
+    evaporates. Sediment still suspended at the end is deposited where it is.
+
+    Args:
+        map_data (np.ndarray): The 2D map to erode. Eroded in place when it is a writable float32 array.
+        settings (Dict[str, Any], optional):
+            iterations  (int)  : Number of iterations. Defaults to 100.
+            rain        (float): Water added to every cell per iteration. Defaults to 0.01.
+            evaporation (float): Fraction of water that evaporates per iteration. Defaults to 0.05.
+            capacity    (float): Sediment carried per unit of water flow. Defaults to 0.3.
+            erosion     (float): Fraction of unused capacity picked up per iteration. Defaults to 0.1.
+            deposition  (float): Fraction of excess sediment dropped per iteration. Defaults to 0.2.
+            time_budget (float): Seconds after which remaining iterations are skipped. Defaults to no limit.
+            tile_size   (int)  : Process in tiles of this many cells on the thread pool. Defaults to 0 (off).
+            halo        (int)  : Overlap between tiles. Defaults to iterations + 1.
+            workers     (int)  : Threads for tiled runs. Defaults to NoiseGenerator.num_processes.
+
+    Returns:
+        np.ndarray: The eroded float32 map.
+    """
+    settings = settings or {}
+    iterations  = int(settings.get('iterations', 100))
+    rain        = np.float32(settings.get('rain', 0.01))
+    evaporation = np.float32(1.0 - float(settings.get('evaporation', 0.05)))
+    capacity    = np.float32(settings.get('capacity', 0.3))
+    erosion     = np.float32(settings.get('erosion', 0.1))
+    deposition  = np.float32(settings.get('deposition', 0.2))
+    time_budget = settings.get('time_budget')
+
+    tiled = _maybe_tiled(hydraulic_erosion, map_data, settings, iterations, **kwargs)
+    if tiled is not None:
+        return tiled
+
+    height = _float32_buffer(map_data)
+    shape = height.shape
+    water    = np.zeros(shape, np.float32)
+    sediment = np.zeros(shape, np.float32)
+    surface  = np.empty(shape, np.float32)
+    total    = np.empty(shape, np.float32)
+    scale    = np.empty(shape, np.float32)
+    change   = np.empty(shape, np.float32)
+    # Outflow towards each neighbour; the last row/column towards the edge stays zero
+    east, west   = np.zeros(shape, np.float32), np.zeros(shape, np.float32)
+    south, north = np.zeros(shape, np.float32), np.zeros(shape, np.float32)
+    flows = (east, west, south, north)
+    sources = ((slice(None), slice(None, -1)), (slice(None), slice(1, None)), (slice(None, -1), slice(None)), (slice(1, None), slice(None)))
+    targets = (sources[1], sources[0], sources[3], sources[2])
+    deadline = None if time_budget is None else time.perf_counter() + float(time_budget)
+
+    for _ in range(iterations):
+        if _out_of_time(deadline):
+            break
+        water += rain
+        np.add(height, water, out=surface)
+
+        # A quarter of the surface drop towards each lower neighbour, limited to the water available
+        for flow, source, target in zip(flows, sources, targets):
+            np.subtract(surface[source], surface[target], out=flow[source])
+            np.maximum(flow[source], 0.0, out=flow[source])
+            flow[source] *= np.float32(0.25)
+        np.add(east, west, out=total)
+        total += south
+        total += north
+        np.divide(water, total, out=scale, where=total > water)
+        np.copyto(scale, 1.0, where=total <= water)
+
+        # Sediment leaves with the same fraction of the cell's water
+        np.divide(sediment, water, out=change, where=water > 0)
+        np.copyto(change, 0.0, where=water <= 0)
+        for flow in flows:
+            flow *= scale
+        total *= scale
+        water -= total
+        np.multiply(total, change, out=surface)
+        sediment -= surface
+        for flow, source, target in zip(flows, sources, targets):
+            water[target] += flow[source]
+            np.multiply(flow[source], change[source], out=surface[source])
+            sediment[target] += surface[source]
+
+        # Erode where the flow could carry more, deposit where it carries too much
+        np.multiply(total, capacity, out=change)
+        change -= sediment
+        np.multiply(change, np.where(change > 0, erosion, deposition), out=change)
+        height -= change
+        sediment += change
+        np.maximum(sediment, 0.0, out=sediment)
+        water *= evaporation
+
+    height += sediment
+    return height
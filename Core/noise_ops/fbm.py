@@ -0,0 +1,92 @@
+from typing import Any, Dict, Optional
+import numpy as np
+
+
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _value_noise(
+        shape: tuple,
+        cell_size: float,
+        rng: np.random.Generator,
+        origin: tuple = (0, 0),
+        full_shape: Optional[tuple] = None
+    ) -> np.ndarray:
+    """
+    Generates a single octave of value noise in the range [-1, 1].
+
+    Random values are placed on a lattice with `cell_size` pixel spacing and
+    interpolated with smoothstep weights. The interpolation is separable: the
+    lattice rows are first interpolated across the map width, then whole rows
+    are blended down the height, so the full-size work is two row gathers.
+
+    With `full_shape`, the result is the window of shape `shape` at `origin`
+    of the octave for a map of `full_shape`; the lattice is drawn for the
+    full map, so the window matches the full octave exactly.
+    """
+    height, width = shape
+    full_height, full_width = full_shape or shape
+    cell_size = max(float(cell_size), 1.0)
+    lattice = rng.random((int(full_height / cell_size) + 2, int(full_width / cell_size) + 2), dtype=np.float32) * 2.0 - 1.0
+
+    y = np.arange(origin[0], origin[0] + height, dtype=np.float32) / cell_size
+    x = np.arange(origin[1], origin[1] + width, dtype=np.float32) / cell_size
+    y0 = y.astype(np.intp)
+    x0 = x.astype(np.intp)
+    fy = _smoothstep(y - y0.astype(np.float32))[:, None]
+    fx = _smoothstep(x - x0.astype(np.float32))[None, :]
+
+    # Only the lattice rows the window touches
+    first = int(y0[0])
+    lattice = lattice[first:int(y0[-1]) + 2]
+    y0 -= first
+
+    rows = lattice[:, x0] * (1.0 - fx) + lattice[:, x0 + 1] * fx
+    octave = rows[y0] * (1.0 - fy)
+    octave += rows[y0 + 1] * fy
+    return octave
+
+
+def fbm_noise(map_data: np.ndarray, settings: Optional[Dict[str, Any]] = None, **kwargs) -> np.ndarray:
+    """
+    Adds fractal Brownian motion (summed octaves of value noise) to the map.
+
+    Args:
+        map_data (np.ndarray): The 2D map to transform.
+        settings (Dict[str, Any], optional):
+            scale       (float): Feature size of the first octave in cells. Defaults to 100.0.
+            amplitude   (float): Peak amplitude of the summed noise. Defaults to 1.0.
+            octaves     (int)  : Number of octaves. Defaults to 6.
+            persistence (float): Amplitude multiplier between octaves. Defaults to 0.5.
+            lacunarity  (float): Frequency multiplier between octaves. Defaults to 2.0.
+            seed        (int)  : Seed for the noise lattice. Overrides the `seed` kwarg.
+        origin     (Tuple[int, int], optional): With `full_shape`, the (row, column) of `map_data` in the full map.
+        full_shape (Tuple[int, int], optional): Shape of the full map when `map_data` is a window of it.
+                                                The window gets the same noise as the full map would.
+
+    Returns:
+        np.ndarray: float32 map with the noise added, normalized to [-amplitude, amplitude].
+    """
+    settings = settings or {}
+    scale       = float(settings.get('scale', 100.0))
+    amplitude   = float(settings.get('amplitude', 1.0))
+    octaves     = int(settings.get('octaves', 6))
+    persistence = float(settings.get('persistence', 0.5))
+    lacunarity  = float(settings.get('lacunarity', 2.0))
+    rng = np.random.default_rng(settings.get('seed', kwargs.get('seed')))
+    origin     = tuple(kwargs.get('origin', (0, 0)))
+    full_shape = kwargs.get('full_shape')
+
+    noise = np.zeros(map_data.shape, dtype=np.float32)
+    weight, total = 1.0, 0.0
+    for octave in range(octaves):
+        layer = _value_noise(map_data.shape, scale / (lacunarity ** octave), rng, origin, full_shape)
+        layer *= np.float32(weight)
+        noise += layer
+        total += weight
+        weight *= persistence
+
+    if total > 0:
+        noise *= np.float32(amplitude / total)
+    return map_data.astype(np.float32, copy=False) + noise
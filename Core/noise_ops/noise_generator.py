@@ -2,6 +2,7 @@ from typing import List, Dict, Any, Type
 import numpy as np
 
 from Utilities import configAble
+from Core.metrics.generation_metrics import GenerationMetrics
 
 class NoiseGenerator:
     """
@@ -10,9 +11,10 @@ class NoiseGenerator:
     
     config_manager = configAble.ConfigAble(config_path='config.yaml')
     log = config_manager.get_logger()
+    hot_log = config_manager.get_rate_limited_logger(name='NoiseGenerator')
     
     noise_ops: Dict[str, Type[callable]] = {}
-    num_processes: int = config_manager.get_config('NoiseGenerator.num_processes', default=1)
+    num_processes: int = configAble.ConfigValue('NoiseGenerator.num_processes', default=1)
     
     @classmethod
     def register_op(cls, name: str, op: Type[callable]):
@@ -69,7 +71,8 @@ class NoiseGenerator:
             cls.log.error(f"Unknown noise operation: {op}")
             raise ValueError(f"Unknown noise operation: {op}")
         
-        cls.log.info(f"Executing noise operation: {op}")
-        return cls.noise_ops[op](map_data, settings, **kwargs)
+        cls.hot_log.bind(op).info("Executing noise operation: {}", op)
+        with GenerationMetrics.time('noise_op_seconds', op=op):
+            return cls.noise_ops[op](map_data, settings, **kwargs)
     
     
\ No newline at end of file
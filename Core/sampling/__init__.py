@@ -0,0 +1,13 @@
+from .point_sampler import (
+    CATEGORICAL_LAYERS, CONTINUOUS_LAYERS, SAMPLEABLE_LAYERS, bilinear, decode_points, nearest, sample_world
+)
+
+__all__ = [
+    "CATEGORICAL_LAYERS",
+    "CONTINUOUS_LAYERS",
+    "SAMPLEABLE_LAYERS",
+    "bilinear",
+    "decode_points",
+    "nearest",
+    "sample_world"
+]
@@ -0,0 +1,119 @@
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+
+from Core.metrics import GenerationMetrics
+from data_models.world import World
+
+# Layers interpolated between cell centres; every other layer is sampled at the nearest cell
+CONTINUOUS_LAYERS = ('height_map', 'temperature_map', 'moisture_map')
+CATEGORICAL_LAYERS = ('land_mask', 'biome_map')
+SAMPLEABLE_LAYERS = CONTINUOUS_LAYERS + CATEGORICAL_LAYERS
+
+
+def decode_points(data: bytes) -> np.ndarray:
+    """
+    Decodes a binary coordinate array: little-endian float32 (x, y) pairs.
+
+    Raises:
+        ValueError: If the data is not a whole number of pairs.
+    """
+    if len(data) % 8:
+        raise ValueError(f"Binary points must be float32 (x, y) pairs; got {len(data)} bytes")
+    return np.frombuffer(data, dtype='<f4').reshape(-1, 2)
+
+
+class _Lookup:
+    """
+    Flat cell indices and weights for a batch of points, computed once and
+    shared by every layer of the same shape.
+    """
+
+    def __init__(self, shape: Tuple[int, int], x: np.ndarray, y: np.ndarray):
+        rows, cols = shape
+        x = np.clip(x, 0, cols - 1)
+        y = np.clip(y, 0, rows - 1)
+        self.nearest = np.rint(y).astype(np.intp) * cols + np.rint(x).astype(np.intp)
+
+        x0 = np.minimum(x.astype(np.intp), max(cols - 2, 0))
+        y0 = np.minimum(y.astype(np.intp), max(rows - 2, 0))
+        step_x = 1 if cols > 1 else 0
+        step_y = cols if rows > 1 else 0
+        self.corner = y0 * cols + x0
+        self.steps = (step_x, step_y)
+        self.fx = (x - x0).astype(np.float32)
+        self.fy = (y - y0).astype(np.float32)
+
+    def nearest_values(self, layer: np.ndarray) -> np.ndarray:
+        return layer.ravel().take(self.nearest)
+
+    def bilinear_values(self, layer: np.ndarray) -> np.ndarray:
+        flat = layer.ravel()
+        step_x, step_y = self.steps
+        top_left = flat.take(self.corner)
+        top = top_left + (flat.take(self.corner + step_x) - top_left) * self.fx
+        bottom_left = flat.take(self.corner + step_y)
+        bottom = bottom_left + (flat.take(self.corner + step_y + step_x) - bottom_left) * self.fx
+        return top + (bottom - top) * self.fy
+
+
+def nearest(layer: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Values of the cells containing each point. Points outside the map take the nearest edge cell."""
+    return _Lookup(layer.shape, x, y).nearest_values(layer)
+
+
+def bilinear(layer: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Bilinear interpolation between the four cell centres around each point.
+    Points outside the map are clamped to its edge.
+    """
+    return _Lookup(layer.shape, x, y).bilinear_values(layer)
+
+
+def sample_world(
+        world: World,
+        points: np.ndarray,
+        layers: Optional[Sequence[str]] = None,
+        interpolate: bool = True
+    ) -> Dict[str, np.ndarray]:
+    """
+    Samples World layers at many points at once.
+
+    Points are (x, y) in cell units: cell (row, column) has its centre at
+    x = column, y = row. Each layer is one vectorized gather over all points.
+
+    Args:
+        world       (World)                   : The world to sample.
+        points      (np.ndarray)              : Array of shape (N, 2) with (x, y) per point.
+        layers      (Sequence[str], optional) : Layers to sample. Defaults to every generated layer.
+        interpolate (bool)                    : Interpolate continuous layers bilinearly instead of
+                                                taking the nearest cell. Defaults to True.
+
+    Returns:
+        Dict[str, np.ndarray]: Values per layer, one per point.
+
+    Raises:
+        ValueError: If points are not (N, 2) or not finite, or a layer is unknown or not generated.
+    """
+    points = np.asarray(points, dtype=np.float32)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"Points must have shape (N, 2); got {points.shape}")
+    if not np.isfinite(points).all():
+        raise ValueError("Points must be finite")
+    if layers is None:
+        layers = [layer for layer in SAMPLEABLE_LAYERS if getattr(world, layer) is not None]
+
+    samples = {}
+    with GenerationMetrics.time('sample_seconds'):
+        lookup = _Lookup((world.height, world.width), points[:, 0], points[:, 1])
+        for layer in layers:
+            if layer not in SAMPLEABLE_LAYERS:
+                raise ValueError(f"Unknown layer: {layer}. Expected one of {', '.join(SAMPLEABLE_LAYERS)}")
+            values = getattr(world, layer)
+            if values is None:
+                raise ValueError(f"Layer {layer} has not been generated")
+            if interpolate and layer in CONTINUOUS_LAYERS:
+                samples[layer] = lookup.bilinear_values(values)
+            else:
+                samples[layer] = lookup.nearest_values(values)
+    GenerationMetrics.observe('sampled_points', len(points))
+    return samples
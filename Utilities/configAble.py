@@ -1,10 +1,138 @@
-from datetime import datetime
-from pytz import timezone
-from typing import Any, Dict, Optional
-from loguru import logger
-import yaml, os, sys, threading
+from typing import Any, Dict, Optional, Tuple
+import os, sys, threading, time
+
+# loguru, yaml, pytz and multiprocessing are imported on first use so that importing a module
+# that holds a ConfigAble stays cheap and has no side effects.
+
+
+class _LazyLogger:
+    """Stands in for the loguru logger and configures it on first use."""
+
+    __slots__ = ('_owner', '_target')
+
+    def __init__(self, owner: 'ConfigAble'):
+        self._owner = owner
+        self._target = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._target is None:
+            self._target = self._owner._get_configured_logger()
+        return getattr(self._target, name)
+
+
+class _TimestampPatcher:
+    """
+    Loguru patcher that adds the formatted local time as `extra[timestamp]`.
+
+    The string is only re-rendered when the wall-clock second changes. A
+    module-level class rather than a lambda so the configured logger can be
+    pickled and handed to worker processes.
+    """
+
+    def __init__(self, tz: Any, time_format: str):
+        self.tz = tz
+        self.time_format = time_format
+        self._cached: Tuple[int, str] = (-1, '')
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        second = int(record['time'].timestamp())
+        cached_second, text = self._cached
+        if second != cached_second:
+            from datetime import datetime
+            text = datetime.fromtimestamp(second, self.tz).strftime(self.time_format)
+            self._cached = (second, text)
+        record['extra']['timestamp'] = text
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'tz': self.tz, 'time_format': self.time_format, '_cached': (-1, '')}
+
+
+class RateLimitedLogger:
+    """
+    Wraps a logger for hot paths: each message template is emitted at most
+    once per `interval` seconds, and the next emitted record reports how many
+    were suppressed. Suppressed calls never format their arguments.
+
+    Templates are limited per logger `name` and per bound operation, so
+    callers sharing a format string do not suppress each other.
+
+    Usage:
+        hot_log.bind(op).info("Executing noise operation: {}", op)
+    """
+
+    def __init__(self, log: Any, interval: Optional[float] = None, name: Optional[str] = None):
+        self.log = log
+        self.name = name
+        self.operation: Optional[str] = None
+        self._interval = interval
+        self._last: Dict[Tuple[Optional[str], Optional[str], str, str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self._bound: Dict[str, 'RateLimitedLogger'] = {}
+
+    @property
+    def interval(self) -> float:
+        """Seconds between records per template. Defaults to Logger.hot_path_interval, read on first use."""
+        if self._interval is None:
+            self._interval = float(ConfigAble().get_config('Logger.hot_path_interval', default=1.0))
+        return self._interval
+
+    def bind(self, operation: str) -> 'RateLimitedLogger':
+        """Returns a view of this logger whose messages are limited separately for `operation`."""
+        bound = self._bound.get(operation)
+        if bound is None:
+            bound = RateLimitedLogger(self.log, self._interval, self.name)
+            bound.operation = operation
+            # Views share one record of what was emitted, under one lock
+            bound._last, bound._lock, bound._bound = self._last, self._lock, self._bound
+            self._bound[operation] = bound
+        return bound
+
+    def _emit(self, level: str, message: str, *args: Any, **kwargs: Any) -> None:
+        key = (self.name, self.operation, level, message)
+        now = time.monotonic()
+        with self._lock:
+            last_emitted, suppressed = self._last.get(key, (float('-inf'), 0))
+            if now - last_emitted < self.interval:
+                self._last[key] = (last_emitted, suppressed + 1)
+                return
+            self._last[key] = (now, 0)
+        if suppressed:
+            message = f"{message} ({suppressed} similar suppressed)"
+        self.log.opt(depth=2).log(level, message, *args, **kwargs)
+
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._emit('DEBUG', message, *args, **kwargs)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._emit('INFO', message, *args, **kwargs)
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._emit('WARNING', message, *args, **kwargs)
+
+
+class ConfigValue:
+    """
+    Class attribute backed by a configuration option, read on access.
+
+    Lets classes declare configured attributes without loading the
+    configuration at class-definition time.
+    """
+
+    def __init__(self, section: str, default: Optional[Any] = None):
+        self.section = section
+        self.default = default
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        return ConfigAble().get_config(self.section, default=self.default)
+
 
 class ConfigAble:
+    """
+    Thread-safe singleton holding the YAML configuration and the shared logger.
+
+    Construction is free of I/O: the configuration is read on first access to
+    `config` and the logger is configured the first time it is used.
+    """
     
     _instance = None
     _lock = threading.Lock() # Thread-safe singleton
@@ -18,7 +146,10 @@ class ConfigAble:
             'retention': '30 days',
             'compression': None,
             'timezone': 'UTC',
-            'clock_style': '12'
+            'clock_style': '12',
+            'enqueue': True,
+            'module_levels': {},
+            'hot_path_interval': 1.0
         }
     }
     
@@ -35,12 +166,30 @@ class ConfigAble:
             self.config_path = config_path
             if self.config_path is None:
                 self.config_path = self.DEFAULT_CONFIG_PATH
-            self.config: Dict[str, Any] = self.load_config()
-            self._configure_logger()
-            
+            self._config: Optional[Dict[str, Any]] = None
+            self._logger_configured = False
+            self._loguru: Any = None
+            self._setup_lock = threading.RLock()
+            self._logger = _LazyLogger(self)
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The loaded configuration, read from `config_path` on first access."""
+        if self._config is None:
+            with self._setup_lock:
+                if self._config is None:
+                    self._config = self.load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        """Installs an already-loaded configuration, e.g. one handed to a pool worker by its parent."""
+        self._config = value
 
     def load_config(self) -> Dict[str, Any]:
+        import yaml
         if not os.path.exists(self.config_path) or os.stat(self.config_path).st_size == 0:
+            from loguru import logger
             logger.warning(f"Configuration file not found or empty at {self.config_path}. Generating default configuration.")
             self._generate_default_config()
             return self.DEFAULT_CONFIG
@@ -49,17 +198,22 @@ class ConfigAble:
                 config = yaml.safe_load(file) or {}
                 return {**self.DEFAULT_CONFIG, **config} # Merge default and user configuration
         except FileNotFoundError:
+            from loguru import logger
             logger.warning(f"Configuration file not found at {self.config_path}. Using default settings.")
             return {}
         except yaml.YAMLError as e:
+            from loguru import logger
             logger.error(f"Error parsing YAML configuration: {e}")
             return self.DEFAULT_CONFIG
         except Exception as e:
+            from loguru import logger
             logger.error(f"Unexpected error loading configuration: {e}")
             return self.DEFAULT_CONFIG
 
     def _generate_default_config(self) -> None:
             """Generates a default configuration file."""
+            import yaml
+            from loguru import logger
             try:
                 with open(self.config_path, 'w') as file:
                     yaml.dump(self.DEFAULT_CONFIG, file, default_flow_style=False)
@@ -68,7 +222,18 @@ class ConfigAble:
                 logger.error(f"Failed to write default configuration to {self.config_path}: {e}")
 
     def _configure_logger(self) -> None:
-        """ Configures the Loguru logger based on the loaded configuration."""
+        """
+        Configures the Loguru logger based on the loaded configuration.
+
+        With `enqueue` (the default) records are handed to a background thread
+        through a multiprocessing queue, so callers never block on stderr or
+        the log file. `module_levels` maps module names (prefixes) to the
+        minimum level logged for them, e.g. {"Core.noise_ops": "WARNING"}.
+        """
+        from datetime import datetime
+        from multiprocessing import parent_process
+        from pytz import timezone
+        from loguru import logger
         logger_config = self.get_config('Logger', {})
         log_level = logger_config.get('log_level', 'INFO')
         log_file = logger_config.get('log_file', None)
@@ -77,58 +242,104 @@ class ConfigAble:
         compression = logger_config.get('compression', None)
         timezone_str = logger_config.get('timezone', 'UTC')
         clock_style = logger_config.get('clock_style', '12')
+        enqueue = logger_config.get('enqueue', True)
+        module_levels = logger_config.get('module_levels', None) or {}
         
         # Set timezone
         tz = timezone(timezone_str)
         
         # Set clock style
-        if clock_style == '12':
-            logger.configure(
-                patcher=lambda record: record.update(
-                    time=datetime.now(tz).strftime('%Y-%m-%d %I:%M:%S %p')
-                )
-            )
-        else:
-            logger.configure(
-                patcher=lambda record: record.update(
-                    time=datetime.now(tz).strftime('%Y-%m-%d %H:%M:%S')
-                )
-            )
+        time_format = '%Y-%m-%d %I:%M:%S %p' if clock_style == '12' else '%Y-%m-%d %H:%M:%S'
+        logger.configure(patcher=_TimestampPatcher(tz, time_format))
+        
+        # Per-module levels: sinks accept the lowest configured level and the filter gates by module
+        level_filter = {'': log_level, **module_levels} if module_levels else None
+        sink_level = min([log_level, *module_levels.values()], key=lambda level: logger.level(level).no)
+        sink_options = {
+            'level': sink_level,
+            'filter': level_filter,
+            'format': "{extra[timestamp]} | {level} | {message}",
+            'enqueue': enqueue,
+        }
+        if enqueue:
+            # A spawn-context queue can be shared with both spawn and forkserver children
+            sink_options['context'] = logger_config.get('enqueue_context', 'spawn')
         
         logger.remove() # Remove default logger
         logger.add(
             sys.stderr, 
-            level=log_level,
-            format="{time} | {level} | {message}",
-            colorize=True
+            colorize=True,
+            **sink_options
             ) # Console Logging
         
         if log_file:
             logger.add(
                 log_file, 
-                level=log_level, 
                 rotation=rotation, 
                 retention=retention, 
                 compression=compression,
-                format="{time} | {level} | {message}",
+                **sink_options
                 )
-            with open(log_file, 'a') as f:
-                headers = [
-                    f"Logger Initialized @ {datetime.now(tz).strftime('%Y-%m-%d %I:%M:%S %p')}", 
-                    f"Initializing {sys.argv[0]}"
-                    ]
+            # Only the main process writes the banner; pool workers share the file
+            if parent_process() is None:
+                with open(log_file, 'a') as f:
+                    headers = [
+                        f"Logger Initialized @ {datetime.now(tz).strftime('%Y-%m-%d %I:%M:%S %p')}", 
+                        f"Initializing {sys.argv[0]}"
+                        ]
                 
-                max_len = max(len(header) for header in headers) + 20
-                decorator = '=' * max_len
-                centered_headers = [header.center(max_len, ' ') for header in headers]
+                    max_len = max(len(header) for header in headers) + 20
+                    decorator = '=' * max_len
+                    centered_headers = [header.center(max_len, ' ') for header in headers]
                 
-                header = f"\n{decorator}\n{'\n'.join(centered_headers)}\n{decorator}\n"
-                f.write(header)
+                    header = f"\n{decorator}\n{'\n'.join(centered_headers)}\n{decorator}\n"
+                    f.write(header)
             
         logger.success(f"Logger Initialized")
     
+    def _get_configured_logger(self) -> Any:
+        if not self._logger_configured:
+            with self._setup_lock:
+                if not self._logger_configured:
+                    from loguru import logger
+                    self._configure_logger()
+                    self._loguru = logger
+                    self._logger_configured = True
+        return self._loguru
+
     def get_logger(self) -> Any:
-        return logger
+        """Returns the shared logger. It is configured the first time it is used."""
+        return self._logger
+
+    def get_rate_limited_logger(self, interval: Optional[float] = None, name: Optional[str] = None) -> RateLimitedLogger:
+        """
+        Returns a RateLimitedLogger for hot paths. `interval` defaults to
+        Logger.hot_path_interval; `name` keeps its limits apart from other callers'.
+        """
+        return RateLimitedLogger(self._logger, interval, name)
+
+    def share_logger(self) -> Optional[Any]:
+        """
+        Returns the configured loguru logger for handing to child processes.
+
+        With enqueued sinks the child's records travel back over the queue and
+        are written by this process, so workers never contend for the log file.
+        Sinks that are not enqueued hold open file handles and cannot be
+        pickled, so without `enqueue` this returns None and each child
+        configures its own logger.
+        """
+        if not self.get_config('Logger.enqueue', default=True):
+            return None
+        return self._get_configured_logger()
+
+    def adopt_logger(self, logger: Optional[Any]) -> None:
+        """Uses a logger shared by the parent process instead of configuring one. None keeps this process' own."""
+        if logger is None:
+            return
+        with self._setup_lock:
+            self._loguru = logger
+            self._logger._target = logger
+            self._logger_configured = True
     
     def get_config(self, section: str, default: Optional[Any] = None) -> Any:
         """
@@ -141,12 +352,11 @@ class ConfigAble:
         Returns:
             Any: The configuration option value
         """
-        keys = section.split('.')
         value = self.config
-        for key in keys:
-            value = value.get(key, default if key == keys[-1] else {})
-            if value == {}:
-                break
+        for key in section.split('.'):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
         return value
 
     
@@ -0,0 +1,8 @@
+from .runner import BatchGenerator, BatchReport, load_settings, parse_seeds
+
+__all__ = [
+    "BatchGenerator",
+    "BatchReport",
+    "load_settings",
+    "parse_seeds"
+]
@@ -0,0 +1,52 @@
+"""
+Generates a World for every seed in a range and writes them to a directory.
+
+    python -m batch --seeds 0:1000 --params params.yaml --output worlds/
+    python -m batch --seeds 1,5,9 --params params.json --output worlds/ --workers 8 --compress
+
+Re-running with the same arguments resumes an interrupted batch.
+"""
+import argparse, json, sys
+
+from batch.runner import BatchGenerator, load_settings, parse_seeds
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m batch", description="FMG multi-seed batch generation")
+    parser.add_argument("--seeds", required=True, help="START:STOP[:STEP] or a comma-separated list")
+    parser.add_argument("--params", required=True, help="GenerationSettings as a YAML or JSON file")
+    parser.add_argument("--output", required=True, help="Directory for the worlds and the manifest")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: JobManager.max_workers)")
+    parser.add_argument("--in-flight", type=int, default=None, help="Seeds submitted at once (default: 2 per worker)")
+    parser.add_argument("--compress", action="store_true", help="Write compressed .npz files")
+    parser.add_argument("--report", default=None, help="Write the final report as JSON to this path")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final report")
+    args = parser.parse_args(argv)
+
+    generator = BatchGenerator(
+        load_settings(args.params), args.output,
+        max_workers=args.workers, max_in_flight=args.in_flight, compress=args.compress
+    )
+
+    def progress(report, result):
+        if args.quiet:
+            return
+        total = f"/{report.total - report.skipped}" if report.total is not None else ""
+        print(f"[{report.completed}{total}] seed {result['seed']} in {result['seconds']:.2f}s  {report.worlds_per_minute:.1f} worlds/min", flush=True)
+
+    try:
+        report = generator.run(parse_seeds(args.seeds), progress=progress)
+    except KeyboardInterrupt:
+        print("\nInterrupted; run again with the same arguments to resume.", file=sys.stderr)
+        return 130
+
+    print()
+    print(report.format())
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(report.to_dict(), file, indent=2)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
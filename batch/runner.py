@@ -0,0 +1,263 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
+import json, os, tempfile, time
+
+import numpy as np
+
+from Utilities import configAble
+from Core.jobs.worker import default_start_method, init_worker, worker_context
+from Core.metrics import GenerationMetrics, peak_rss_bytes, reset_peak_rss
+from data_models.generation import GenerationSettings
+from factories.world_factory import WorldFactory, load_biome_data
+
+MANIFEST_NAME = 'manifest.jsonl'
+SETTINGS_NAME = 'settings.json'
+WORLD_LAYERS = ('height_map', 'land_mask', 'temperature_map', 'moisture_map', 'biome_map')
+
+
+def parse_seeds(text: str) -> Sequence[int]:
+    """
+    Parses a seed specification: "START:STOP[:STEP]" for a half-open range or
+    a comma-separated list such as "1,5,9". Ranges are not materialized.
+    """
+    if ':' in text:
+        parts = [int(part) for part in text.split(':')]
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Invalid seed range {text!r}, expected START:STOP[:STEP]")
+        return range(*parts)
+    return [int(part) for part in text.split(',') if part.strip()]
+
+
+def load_settings(path: str) -> GenerationSettings:
+    """Reads GenerationSettings from a YAML or JSON parameter file. Any seed in the file is ignored."""
+    with open(path, 'r') as file:
+        if Path(path).suffix.lower() in ('.yaml', '.yml'):
+            import yaml
+            data = yaml.safe_load(file) or {}
+        else:
+            data = json.load(file)
+    return GenerationSettings(**data).model_copy(update={'seed': None})
+
+
+def world_path(output_dir: str, seed: int) -> Path:
+    return Path(output_dir) / f"world_{seed}.npz"
+
+
+def _init_batch_worker(config: Dict[str, Any], logger: Optional[Any]) -> None:
+    """Pool initializer: adopts the parent's configuration and loads biome data once for every world this worker builds."""
+    init_worker(config, logger)
+    load_biome_data()
+
+
+def _generate_seed(settings: GenerationSettings, seed: int, output_dir: str, compress: bool) -> Dict[str, Any]:
+    """
+    Worker entry point. Generates one World, writes its layers to disk and
+    returns only a small summary, so finished worlds never travel back to the
+    parent process.
+    """
+    GenerationMetrics.start_buffering()
+    reset_peak_rss()
+    started = time.perf_counter()
+    world = WorldFactory.create_world(settings.model_copy(update={'seed': seed}))
+    layers = {layer: getattr(world, layer) for layer in WORLD_LAYERS if getattr(world, layer) is not None}
+
+    path = world_path(output_dir, seed)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            (np.savez_compressed if compress else np.savez)(file, seed=np.int64(seed), **layers)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    elapsed = time.perf_counter() - started
+
+    stages: Dict[str, float] = {}
+    for kind, name, labels, value in GenerationMetrics.drain():
+        if name == 'stage_seconds':
+            stages[labels['stage']] = stages.get(labels['stage'], 0.0) + value
+    return {
+        'seed'          : seed,
+        'path'          : path.name,
+        'seconds'       : elapsed,
+        'stages'        : stages,
+        'peak_rss_bytes': peak_rss_bytes(),
+    }
+
+
+class BatchReport:
+    """Throughput, per-stage time and memory totals of a batch run."""
+
+    def __init__(self, total: Optional[int] = None):
+        self.total          : Optional[int]    = total
+        self.completed      : int              = 0
+        self.skipped        : int              = 0
+        self.failed         : List[int]        = []
+        self.elapsed        : float            = 0.0
+        self.world_seconds  : float            = 0.0
+        self.stage_seconds  : Dict[str, float] = {}
+        self.peak_rss_bytes : int              = 0  # Largest peak of any worker for a single world
+
+    @property
+    def worlds_per_minute(self) -> float:
+        return self.completed * 60.0 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.completed += 1
+        self.world_seconds += result['seconds']
+        for stage, seconds in result['stages'].items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        self.peak_rss_bytes = max(self.peak_rss_bytes, result['peak_rss_bytes'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'completed'        : self.completed,
+            'skipped'          : self.skipped,
+            'failed'           : self.failed,
+            'elapsed'          : self.elapsed,
+            'worlds_per_minute': self.worlds_per_minute,
+            'stage_seconds'    : self.stage_seconds,
+            'worker_peak_rss_bytes': self.peak_rss_bytes,
+            'parent_peak_rss_bytes': peak_rss_bytes(),
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"{self.completed} worlds in {self.elapsed:.1f}s ({self.worlds_per_minute:.1f} worlds/min), "
+            f"{self.skipped} already done, {len(self.failed)} failed"
+        ]
+        stage_total = sum(self.stage_seconds.values())
+        for stage, seconds in self.stage_seconds.items():
+            share = seconds / stage_total if stage_total > 0 else 0.0
+            per_world = seconds / self.completed if self.completed else 0.0
+            lines.append(f"  {stage:<12} {per_world * 1000:9.1f} ms/world  {share:6.1%}")
+        lines.append(f"  peak memory: {self.peak_rss_bytes / 2 ** 20:.0f} MiB per worker, {peak_rss_bytes() / 2 ** 20:.0f} MiB parent")
+        return "\n".join(lines)
+
+
+class BatchGenerator:
+    """
+    Generates one World per seed across a process pool and writes each to
+    `output_dir` as world_<seed>.npz as soon as it is done.
+
+    Every finished world is appended to manifest.jsonl, so an interrupted run
+    resumes by skipping seeds already in the manifest. The settings are saved
+    next to the outputs and a resume with different settings is refused.
+
+    At most `max_in_flight` seeds are submitted at a time and workers return
+    only a summary, so memory does not grow with the number of seeds queued.
+    """
+
+    config_manager = configAble.ConfigAble(config_path='config.yaml')
+    log = config_manager.get_logger()
+
+    def __init__(
+            self,
+            settings: GenerationSettings,
+            output_dir: str,
+            max_workers: Optional[int] = None,
+            max_in_flight: Optional[int] = None,
+            compress: bool = False,
+            start_method: Optional[str] = None
+        ):
+        get_config = self.config_manager.get_config
+        self.settings = settings.model_copy(update={'seed': None})
+        self.output_dir = str(output_dir)
+        self.max_workers: int   = max_workers or get_config('JobManager.max_workers', default=os.cpu_count() or 1)
+        self.max_in_flight: int = max_in_flight or self.max_workers * 2
+        self.compress = compress
+        self.start_method: str  = start_method or get_config('JobManager.start_method', default=default_start_method())
+
+    @property
+    def manifest_path(self) -> Path:
+        return Path(self.output_dir) / MANIFEST_NAME
+
+    def _prepare_output(self) -> None:
+        """Creates the output directory, checks the saved settings and removes files left by an interrupted write."""
+        output = Path(self.output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        settings_path = output / SETTINGS_NAME
+        saved = self.settings.model_dump(mode='json')
+        if settings_path.exists():
+            with open(settings_path, 'r') as file:
+                if json.load(file) != saved:
+                    raise ValueError(f"{self.output_dir} holds worlds generated with different settings")
+        else:
+            with open(settings_path, 'w') as file:
+                json.dump(saved, file, indent=2)
+        for leftover in output.glob('*.tmp'):
+            leftover.unlink()
+
+    def completed_seeds(self) -> Set[int]:
+        """Seeds recorded in the manifest whose output file still exists."""
+        done: Set[int] = set()
+        if not self.manifest_path.exists():
+            return done
+        with open(self.manifest_path, 'r') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A line cut short by an interruption
+                if (Path(self.output_dir) / entry['path']).exists():
+                    done.add(entry['seed'])
+        return done
+
+    def run(self, seeds: Iterable[int], progress: Optional[Callable[[BatchReport, Dict[str, Any]], None]] = None) -> BatchReport:
+        """
+        Generates a World for every seed not already done.
+
+        Args:
+            seeds    (Iterable[int])     : The seeds; consumed lazily.
+            progress (Callable, optional): Called with the report and each finished world's summary.
+
+        Returns:
+            BatchReport: Totals for this run.
+        """
+        self._prepare_output()
+        done = self.completed_seeds()
+        report = BatchReport(total=len(seeds) if hasattr(seeds, '__len__') else None)
+        started = time.perf_counter()
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=worker_context(self.start_method, ['batch.runner']),
+            initializer=_init_batch_worker,
+            initargs=(self.config_manager.config, self.config_manager.share_logger())
+        )
+        pending: Dict[Future, int] = {}
+        remaining = iter(seeds)
+        try:
+            with open(self.manifest_path, 'a') as manifest:
+                while True:
+                    # Top up the window; the rest of the seeds stay unread
+                    while len(pending) < self.max_in_flight:
+                        seed = next(remaining, None)
+                        if seed is None:
+                            break
+                        if seed in done:
+                            report.skipped += 1
+                            continue
+                        pending[executor.submit(_generate_seed, self.settings, seed, self.output_dir, self.compress)] = seed
+                    if not pending:
+                        break
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        seed = pending.pop(future)
+                        if future.exception() is not None:
+                            report.failed.append(seed)
+                            self.log.error(f"Seed {seed} failed: {future.exception()!r}")
+                            continue
+                        result = future.result()
+                        manifest.write(json.dumps(result) + "\n")
+                        manifest.flush()
+                        report.add(result)
+                        report.elapsed = time.perf_counter() - started
+                        if progress is not None:
+                            progress(report, result)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            report.elapsed = time.perf_counter() - started
+        self.log.info(f"Batch finished: {report.completed} worlds, {report.skipped} skipped, {len(report.failed)} failed")
+        return report
@@ -0,0 +1,8 @@
+from .suite import BenchmarkSuite, compare, load_results, save_results
+
+__all__ = [
+    "BenchmarkSuite",
+    "compare",
+    "load_results",
+    "save_results"
+]
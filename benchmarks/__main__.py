@@ -0,0 +1,47 @@
+"""
+Runs the scaling benchmarks.
+
+    python -m benchmarks --sizes 256 512 --output bench.json
+    python -m benchmarks --output bench.json --compare baseline.json --threshold 0.15
+
+Exits with status 1 when --compare finds a regression.
+"""
+import argparse, sys
+
+from benchmarks.suite import DEFAULT_SIZES, BenchmarkSuite, compare, load_results, save_results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="FMG scaling benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Map edge lengths to run")
+    parser.add_argument("--only", nargs="+", default=None, help="Benchmark names to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per benchmark and size")
+    parser.add_argument("--all-sizes", action="store_true", help="Ignore per-benchmark size caps")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this path")
+    parser.add_argument("--compare", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed time slowdown before flagging (fraction)")
+    parser.add_argument("--memory-threshold", type=float, default=0.10, help="Allowed peak memory growth before flagging (fraction)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BenchmarkSuite.list_benchmarks()))
+        return 0
+
+    results = BenchmarkSuite.run(args.sizes, names=args.only, repeats=args.repeats, ignore_caps=args.all_sizes)
+    if args.output:
+        save_results(results, args.output)
+
+    if args.compare:
+        comparisons = compare(results, load_results(args.compare), args.threshold, args.memory_threshold)
+        print()
+        for entry in comparisons:
+            flag = "REGRESSION" if entry["regressed"] else "ok"
+            print(f"{entry['name']:<28} {entry['size']:>5}²  time x{entry['time_ratio']:.2f}  memory x{entry['memory_ratio']:.2f}  {flag}")
+        if any(entry["regressed"] for entry in comparisons):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
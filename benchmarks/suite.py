@@ -0,0 +1,265 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+import gc, io, json, platform, statistics, time, tracemalloc
+
+import numpy as np
+
+from Core.cache import code_version
+from Core.climate import moisture_map, temperature_map
+from Core.contours import isolines, write_geojson
+from Core.sampling import sample_world
+from Core.noise_ops import NoiseGenerator
+from data_models import Cell, Records, Utils
+from data_models.biome import BiomeData
+from data_models.generation import ClimateSettings
+from data_models.grid import Grid
+from data_models.world import World
+
+DEFAULT_SIZES = (256, 512, 1024, 2048, 4096)
+BIOME_DATA_PATH = 'config_data/biome_data.json'
+
+
+class Benchmark(NamedTuple):
+    setup   : Callable[[int], Any]   # Builds the untimed input for a map of size x size cells
+    run     : Callable[[Any], Any]   # The timed hot path
+    max_size: Optional[int]          # Largest size run unless caps are ignored; None for no cap
+
+
+class BenchmarkSuite:
+    """
+    Registry and runner for the scaling benchmarks.
+
+    Each benchmark is timed `repeats` times on a fresh setup and reported by
+    its fastest run. Peak memory is measured in one extra run under
+    tracemalloc, which numpy reports its buffers to, so timings are not skewed
+    by tracing overhead.
+    """
+
+    benchmarks: Dict[str, Benchmark] = {}
+
+    @classmethod
+    def register(cls, name: str, setup: Callable[[int], Any], run: Callable[[Any], Any], max_size: Optional[int] = None):
+        cls.benchmarks[name] = Benchmark(setup, run, max_size)
+
+    @classmethod
+    def list_benchmarks(cls) -> List[str]:
+        return list(cls.benchmarks.keys())
+
+    @classmethod
+    def run(
+            cls,
+            sizes: Sequence[int] = DEFAULT_SIZES,
+            names: Optional[Sequence[str]] = None,
+            repeats: int = 3,
+            ignore_caps: bool = False,
+            log: Callable[[str], None] = print
+        ) -> Dict[str, Any]:
+        """
+        Runs the selected benchmarks at each size.
+
+        Returns:
+            Dict[str, Any]: {"meta": {...}, "results": [{"name", "size", "cells", "seconds",
+                            "mean_seconds", "repeats", "peak_bytes"}, ...]}
+        """
+        results = []
+        for name in names or cls.list_benchmarks():
+            benchmark = cls.benchmarks[name]
+            for size in sizes:
+                if not ignore_caps and benchmark.max_size is not None and size > benchmark.max_size:
+                    continue
+                result = cls._run_one(name, benchmark, size, repeats)
+                log(f"{name:<28} {size:>5}²  {result['seconds']:>10.4f}s  {result['peak_bytes'] / 1024 ** 2:>10.1f} MiB")
+                results.append(result)
+        return {'meta': cls._meta(), 'results': results}
+
+    @staticmethod
+    def _run_one(name: str, benchmark: Benchmark, size: int, repeats: int) -> Dict[str, Any]:
+        timings = []
+        for _ in range(repeats):
+            state = benchmark.setup(size)
+            gc.collect()
+            started = time.perf_counter()
+            benchmark.run(state)
+            timings.append(time.perf_counter() - started)
+            del state
+
+        state = benchmark.setup(size)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            benchmark.run(state)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'name': name,
+            'size': size,
+            'cells': size * size,
+            'seconds': min(timings),
+            'mean_seconds': statistics.fmean(timings),
+            'repeats': repeats,
+            'peak_bytes': peak,
+        }
+
+    @staticmethod
+    def _meta() -> Dict[str, Any]:
+        return {
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'code_version': code_version(),
+        }
+
+
+def compare(
+        current: Dict[str, Any],
+        baseline: Dict[str, Any],
+        time_threshold: float = 0.10,
+        memory_threshold: float = 0.10
+    ) -> List[Dict[str, Any]]:
+    """
+    Compares results against a baseline run.
+
+    A result regresses when its time or peak memory exceeds the baseline's by
+    more than the threshold (a fraction, 0.10 = 10%). Results missing from the
+    baseline are skipped.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per matched result with the ratios and a `regressed` flag.
+    """
+    baseline_results = {(result['name'], result['size']): result for result in baseline['results']}
+    comparisons = []
+    for result in current['results']:
+        previous = baseline_results.get((result['name'], result['size']))
+        if previous is None:
+            continue
+        time_ratio = result['seconds'] / previous['seconds'] if previous['seconds'] else float('inf')
+        memory_ratio = result['peak_bytes'] / previous['peak_bytes'] if previous['peak_bytes'] else 1.0
+        comparisons.append({
+            'name': result['name'],
+            'size': result['size'],
+            'time_ratio': time_ratio,
+            'memory_ratio': memory_ratio,
+            'regressed': time_ratio > 1 + time_threshold or memory_ratio > 1 + memory_threshold,
+        })
+    return comparisons
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def _random_map(size: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).random((size, size), dtype=np.float32)
+
+
+def _grid_with_cells(size: int) -> Grid:
+    return Grid(width=size, height=size)
+
+
+def _cell_columns(size: int) -> Dict[str, np.ndarray]:
+    count = size * size
+    return {"id": np.arange(count), "height": _random_map(size, 0).ravel()}
+
+
+def _validated_cells(columns: Dict[str, np.ndarray]) -> List[Cell]:
+    return [Cell(id=cell_id, height=height) for cell_id, height in zip(columns["id"].tolist(), columns["height"].tolist())]
+
+
+def _trusted_cells(columns: Dict[str, np.ndarray]) -> List[Cell]:
+    return Cell.construct_batch({name: column.tolist() for name, column in columns.items()})
+
+
+def _cell_records(columns: Dict[str, np.ndarray]) -> Records:
+    # The same conversion to plain Python values as the other two, without building models
+    return Records(Cell, {name: column.tolist() for name, column in columns.items()})
+
+
+def _biome_inputs(size: int):
+    biome_data = BiomeData()
+    biome_data.load_from_json(BIOME_DATA_PATH)
+    low_temp, high_temp = biome_data.matrix.temp_range
+    low_moist, high_moist = biome_data.matrix.moisture_range
+    temps = low_temp + _random_map(size, 1) * (high_temp - low_temp)
+    moists = low_moist + _random_map(size, 2) * (high_moist - low_moist)
+    land_mask = _random_map(size, 3) > 0.3
+    return biome_data, temps, moists, land_mask
+
+
+def _classify_biomes(state) -> None:
+    # What the biomes stage runs
+    biome_data, temps, moists, land_mask = state
+    biome_data.classify(temps, moists, land_mask)
+
+
+def _classify_biomes_per_cell(state) -> None:
+    # The scalar lookup the stage replaced, kept as a reference
+    biome_data, temps, moists, _ = state
+    get_biome = biome_data.matrix.get_biome
+    for temp, moist in zip(temps.ravel().tolist(), moists.ravel().tolist()):
+        get_biome(temp, moist)
+
+
+def _world_with_maps(size: int) -> World:
+    return World(
+        width=size,
+        height=size,
+        height_map=_random_map(size, 0),
+        temperature_map=_random_map(size, 1),
+        moisture_map=_random_map(size, 2)
+    )
+
+
+def _climate(height_map: np.ndarray) -> None:
+    settings = ClimateSettings()
+    temperature_map(height_map, 0.0, settings, seed=0)
+    moisture_map(height_map, 0.0, settings, seed=1)
+
+
+def _sampling_inputs(size: int):
+    points = np.random.default_rng(0).random((100_000, 2), dtype=np.float32) * (size - 1)
+    return _world_with_maps(size), points
+
+
+def _modify_world(world: World) -> None:
+    world.update_temperature_map(1.5)
+    world.update_moisture_map(-0.5)
+
+
+def _noise_op_benchmark(op: str) -> Callable[[np.ndarray], Any]:
+    return lambda map_data: NoiseGenerator.execute_op(op, map_data, seed=0)
+
+
+def _heightmap_input(size: int) -> np.ndarray:
+    # Erosion and climate do little work on a flat map, so they start from an fBm heightmap
+    return NoiseGenerator.execute_op("fbm", np.zeros((size, size), dtype=np.float32), {"scale": 128.0}, seed=0)
+
+
+BenchmarkSuite.register("grid_construction", lambda size: size, _grid_with_cells, max_size=1024)
+BenchmarkSuite.register("grid_neighbor_lists", _grid_with_cells, lambda grid: grid.cells.column("neighbors")[:], max_size=1024)
+BenchmarkSuite.register("cell_construction:validated", _cell_columns, _validated_cells, max_size=1024)
+BenchmarkSuite.register("cell_construction:trusted", _cell_columns, _trusted_cells, max_size=1024)
+BenchmarkSuite.register("cell_construction:records", _cell_columns, _cell_records)
+BenchmarkSuite.register("biome_classification", _biome_inputs, _classify_biomes)
+BenchmarkSuite.register("biome_classification:scalar", _biome_inputs, _classify_biomes_per_cell, max_size=1024)
+for _op in NoiseGenerator.list_ops():
+    if _op.endswith("_erosion"):
+        BenchmarkSuite.register(f"noise_op:{_op}", _heightmap_input, _noise_op_benchmark(_op), max_size=2048)
+    else:
+        BenchmarkSuite.register(f"noise_op:{_op}", lambda size: np.zeros((size, size), dtype=np.float32), _noise_op_benchmark(_op))
+BenchmarkSuite.register("climate", _heightmap_input, _climate)
+BenchmarkSuite.register("coastline_geojson", _heightmap_input, lambda height: write_geojson(isolines(height, [0.0], tolerance=0.5), io.StringIO()))
+BenchmarkSuite.register("world_map_modifiers", _world_with_maps, _modify_world)
+BenchmarkSuite.register("sample_world:100k", _sampling_inputs, lambda state: sample_world(*state))
+BenchmarkSuite.register("serialize_model_to_dict", _world_with_maps, lambda world: Utils.serialize_model_to_dict(world, mode="json"), max_size=2048)
@@ -1,9 +1,12 @@
 from .enums import BiomeType, TerrainType
-from .models import Burg, Cell, Culture, Feature, Grid, Marker, Pack, Province, Religion, Road, State, expandable
+from .common import Records, expandable
+from .models import Burg, Culture, Feature, Marker, Province, Religion, Road, State
 from .utils import Utils
 from .cell import Cell
 from .biome import Biome, BiomeMatrix
-from .common import expandable
+from .grid import Grid
+from .pack import Pack
+from .world import Rect, World
 
 __all__ = [
     "Biome",
@@ -13,5 +16,7 @@ __all__ = [
     "expandable",
     "Grid",
     "Pack",
+    "Records",
+    "Rect",
     "World"
 ]
\ No newline at end of file
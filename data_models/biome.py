@@ -1,5 +1,6 @@
 import json
 from typing import List, Optional, Tuple, Dict
+import numpy as np
 
 from pydantic import BaseModel, Field
 from data_models import BiomeType, expandable
@@ -50,6 +51,9 @@ class BiomeMatrix(BaseModel):
     temp_range: Tuple[float, float]     = Field(default=(float('inf'), float('-inf')), description="Min and max temperature")  # Min and max temperature
     moisture_range: Tuple[float, float] = Field(default=(float('inf'), float('-inf')), description="Min and max moisture")  # Min and max moisture
     
+    class Config:
+        defer_build = True
+    
     def __init__(self, **data):
         super().__init__(**data)
         self.matrix = [[None for _ in range(self.columns)] for _ in range(self.rows)]
@@ -104,6 +108,18 @@ class BiomeMatrix(BaseModel):
         return self.matrix[row][column]
     
     
+    def indices(self, temps: np.ndarray, moistures: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `get_biome` lookup: the (row, column) of the matrix for every
+        temperature/moisture pair. Values outside the matrix ranges are clipped
+        to its edges.
+        """
+        moisture_norm = (np.clip(moistures, *self.moisture_range) - self.moisture_range[0]) / (self.moisture_range[1] - self.moisture_range[0])
+        temp_norm = (np.clip(temps, *self.temp_range) - self.temp_range[0]) / (self.temp_range[1] - self.temp_range[0])
+        rows = (moisture_norm * (self.rows - 1)).astype(np.intp)
+        columns = (temp_norm * (self.columns - 1)).astype(np.intp)
+        return rows, columns
+
     def __getitem__(self, idx) -> List[str]:
         return self.matrix[idx]
     
@@ -129,7 +145,10 @@ class BiomeData(BaseModel):
     _special_biomes_dict: Dict[str, Biome] = {}
     temp_range: Tuple[float, float] = (0, 0)
     moisture_range: Tuple[float, float] = (0, 0)
-    matrix: BiomeMatrix = BiomeMatrix()
+    matrix: BiomeMatrix = Field(default_factory=BiomeMatrix)
+    
+    class Config:
+        defer_build = True
                 
     @property
     def _curr_index(self) -> int:
@@ -185,6 +204,39 @@ class BiomeData(BaseModel):
                     )
                     self.add_biome(biome)
 
+    def id_table(self) -> np.ndarray:
+        """The biome id for every entry of the matrix, 0 where the matrix has no biome."""
+        return np.array(
+            [[self[name].id if name is not None else 0 for name in row] for row in self.matrix.matrix],
+            dtype=np.int16
+        )
+
+    def classify(
+            self,
+            temperature: np.ndarray,
+            moisture: np.ndarray,
+            land_mask: Optional[np.ndarray] = None,
+            water_biome: str = "Marine"
+        ) -> np.ndarray:
+        """
+        Classifies whole temperature and moisture maps at once.
+
+        Args:
+            temperature (np.ndarray)          : Temperature per cell.
+            moisture    (np.ndarray)          : Moisture per cell.
+            land_mask   (np.ndarray, optional): True where the cell is land. Water cells get `water_biome`.
+            water_biome (str)                 : Biome for water cells, if it exists. Defaults to "Marine".
+
+        Returns:
+            np.ndarray: int16 biome id per cell, 0 where no biome applies.
+        """
+        rows, columns = self.matrix.indices(temperature, moisture)
+        biome_ids = self.id_table()[rows, columns]
+        if land_mask is not None:
+            water_id = self[water_biome].id if water_biome in self._special_biomes_dict or water_biome in self._standard_biomes_dict else 0
+            biome_ids[~land_mask] = water_id
+        return biome_ids
+
     def __getitem__(self, biome_name):
         """
         Allow dictionary-like access by biome name.
@@ -196,7 +248,3 @@ class BiomeData(BaseModel):
 
     def __repr__(self):
         return f"BiomeData(\"Basic\": {self._standard_biomes_dict},\"Special\": {self._special_biomes_dict})"
-
-Biome.model_rebuild()
-BiomeMatrix.model_rebuild()
-BiomeData.model_rebuild()
\ No newline at end of file
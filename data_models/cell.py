@@ -16,12 +16,12 @@ class Cell(expandable):
         biome:   Optional[str] # Name of the Cells Biome
         terrain: Optional[TerrainType]
     """
-    height      : Optional[float] # Height of the cell
-    temp        : Optional[float] # Temperature of the cell
-    moist       : Optional[float] # Moisture of the cell
+    height      : Optional[float] = None # Height of the cell
+    temp        : Optional[float] = None # Temperature of the cell
+    moist       : Optional[float] = None # Moisture of the cell
     neighbors   : Optional[List[int]] = []  # List of neighboring cells by ID
-    biome       : Optional[str]   # Name of the Cells Biom
-    terrain     : Optional[TerrainType]
+    biome       : Optional[str]   = None # Name of the Cells Biom
+    terrain     : Optional[TerrainType] = None
     # Additional attributes as needed
     
     class Config:
@@ -35,4 +35,3 @@ class Cell(expandable):
             }
         }
         
-Cell.model_rebuild()
\ No newline at end of file
@@ -7,4 +7,12 @@ class TerrainType(str, Enum):
     
 class BiomeType(str, Enum):
     BASIC  = "basic"
-    SPECIAL = "special"
\ No newline at end of file
+    SPECIAL = "special"
+
+
+class JobStatus(str, Enum):
+    QUEUED    = "queued"
+    RUNNING   = "running"
+    COMPLETED = "completed"
+    FAILED    = "failed"
+    CANCELLED = "cancelled"
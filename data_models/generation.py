@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+class FbmOpSettings(BaseModel):
+    """Limits on the settings of the "fbm" op; each octave costs a full pass over the map."""
+    model_config = ConfigDict(extra='allow')
+
+    scale  : float = Field(default=100.0, gt=0)
+    octaves: int   = Field(default=6, ge=1, le=16)
+
+
+class ErosionOpSettings(BaseModel):
+    """
+    Limits on the settings of the erosion ops. A job is only cancelled between
+    stages, so `iterations` is capped to keep a single stage short.
+    """
+    model_config = ConfigDict(extra='allow')
+
+    iterations : int             = Field(default=50, ge=0, le=1000)
+    time_budget: Optional[float] = Field(default=None, gt=0, le=600)
+    tile_size  : int             = Field(default=0, ge=0, le=8192)
+    halo       : Optional[int]   = Field(default=None, ge=0, le=1001)
+    workers    : Optional[int]   = Field(default=None, ge=1, le=64)
+
+
+# Settings models checked for the ops that need limits; other registered ops take any settings
+NOISE_OP_SETTINGS: Dict[str, type] = {
+    "fbm"              : FbmOpSettings,
+    "thermal_erosion"  : ErosionOpSettings,
+    "hydraulic_erosion": ErosionOpSettings,
+}
+
+
+class NoiseOpSettings(BaseModel):
+    """
+    A single NoiseGenerator operation and the settings passed to it.
+
+    The name must be a registered op and the settings are checked against the
+    op's limits, so a bad op is rejected when the request arrives instead of
+    failing in a worker. The settings are passed on as given.
+    """
+    name    : str                                         # Registered op name (e.g., "fbm")
+    settings: Dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator('name')
+    @classmethod
+    def _registered(cls, name: str) -> str:
+        from Core.noise_ops import NoiseGenerator
+        if name not in NoiseGenerator.list_ops():
+            raise ValueError(f"Unknown noise op {name!r}. Expected one of {', '.join(NoiseGenerator.list_ops())}")
+        return name
+
+    @model_validator(mode='after')
+    def _within_limits(self) -> 'NoiseOpSettings':
+        limits = NOISE_OP_SETTINGS.get(self.name)
+        if limits is not None:
+            limits.model_validate(self.settings)
+        return self
+
+
+class HeightmapSettings(BaseModel):
+    """Settings for the heightmap stage: noise ops applied in order to a zeroed map."""
+    ops: List[NoiseOpSettings] = Field(
+        default_factory=lambda: [NoiseOpSettings(name="fbm", settings={"scale": 128.0, "octaves": 6})]
+    )
+
+
+class TerrainSettings(BaseModel):
+    """Settings for the terrain stage."""
+    sea_level: float = Field(default=0.0, description="Heights above this value are land")
+
+
+class ClimateSettings(BaseModel):
+    """
+    Settings for the climate stage. Temperatures are in degrees Celsius and
+    moisture is yearly precipitation in mm, the units used by the biome data.
+    """
+    latitude_range       : Tuple[float, float] = Field(default=(60.0, -60.0), description="Latitude of the top and bottom rows in degrees")
+    equator_temperature  : float = Field(default=30.0, description="Sea-level temperature at the equator")
+    pole_temperature     : float = Field(default=-25.0, description="Sea-level temperature at the poles")
+    elevation_scale      : float = Field(default=6000.0, gt=0, description="Metres per unit of height above sea level")
+    lapse_rate           : float = Field(default=6.5, description="Temperature drop per 1000 m of elevation")
+    temperature_noise    : float = Field(default=3.0, ge=0, description="Amplitude of the temperature noise")
+    wind_from            : Literal["west", "east", "north", "south"] = Field(default="west", description="Side of the map the prevailing wind blows from")
+    max_precipitation    : float = Field(default=1500.0, ge=0, description="Precipitation on flat land under saturated air")
+    precipitation_cap    : float = Field(default=10000.0, ge=0, description="Upper bound on precipitation, reached on steep windward slopes")
+    rain_distance        : float = Field(default=400.0, gt=0, description="Cells of flat land over which air loses ~63% of its moisture")
+    saturation_distance  : float = Field(default=150.0, gt=0, description="Cells of open water after which air is ~63% saturated")
+    orographic_lift      : float = Field(default=0.25, ge=0, description="Extra rainout per 1000 m climbed along the wind")
+    coastal_precipitation: float = Field(default=400.0, ge=0, description="Extra precipitation right at the coast")
+    coastal_distance     : float = Field(default=30.0, gt=0, description="Cells inland over which the coastal bonus decays by ~63%")
+    moisture_noise       : float = Field(default=0.2, ge=0, description="Relative amplitude of the precipitation noise")
+    noise_scale          : float = Field(default=256.0, gt=0, description="Feature size of the climate noise in cells")
+
+
+class GenerationSettings(BaseModel):
+    """
+    Everything needed to generate a World.
+
+    Generation is deterministic given these settings; when `seed` is omitted
+    a random one is chosen and stored on the generated World.
+    """
+    width    : int           = Field(default=512, gt=0)
+    height   : int           = Field(default=512, gt=0)
+    seed     : Optional[int] = None
+    name     : str           = "Unnamed World"
+    heightmap: HeightmapSettings = Field(default_factory=HeightmapSettings)
+    terrain  : TerrainSettings   = Field(default_factory=TerrainSettings)
+    climate  : ClimateSettings   = Field(default_factory=ClimateSettings)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "width": 512,
+                "height": 512,
+                "seed": 42,
+                "name": "Example World",
+                "heightmap": {"ops": [{"name": "fbm", "settings": {"scale": 128.0, "octaves": 6}}]},
+                "terrain": {"sea_level": 0.0},
+                "climate": {"wind_from": "west", "lapse_rate": 6.5}
+            }
+        }
@@ -1,54 +1,94 @@
-from typing import Dict, List, Tuple
+from typing import Any, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from data_models.cell import Cell
+from data_models.common import Records
 from data_models.enums import TerrainType
 
 
+class GridNeighbors:
+    """
+    The `neighbors` column of a Grid's cell records, built only for the rows
+    read. Each cell lists the ids of its 8 neighbours that lie inside the
+    grid, in the order left, right, up, down, top left, top right, bottom
+    right, bottom left.
+    """
+
+    __slots__ = ('ids', 'width', 'height')
+
+    # (dy, dx) per neighbour, in list order
+    OFFSETS = np.array([(0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (-1, 1), (1, 1), (1, -1)])
+
+    def __init__(self, ids: np.ndarray, width: int, height: int):
+        self.ids = ids
+        self.width = width
+        self.height = height
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, rows: slice) -> List[List[int]]:
+        y, x = np.divmod(np.arange(len(self.ids))[rows], self.width)
+        ny = y[:, None] + self.OFFSETS[:, 0]
+        nx = x[:, None] + self.OFFSETS[:, 1]
+        inside = (ny >= 0) & (ny < self.height) & (nx >= 0) & (nx < self.width)
+        flat = self.ids[(ny * self.width + nx)[inside]].tolist()
+        ends = np.cumsum(inside.sum(axis=1)).tolist()
+        return [flat[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
 class Grid(BaseModel):
     """
     Represents the initial map data structure before repacking.
 
+    Cells are held as columnar `Records`, row-major, so a grid of a million
+    cells costs a few arrays; Cell models are built only for the cells read,
+    and for all of them when the grid is serialized.
     """
     
-    width:    int = Field(..., default=100)
-    height:   int = Field(..., default=100)
-    cells:    List[List[Cell]] = []
-    _cells_dict: Dict[int, Cell] = {}
+    width:    int = Field(default=100)
+    height:   int = Field(default=100)
+    cells:    Optional[Records] = None
     points:   List[Tuple[float, float]] = [] # Jittered points for the grid
     boundary: List[Tuple[int, int]] = []     # Boundary points for edge aproximation
     
     def __init__(self, **data):
         super().__init__(**data)
-        self.cells = [[Cell(id=hash(f"{y}-{x}"), name=f"{y}-{x}") for x in range(self.width)] for y in range(self.height)]
-        self.initialize_neighbors
-    
-    def get_cell(self, cell_id: int) -> Cell:
-        return next((cell for cell in self.cells if cell.id == cell_id), None)
+        if self.cells is None:
+            names = [f"{y}-{x}" for y in range(self.height) for x in range(self.width)]
+            self.cells = Records(Cell, {"id": np.fromiter(map(hash, names), dtype=np.int64, count=len(names)), "name": names})
+        self.initialize_neighbors()
+
+    @field_validator('cells', mode='before')
+    @classmethod
+    def _coerce_cells(cls, value: Any) -> Optional[Records]:
+        # Rows of Cells (or dicts) from the API are validated here and stored as records
+        if value is None or isinstance(value, Records):
+            return value
+        cells = [Cell.model_validate(cell).model_dump() for row in value for cell in row]
+        names = {name: None for cell in cells for name in cell}
+        return Records(Cell, {name: [cell.get(name) for cell in cells] for name in names})
+
+    @field_serializer('cells')
+    def _serialize_cells(self, cells: Optional[Records]) -> Optional[List[List[Cell]]]:
+        if cells is None:
+            return None
+        models = cells.to_models()
+        return [models[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+    def get_cell(self, cell_id: int) -> Optional[Cell]:
+        index = np.flatnonzero(np.asarray(self.cells.column("id")) == cell_id)
+        return self.cells[int(index[0])] if len(index) else None
     
     def initialize_neighbors(self):
-        for y, row in enumerate(self.cells):
-            for x, cell in enumerate(row):
-                cell.neighbors = []
-                if x > 0:
-                    cell.neighbors.append(self.cells[y][x - 1].id) # Left
-                if x < self.width - 1:
-                    cell.neighbors.append(self.cells[y][x + 1].id) # Right
-                if y > 0:
-                    cell.neighbors.append(self.cells[y - 1][x].id) # Up
-                if y < self.height - 1:
-                    cell.neighbors.append(self.cells[y + 1][x].id) # Down
-                if x > 0 and y > 0:
-                    cell.neighbors.append(self.cells[y - 1][x - 1].id) # Top Left
-                if x < self.width - 1 and y > 0:
-                    cell.neighbors.append(self.cells[y - 1][x + 1].id) # Top Right
-                if x < self.width - 1 and y < self.height - 1:
-                    cell.neighbors.append(self.cells[y + 1][x + 1].id) # Bottom Right
-                if x > 0 and y < self.height - 1:
-                    cell.neighbors.append(self.cells[y + 1][x - 1].id) # Bottom Left
+        """Sets the `neighbors` column; the lists are built when cells are read."""
+        self.cells.columns["neighbors"] = GridNeighbors(np.asarray(self.cells.column("id")), self.width, self.height)
     
     class Config:
         populate_by_name = True
+        arbitrary_types_allowed = True
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "cellsDesired": 100,
@@ -69,4 +109,3 @@ class Grid(BaseModel):
             }
         }
         
-Grid.model_rebuild()
@@ -0,0 +1,35 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from data_models.enums import JobStatus
+from data_models.generation import GenerationSettings
+
+
+class JobProgress(BaseModel):
+    """A single per-stage progress event reported by a generation job."""
+    stage  : str    # Name of the stage that just started ("done" once finished)
+    index  : int    # Zero-based index of the stage
+    total  : int    # Total number of stages
+    elapsed: float  # Seconds since the job started running
+
+
+class Job(BaseModel):
+    """
+    Represents a world-generation job submitted to the JobManager.
+
+    The generated World is kept by the JobManager, not on the Job itself, so the
+    Job can be returned to clients as-is.
+    """
+    id         : str
+    status     : JobStatus = JobStatus.QUEUED
+    settings   : GenerationSettings
+    progress   : List[JobProgress] = Field(default_factory=list)
+    error      : Optional[str]   = None
+    created_at : float
+    started_at : Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
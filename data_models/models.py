@@ -33,18 +33,3 @@ class Road(expandable):
 class Marker(expandable):
     pass
     # Additional attributes as needed
-
-
-
-Feature.model_rebuild()
-Culture.model_rebuild()
-State.model_rebuild()
-Province.model_rebuild()
-Burg.model_rebuild()
-Religion.model_rebuild()
-Road.model_rebuild()
-Marker.model_rebuild()    
-
-
-
-
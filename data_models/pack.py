@@ -34,6 +34,7 @@ class Pack(BaseModel):
     # Additional attributes as needed
     
     class Config:
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "cells": [
@@ -56,4 +57,3 @@ class Pack(BaseModel):
             }
         }
         
-Pack.model_rebuild()
\ No newline at end of file
@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+
+class SampleRequest(BaseModel):
+    """
+    Points to sample from a generated World.
+
+    Points are (x, y) in cell units, with cell (row, column) centred at
+    x = column, y = row. Large batches can instead be posted as binary
+    little-endian float32 (x, y) pairs with `layers` and `interpolate` as
+    query parameters. Fields left out fall back to the query parameters.
+    """
+    points     : List[Tuple[float, float]]
+    layers     : Optional[List[str]] = None  # Defaults to every generated layer
+    interpolate: Optional[bool] = None       # Bilinear for continuous layers, nearest cell otherwise. Defaults to True
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "points": [[10.5, 20.25], [300.0, 42.0]],
+                "layers": ["height_map", "biome_map"],
+                "interpolate": True
+            }
+        }
+
+
+class SampleResponse(BaseModel):
+    """Sampled values per layer, in the order of the requested points."""
+    count : int
+    layers: Dict[str, List[Union[float, int, bool]]] = Field(default_factory=dict)
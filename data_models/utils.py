@@ -1,12 +1,15 @@
 from pydantic import BaseModel
 
+from Core.metrics.generation_metrics import GenerationMetrics
+
 class Utils:
     """Static class for utility functions."""
 
     @staticmethod
-    def serialize_model_to_dict(model: BaseModel) -> dict:
-        """Convert a Pydantic model to a dictionary."""
-        return model.model_dump()
+    def serialize_model_to_dict(model: BaseModel, mode: str = "python") -> dict:
+        """Convert a Pydantic model to a dictionary. Use mode="json" for JSON-safe output."""
+        with GenerationMetrics.time('serialization_seconds', mode=mode):
+            return model.model_dump(mode=mode)
 
     @staticmethod
     def validate_and_load(data: dict, model: BaseModel) -> BaseModel:
@@ -1,21 +1,92 @@
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 from data_models.grid import Grid
 from data_models.pack import Pack
 from .cell import Cell
 
 
+class Rect(NamedTuple):
+    """A half-open rectangle of cells: rows [top, bottom), columns [left, right)."""
+    top   : int
+    left  : int
+    bottom: int
+    right : int
+
+    @classmethod
+    def full(cls, shape: Tuple[int, int]) -> 'Rect':
+        return cls(0, 0, shape[0], shape[1])
+
+    @property
+    def slices(self) -> Tuple[slice, slice]:
+        return slice(self.top, self.bottom), slice(self.left, self.right)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.bottom - self.top, self.right - self.left
+
+    @property
+    def empty(self) -> bool:
+        return self.bottom <= self.top or self.right <= self.left
+
+    def expand(self, halo: int, shape: Tuple[int, int]) -> 'Rect':
+        """Grows the rectangle by `halo` cells on every side, clipped to a map of `shape`."""
+        return Rect(max(self.top - halo, 0), max(self.left - halo, 0), min(self.bottom + halo, shape[0]), min(self.right + halo, shape[1]))
+
+    def union(self, other: 'Rect') -> 'Rect':
+        """The bounding rectangle of both."""
+        return Rect(min(self.top, other.top), min(self.left, other.left), max(self.bottom, other.bottom), max(self.right, other.right))
+
+
 class World(BaseModel):
+    """
+    A generated world.
+
+    The per-cell layers are 2D numpy arrays of shape (height, width). They are
+    serialized to nested lists in JSON mode and accept nested lists on input.
+    """
     width: int
     height: int
     grid: Optional[Grid] = None
     pack: Optional[Pack] = None
-    temperature_map: Optional[List[List[float]]] = None
-    moisture_map: Optional[List[List[float]]] = None
-    height_map: Optional[List[List[float]]] = None
+    temperature_map: Optional[np.ndarray] = None
+    moisture_map: Optional[np.ndarray] = None
+    height_map: Optional[np.ndarray] = None
+    land_mask: Optional[np.ndarray] = None  # True where the cell is land
+    biome_map: Optional[np.ndarray] = None  # Biome id per cell, 0 where no biome applies
     seed: Optional[int] = None
     name: Optional[str] = "Unnamed World"
+    dirty: Dict[str, Rect] = Field(default_factory=dict, exclude=True)  # Edited regions per layer not yet propagated
+
+    class Config:
+        arbitrary_types_allowed = True
+        defer_build = True
+
+    @field_validator('temperature_map', 'moisture_map', 'height_map', mode='before')
+    @classmethod
+    def _coerce_float_map(cls, value):
+        if value is None or isinstance(value, np.ndarray):
+            return value
+        return np.asarray(value, dtype=np.float32)
+
+    @field_validator('land_mask', mode='before')
+    @classmethod
+    def _coerce_mask(cls, value):
+        if value is None or isinstance(value, np.ndarray):
+            return value
+        return np.asarray(value, dtype=bool)
+
+    @field_validator('biome_map', mode='before')
+    @classmethod
+    def _coerce_ids(cls, value):
+        if value is None or isinstance(value, np.ndarray):
+            return value
+        return np.asarray(value, dtype=np.int16)
+
+    @field_serializer('temperature_map', 'moisture_map', 'height_map', 'land_mask', 'biome_map', when_used='json')
+    def _serialize_map(self, value: Optional[np.ndarray]) -> Optional[List[List[float]]]:
+        return None if value is None else value.tolist()
 
     def initialize_grid(self, cells_desired: int, spacing: float):
         """Initialize the Grid for the world."""
@@ -33,16 +104,38 @@ class World(BaseModel):
         """Apply a temperature modifier globally."""
         if self.temperature_map is None:
             raise ValueError("Temperature map has not been initialized.")
-        self.temperature_map = [
-            [temp + modifier for temp in row]
-            for row in self.temperature_map
-        ]
+        self.temperature_map = self.temperature_map + np.float32(modifier)
 
     def update_moisture_map(self, modifier: float):
         """Apply a moisture modifier globally."""
         if self.moisture_map is None:
             raise ValueError("Moisture map has not been initialized.")
-        self.moisture_map = [
-            [moist + modifier for moist in row]
-            for row in self.moisture_map
-        ]
\ No newline at end of file
+        self.moisture_map = self.moisture_map + np.float32(modifier)
+
+    def mark_dirty(self, layer: str, rect: Rect) -> None:
+        """Records that `rect` of `layer` changed and its dependents need updating."""
+        if rect.empty:
+            return
+        current = self.dirty.get(layer)
+        self.dirty[layer] = rect if current is None else current.union(rect)
+
+    def edit_layer(self, layer: str, rect: Rect, values) -> None:
+        """
+        Writes `values` into `rect` of a layer and marks it dirty.
+
+        Read-only layers (e.g. arrays shared with the WorldCache) are copied
+        before the first write.
+
+        Args:
+            layer  (str)       : The layer to edit, e.g. "height_map".
+            rect   (Rect)      : The cells to overwrite.
+            values (array-like): Values broadcastable to the shape of `rect`.
+        """
+        array = getattr(self, layer)
+        if array is None:
+            raise ValueError(f"Layer {layer} has not been initialized.")
+        if not array.flags.writeable:
+            array = array.copy()
+            setattr(self, layer, array)
+        array[rect.slices] = values
+        self.mark_dirty(layer, rect)
@@ -0,0 +1,285 @@
+import functools, secrets, time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+from Core.cache import WorldCache, file_digest
+from Core.climate import climate_reach, moisture_map, temperature_map
+from Core.metrics import GenerationMetrics
+from Core.noise_ops import NoiseGenerator
+from Utilities import configAble
+from data_models.biome import BiomeData
+from data_models.generation import GenerationSettings
+from data_models.world import Rect, World
+
+# A stage mutates the World in place using the generation settings.
+Stage = Callable[[World, GenerationSettings], None]
+
+# A partial update recomputes the stage's outputs inside the given region only.
+StageUpdate = Callable[[World, GenerationSettings, Rect], None]
+
+# Maps a changed region of a stage's inputs to the region of its outputs that changes with it.
+StageReach = Callable[[Rect, GenerationSettings, Tuple[int, int]], Rect]
+
+# Progress callbacks receive (stage name, stage index, total stages).
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class StageSpec(NamedTuple):
+    run        : Stage
+    outputs    : Tuple[str, ...]                        # World layers the stage writes
+    fingerprint: Callable[[GenerationSettings], Any]    # Settings the stage's output depends on
+    inputs     : Tuple[str, ...]                        # World layers the stage reads
+    update     : Optional[StageUpdate]                  # Partial recompute; None reruns the whole stage
+    reach      : StageReach                             # How far an input change spreads into the outputs
+
+
+class WorldFactory:
+    """
+    Builds Worlds by running the registered generation stages in order.
+
+    Stages declare the layers they read and write, which makes the stages a
+    dependency graph: after an edit, `update_world` reruns only the stages
+    downstream of the edited layers, and only over the region they reach.
+    """
+
+    stages: Dict[str, StageSpec] = {}
+
+    @classmethod
+    def register_stage(
+            cls,
+            name: str,
+            stage: Stage,
+            outputs: Tuple[str, ...],
+            fingerprint: Optional[Callable[[GenerationSettings], Any]] = None,
+            inputs: Tuple[str, ...] = (),
+            update: Optional[StageUpdate] = None,
+            reach: Optional[StageReach] = None
+        ):
+        """
+        Register a generation stage. Stages run in registration order, so a
+        stage must be registered after the stages producing its inputs.
+
+        Args:
+            name        (str)            : The name of the stage. (e.g., "heightmap")
+            stage       (Stage)          : Callable that fills in the World's layers.
+            outputs     (Tuple[str, ...]): The World layers the stage writes. These are what gets cached.
+            fingerprint (Callable, optional): Returns the JSON-serializable settings the stage depends on.
+                                              Defaults to the GenerationSettings section named after the stage.
+            inputs      (Tuple[str, ...]): The World layers the stage reads.
+            update      (StageUpdate, optional): Recomputes the outputs inside a region. Without it an
+                                                 input change reruns the whole stage.
+            reach       (StageReach, optional) : Region of the outputs affected by an input change.
+                                                 Defaults to the changed region itself.
+        """
+        if fingerprint is None:
+            fingerprint = lambda settings: getattr(settings, name).model_dump(mode='json')
+        if reach is None:
+            reach = lambda rect, settings, shape: rect
+        cls.stages[name] = StageSpec(stage, tuple(outputs), fingerprint, tuple(inputs), update, reach)
+
+    @classmethod
+    def list_stages(cls) -> List[str]:
+        """
+        Lists all registered stages in execution order.
+
+        Returns:
+            List[str]: A list of registered stage names.
+        """
+        return list(cls.stages.keys())
+
+    @classmethod
+    def dependents(cls, layer: str) -> List[str]:
+        """
+        Lists the stages that must rerun when `layer` changes, in execution order.
+
+        Args:
+            layer (str): A World layer, e.g. "height_map".
+
+        Returns:
+            List[str]: The stages reading the layer, directly or through other stages.
+        """
+        changed, stages = {layer}, []
+        for name, spec in cls.stages.items():
+            if changed.intersection(spec.inputs):
+                stages.append(name)
+                changed.update(spec.outputs)
+        return stages
+
+    @classmethod
+    def update_world(cls, world: World, settings: GenerationSettings) -> Dict[str, Rect]:
+        """
+        Propagates the World's dirty regions through the downstream stages.
+
+        Each affected stage recomputes only the region its reach maps the
+        changed inputs to; stages without a partial update rerun in full.
+        The World's dirty regions are cleared.
+
+        Args:
+            world    (World)             : A generated World with edits recorded in `world.dirty`.
+            settings (GenerationSettings): The settings the World was generated with.
+
+        Returns:
+            Dict[str, Rect]: The changed region of every layer, edited or derived. Anything
+                             derived from those regions (rendered tiles, samples) is stale.
+        """
+        shape = (world.height, world.width)
+        changed: Dict[str, Rect] = dict(world.dirty)
+        for name, spec in cls.stages.items():
+            rects = [changed[layer] for layer in spec.inputs if layer in changed]
+            if not rects:
+                continue
+            started = time.perf_counter()
+            if spec.update is None:
+                spec.run(world, settings)
+                region = Rect.full(shape)
+            else:
+                region = spec.reach(functools.reduce(Rect.union, rects), settings, shape)
+                spec.update(world, settings, region)
+            for layer in spec.outputs:
+                changed[layer] = changed[layer].union(region) if layer in changed else region
+            GenerationMetrics.observe('stage_update_seconds', time.perf_counter() - started, stage=name)
+        world.dirty.clear()
+        return changed
+
+    @classmethod
+    def create_world(
+            cls,
+            settings: GenerationSettings,
+            progress: Optional[ProgressCallback] = None,
+            cache: Optional[WorldCache] = None
+        ) -> World:
+        """
+        Generates a World from the given settings.
+
+        With a cache, each stage's output is looked up by a key chained from the
+        keys of the stages before it, so changing one stage's settings reuses the
+        cached output of every stage upstream of it. Cached arrays are read-only.
+
+        Args:
+            settings (GenerationSettings)        : The generation settings.
+            progress (ProgressCallback, optional): Called before each stage and once more with
+                                                   stage "done". It may raise to abort generation.
+            cache    (WorldCache, optional)      : Cache of stage outputs.
+
+        Returns:
+            World: The generated world.
+        """
+        started = time.perf_counter()
+        seed = settings.seed if settings.seed is not None else secrets.randbits(32)
+        world = World(width=settings.width, height=settings.height, seed=seed, name=settings.name)
+        key = cache.root_key(seed, settings.width, settings.height) if cache is not None else None
+
+        total = len(cls.stages)
+        for index, (name, spec) in enumerate(cls.stages.items()):
+            if progress is not None:
+                progress(name, index, total)
+            stage_started = time.perf_counter()
+            if cache is not None:
+                key = cache.stage_key(key, name, spec.fingerprint(settings))
+                layers = cache.get(key)
+                if layers is not None:
+                    for layer, array in layers.items():
+                        setattr(world, layer, array)
+                    GenerationMetrics.observe('stage_seconds', time.perf_counter() - stage_started, stage=name, cached='true')
+                    continue
+            spec.run(world, settings)
+            if cache is not None:
+                cache.put(key, {layer: getattr(world, layer) for layer in spec.outputs})
+            GenerationMetrics.observe('stage_seconds', time.perf_counter() - stage_started, stage=name, cached='false')
+        if progress is not None:
+            progress("done", total, total)
+
+        elapsed = time.perf_counter() - started
+        GenerationMetrics.observe('generation_seconds', elapsed)
+        if elapsed > 0:
+            GenerationMetrics.observe('cells_per_second', settings.width * settings.height / elapsed)
+        return world
+
+
+def heightmap_stage(world: World, settings: GenerationSettings) -> None:
+    """Builds the height map by applying the configured noise ops to a zeroed map."""
+    height_map = np.zeros((world.height, world.width), dtype=np.float32)
+    for index, op in enumerate(settings.heightmap.ops):
+        height_map = NoiseGenerator.execute_op(op.name, height_map, op.settings, seed=world.seed + index)
+    world.height_map = height_map
+
+
+def _writable(world: World, layer: str) -> np.ndarray:
+    """Returns the layer, copying it first if it is read-only (e.g. shared with the WorldCache)."""
+    array = getattr(world, layer)
+    if not array.flags.writeable:
+        array = array.copy()
+        setattr(world, layer, array)
+    return array
+
+
+def _biome_data_path() -> str:
+    return configAble.ConfigAble().get_config('WorldCache.biome_data_path', default='config_data/biome_data.json')
+
+
+@functools.lru_cache(maxsize=4)
+def _load_biome_data(path: str, digest: Optional[str]) -> BiomeData:
+    biome_data = BiomeData()
+    biome_data.load_from_json(path)
+    return biome_data
+
+
+def load_biome_data(path: Optional[str] = None) -> BiomeData:
+    """
+    Loads biome data once per process, path and file content. Defaults to
+    WorldCache.biome_data_path, the file whose digest keys the biomes stage.
+    """
+    path = path or _biome_data_path()
+    return _load_biome_data(path, file_digest(path))
+
+
+def terrain_stage(world: World, settings: GenerationSettings) -> None:
+    """Splits the height map into land and water at sea level."""
+    world.land_mask = world.height_map > settings.terrain.sea_level
+
+
+def terrain_update(world: World, settings: GenerationSettings, rect: Rect) -> None:
+    _writable(world, 'land_mask')[rect.slices] = world.height_map[rect.slices] > settings.terrain.sea_level
+
+
+def climate_stage(world: World, settings: GenerationSettings) -> None:
+    """Computes the temperature and moisture maps from the height map."""
+    sea_level = settings.terrain.sea_level
+    world.temperature_map = temperature_map(world.height_map, sea_level, settings.climate, seed=world.seed + 1000)
+    world.moisture_map = moisture_map(world.height_map, sea_level, settings.climate, seed=world.seed + 1001)
+
+
+def climate_update(world: World, settings: GenerationSettings, rect: Rect) -> None:
+    sea_level = settings.terrain.sea_level
+    _writable(world, 'temperature_map')[rect.slices] = temperature_map(
+        world.height_map, sea_level, settings.climate, seed=world.seed + 1000, window=rect
+    )
+    _writable(world, 'moisture_map')[rect.slices] = moisture_map(
+        world.height_map, sea_level, settings.climate, seed=world.seed + 1001, window=rect
+    )
+
+
+def biome_stage(world: World, settings: GenerationSettings) -> None:
+    """Classifies every cell into a biome from its temperature, moisture and land/water."""
+    world.biome_map = load_biome_data().classify(world.temperature_map, world.moisture_map, world.land_mask)
+
+
+def biome_update(world: World, settings: GenerationSettings, rect: Rect) -> None:
+    _writable(world, 'biome_map')[rect.slices] = load_biome_data().classify(
+        world.temperature_map[rect.slices], world.moisture_map[rect.slices], world.land_mask[rect.slices]
+    )
+
+
+WorldFactory.register_stage("heightmap", heightmap_stage, outputs=("height_map",))
+WorldFactory.register_stage("terrain", terrain_stage, outputs=("land_mask",), inputs=("height_map",), update=terrain_update)
+WorldFactory.register_stage(
+    "climate", climate_stage, outputs=("temperature_map", "moisture_map"),
+    fingerprint=lambda settings: {"sea_level": settings.terrain.sea_level, **settings.climate.model_dump(mode='json')},
+    inputs=("height_map",), update=climate_update,
+    reach=lambda rect, settings, shape: climate_reach(rect, settings.climate, shape)
+)
+# Only the biomes depend on the biome data, so editing it keeps the upstream stages cached
+WorldFactory.register_stage(
+    "biomes", biome_stage, outputs=("biome_map",), fingerprint=lambda settings: {"biome_data": file_digest(_biome_data_path())},
+    inputs=("temperature_map", "moisture_map", "land_mask"), update=biome_update
+)
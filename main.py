@@ -1,19 +1,172 @@
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+
+from typing import List, Optional
+
+import numpy as np
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from prometheus_fastapi_instrumentator import Instrumentator
+from pydantic import ValidationError
+
+from Core.jobs import JobManager, JobQueueFullError
+from Core.metrics import GenerationMetrics
+from Core.sampling import decode_points, sample_world
+from data_models import Utils
+from data_models.generation import GenerationSettings
+from data_models.job import Job
+from data_models.sampling import SampleRequest, SampleResponse
 
 # Static DEBUG
 DEBUG: bool = True
 
+# Seconds between progress checks on the SSE stream
+EVENT_POLL_INTERVAL: float = 0.1
+
+job_manager = JobManager()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	yield
+	job_manager.shutdown()
+
 app = FastAPI(title="FMG_API",
 	    	version="0.1.0",
 		openapi_url="/openapi.json",
 		servers=[{"url": "http://10.20.0.40:8100"}],
-		debug=DEBUG)
+		debug=DEBUG,
+		lifespan=lifespan)
 
 # Register Prometheus Instrumentator
 Instrumentator().instrument(app).expose(app)
+GenerationMetrics.register_all()
 
 @app.get("/")
 async def root():
 	return {"message": "Hello, World!"}
+
+def _get_job_or_404(job_id: str) -> Job:
+	try:
+		return job_manager.get_job(job_id)
+	except KeyError:
+		raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+
+@contextmanager
+def _result_or_409(job_id: str):
+	"""
+	The finished World of a job. Jobs run by another worker process are
+	served from the shared WorldStore when it has them.
+	"""
+	try:
+		job = job_manager.get_job(job_id)
+	except KeyError:
+		job = None
+	if job is None:
+		try:
+			world = job_manager.store.attach(job_id) if job_manager.store is not None else None
+		except (KeyError, ValueError):
+			world = None
+		if world is None:
+			raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+		try:
+			yield world
+		finally:
+			job_manager.store.release(job_id)
+		return
+	world = job_manager.get_result(job_id)
+	if world is None:
+		raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status.value}")
+	yield world
+
+@app.post("/jobs", status_code=202)
+async def submit_job(settings: GenerationSettings) -> Job:
+	try:
+		return job_manager.submit(settings)
+	except JobQueueFullError as e:
+		raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+	except ValueError as e:
+		raise HTTPException(status_code=422, detail=str(e))
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> Job:
+	return _get_job_or_404(job_id)
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str) -> Job:
+	try:
+		return job_manager.cancel(job_id)
+	except KeyError:
+		raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+	"""Streams per-stage progress as Server-Sent Events until the job finishes."""
+	_get_job_or_404(job_id)
+
+	async def events():
+		sent = 0
+		while True:
+			try:
+				job = job_manager.get_job(job_id)
+			except KeyError:
+				return
+			for event in job.progress[sent:]:
+				yield f"event: progress\ndata: {event.model_dump_json()}\n\n"
+			sent = len(job.progress)
+			if job.is_finished:
+				yield f"event: {job.status.value}\ndata: {job.model_dump_json(exclude={'settings', 'progress'})}\n\n"
+				return
+			await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+	return StreamingResponse(events(), media_type="text/event-stream")
+
+@app.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str):
+	# Sync handler: serializing a large world runs in the threadpool, off the event loop.
+	with _result_or_409(job_id) as world:
+		return JSONResponse(content=Utils.serialize_model_to_dict(world, mode="json"))
+
+@app.post(
+	"/jobs/{job_id}/sample",
+	response_model=SampleResponse,
+	openapi_extra={"requestBody": {"content": {
+		"application/json": {"schema": SampleRequest.model_json_schema()},
+		"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+	}}}
+)
+async def sample_job_result(
+		job_id: str,
+		request: Request,
+		layers: Optional[List[str]] = Query(default=None),
+		interpolate: bool = True
+	):
+	"""
+	Samples the generated World's layers at many points.
+
+	The body is either a SampleRequest (JSON) or, with Content-Type
+	application/octet-stream, little-endian float32 (x, y) pairs, in which
+	case `layers` and `interpolate` come from the query string. A JSON body
+	falls back to the query string for whichever of them it leaves out. With
+	Accept: application/octet-stream the response is the sampled layers as
+	consecutive float32 arrays, in the order listed in the X-Layers header.
+	"""
+	with _result_or_409(job_id) as world:
+		body = await request.body()
+		try:
+			if request.headers.get("content-type", "").startswith("application/octet-stream"):
+				points = decode_points(body)
+			else:
+				sample_request = SampleRequest.model_validate_json(body)
+				points = np.asarray(sample_request.points, dtype=np.float32).reshape(-1, 2)
+				layers = sample_request.layers or layers
+				if sample_request.interpolate is not None:
+					interpolate = sample_request.interpolate
+			samples = await run_in_threadpool(sample_world, world, points, layers, interpolate)
+		except (ValidationError, ValueError) as e:
+			raise HTTPException(status_code=422, detail=str(e))
+
+		if "application/octet-stream" in request.headers.get("accept", ""):
+			content = b"".join(values.astype("<f4", copy=False).tobytes() for values in samples.values())
+			return Response(content=content, media_type="application/octet-stream", headers={"X-Layers": ",".join(samples)})
+		return JSONResponse(content={"count": len(points), "layers": {layer: values.tolist() for layer, values in samples.items()}})
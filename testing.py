@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from Core.noise_ops import *
 
@@ -25,6 +24,7 @@ def display_colored_heightmap(heightmap: np.ndarray, filename: str = "heightmap.
         heightmap: 2D numpy array representing elevation values.
         cmap: Colormap to use for the visualization. Default is 'terrain'.
     """
+    import matplotlib.pyplot as plt # Deferred: matplotlib is only needed when plotting
     plt.figure(figsize=(8, 6))
     plt.imshow(heightmap, cmap=cmap)
     plt.colorbar(label="Elevation")  # Add a colorbar to show the elevation scale
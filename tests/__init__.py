@@ -1,2 +1 @@
 from . import biome_test
-from .. import config_data, data_models, biome_data
\ No newline at end of file
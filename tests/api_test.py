@@ -0,0 +1,117 @@
+import tempfile, unittest
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+import main
+from Core.cache import WorldStore
+from Core.jobs import JobManager
+
+
+class TestJobApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.store_directory = tempfile.TemporaryDirectory()
+        cls.saved_manager = main.job_manager
+        main.job_manager = JobManager(max_workers=1, max_queue_depth=4, max_cells=128 * 128, store=WorldStore(cls.store_directory.name))
+        cls.client = TestClient(main.app).__enter__()
+
+        cls.job = cls.client.post("/jobs", json={"width": 32, "height": 24, "seed": 3}).json()
+        main.job_manager.wait(cls.job["id"], timeout=60)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)  # Runs the lifespan, which shuts the manager down
+        main.job_manager = cls.saved_manager
+        cls.store_directory.cleanup()
+
+    def _sample(self, body, **params):
+        return self.client.post(f"/jobs/{self.job['id']}/sample", json=body, params=params)
+
+    def test_submit_and_poll(self):
+        self.assertEqual(self.job["status"], "queued")
+        response = self.client.get(f"/jobs/{self.job['id']}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "completed")
+
+    def test_events_stream_progress_until_finished(self):
+        response = self.client.get(f"/jobs/{self.job['id']}/events")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("event: progress", response.text)
+        self.assertTrue(response.text.rstrip().split("\n\n")[-1].startswith("event: completed"))
+
+    def test_result(self):
+        response = self.client.get(f"/jobs/{self.job['id']}/result")
+
+        self.assertEqual(response.status_code, 200)
+        world = response.json()
+        self.assertEqual((world["width"], world["height"]), (32, 24))
+        self.assertEqual(np.asarray(world["height_map"]).shape, (24, 32))
+
+    def test_sample_json(self):
+        response = self._sample({"points": [[0, 0], [1.5, 2.5]], "layers": ["height_map", "biome_map"]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(set(response.json()["layers"]), {"height_map", "biome_map"})
+
+    def test_sample_body_falls_back_to_query_interpolate(self):
+        points = [[1.5, 2.5]]
+        nearest = self._sample({"points": points, "layers": ["height_map"], "interpolate": False}).json()
+        bilinear = self._sample({"points": points, "layers": ["height_map"]}).json()
+        from_query = self._sample({"points": points, "layers": ["height_map"]}, interpolate="false").json()
+
+        self.assertEqual(from_query, nearest)
+        self.assertNotEqual(bilinear, nearest)
+
+    def test_sample_binary(self):
+        body = np.array([[0, 0], [3, 4]], dtype="<f4").tobytes()
+        response = self.client.post(
+            f"/jobs/{self.job['id']}/sample", content=body, params={"layers": ["height_map"]},
+            headers={"content-type": "application/octet-stream", "accept": "application/octet-stream"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["x-layers"], "height_map")
+        self.assertEqual(len(np.frombuffer(response.content, dtype="<f4")), 2)
+
+    def test_sample_rejects_bad_input(self):
+        nan = self.client.post(f"/jobs/{self.job['id']}/sample", content='{"points": [[NaN, 1.0]]}', headers={"content-type": "application/json"})
+        self.assertEqual(nan.status_code, 422)
+        self.assertEqual(self._sample({"points": [[1.0, 1.0]], "layers": ["owner"]}).status_code, 422)
+        self.assertEqual(self._sample({"points": "nope"}).status_code, 422)
+
+    def test_submit_rejects_invalid_settings(self):
+        self.assertEqual(self.client.post("/jobs", json={"width": 1024, "height": 1024}).status_code, 422)
+        self.assertEqual(self.client.post("/jobs", json={"heightmap": {"ops": [{"name": "perlin"}]}}).status_code, 422)
+
+    def test_unknown_job_is_404(self):
+        for method, path in [
+            ("get", "/jobs/missing"),
+            ("delete", "/jobs/missing"),
+            ("get", "/jobs/missing/events"),
+            ("get", "/jobs/missing/result"),
+            ("post", "/jobs/missing/sample"),
+        ]:
+            with self.subTest(method=method, path=path):
+                self.assertEqual(self.client.request(method, path, json={"points": [[0, 0]]}).status_code, 404)
+
+    def test_cancel(self):
+        job = self.client.post("/jobs", json={"width": 128, "height": 128, "seed": 9}).json()
+        response = self.client.delete(f"/jobs/{job['id']}")
+
+        self.assertEqual(response.status_code, 200)
+        status = main.job_manager.wait(job["id"], timeout=60).status.value
+        self.assertIn(status, ("cancelled", "completed"))
+
+    def test_metrics(self):
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("fmg_", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
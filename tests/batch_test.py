@@ -0,0 +1,63 @@
+import json, os, tempfile, unittest
+
+import numpy as np
+
+from batch import BatchGenerator, parse_seeds
+from data_models.generation import GenerationSettings
+from factories.world_factory import WorldFactory
+
+
+class TestParseSeeds(unittest.TestCase):
+    def test_range_and_list(self):
+        self.assertEqual(parse_seeds("3:7"), range(3, 7))
+        self.assertEqual(parse_seeds("0:10:5"), range(0, 10, 5))
+        self.assertEqual(parse_seeds("1,5,9"), [1, 5, 9])
+        with self.assertRaises(ValueError):
+            parse_seeds("1:2:3:4")
+
+
+class TestBatchGenerator(unittest.TestCase):
+    def setUp(self):
+        self.output = tempfile.TemporaryDirectory()
+        self.settings = GenerationSettings(width=32, height=24)
+
+    def tearDown(self):
+        self.output.cleanup()
+
+    def generator(self, **kwargs) -> BatchGenerator:
+        return BatchGenerator(self.settings, self.output.name, max_workers=1, max_in_flight=2, **kwargs)
+
+    def test_writes_every_seed(self):
+        report = self.generator().run(range(3))
+
+        self.assertEqual(report.completed, 3)
+        self.assertEqual(set(report.stage_seconds), set(WorldFactory.list_stages()))
+        self.assertGreater(report.peak_rss_bytes, 0)
+        expected = WorldFactory.create_world(self.settings.model_copy(update={'seed': 1}))
+        with np.load(os.path.join(self.output.name, "world_1.npz")) as data:
+            self.assertEqual(int(data['seed']), 1)
+            np.testing.assert_array_equal(data['height_map'], expected.height_map)
+            np.testing.assert_array_equal(data['biome_map'], expected.biome_map)
+
+    def test_resume_skips_finished_seeds(self):
+        self.generator().run(range(3))
+        os.remove(os.path.join(self.output.name, "world_2.npz"))
+
+        report = self.generator().run(range(4))
+
+        self.assertEqual(report.skipped, 2)
+        self.assertEqual(report.completed, 2)
+        with open(os.path.join(self.output.name, "manifest.jsonl")) as file:
+            seeds = [json.loads(line)['seed'] for line in file]
+        self.assertEqual(sorted(set(seeds)), [0, 1, 2, 3])
+
+    def test_refuses_different_settings(self):
+        self.generator().run([0])
+        self.settings = GenerationSettings(width=16, height=16)
+
+        with self.assertRaises(ValueError):
+            self.generator().run([1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from benchmarks import BenchmarkSuite, compare
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_runs_every_benchmark(self):
+        results = BenchmarkSuite.run(sizes=[16], repeats=1, log=lambda line: None)
+        names = [result["name"] for result in results["results"]]
+
+        self.assertEqual(names, BenchmarkSuite.list_benchmarks())
+        for result in results["results"]:
+            self.assertEqual(result["cells"], 256)
+            self.assertGreaterEqual(result["seconds"], 0.0)
+            self.assertGreaterEqual(result["peak_bytes"], 0)
+
+    def test_size_caps_skip_large_runs(self):
+        results = BenchmarkSuite.run(sizes=[2048], names=["grid_construction"], repeats=1, log=lambda line: None)
+
+        self.assertEqual(results["results"], [])
+
+    def test_compare_flags_regressions(self):
+        baseline = {"results": [
+            {"name": "a", "size": 256, "seconds": 1.0, "peak_bytes": 100},
+            {"name": "b", "size": 256, "seconds": 1.0, "peak_bytes": 100},
+        ]}
+        current = {"results": [
+            {"name": "a", "size": 256, "seconds": 1.05, "peak_bytes": 100},
+            {"name": "b", "size": 256, "seconds": 1.50, "peak_bytes": 100},
+            {"name": "c", "size": 256, "seconds": 9.00, "peak_bytes": 100},
+        ]}
+        comparisons = {entry["name"]: entry for entry in compare(current, baseline, time_threshold=0.10)}
+
+        self.assertFalse(comparisons["a"]["regressed"])
+        self.assertTrue(comparisons["b"]["regressed"])
+        self.assertNotIn("c", comparisons)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,28 +1,27 @@
-# from classes.biome import Biome, BiomeData, BiomeMatrix
-# from data_models.enums import BiomeType
 import unittest
 
+from data_models.biome import Biome, BiomeData, BiomeMatrix
+from data_models.enums import BiomeType
+
 # Test Biome class
 class TestBiome(unittest.TestCase):
     def test_biome_initialization(self):
         biome = Biome(
             id=1,
             name="Test Biome",
-            type=BiomeType.BASIC,
+            biome_type=BiomeType.BASIC,
             color="#FFFFFF",
             cost=10,
             habitability=50,
-            max_temp=20,
-            min_temp=-20,
-            max_moisture=100,
-            min_moisture=0,
+            temp_range=(-20, 20),
+            moisture_range=(0, 100),
             icons={"grass": 1},
             options=None
         )
 
         self.assertEqual(biome.id, 1)
         self.assertEqual(biome.name, "Test Biome")
-        self.assertEqual(biome.type, BiomeType.BASIC)
+        self.assertEqual(biome.biome_type, BiomeType.BASIC)
         self.assertEqual(biome.color, "#FFFFFF")
         self.assertEqual(biome.cost, 10)
         self.assertEqual(biome.habitability, 50)
@@ -68,14 +67,12 @@ class TestBiomeData(unittest.TestCase):
         biome = Biome(
             id=1,
             name="Test Biome",
-            type=BiomeType.BASIC,
+            biome_type=BiomeType.BASIC,
             color="#FFFFFF",
             cost=10,
             habitability=50,
-            max_temp=20,
-            min_temp=-20,
-            max_moisture=100,
-            min_moisture=0,
+            temp_range=(-20, 20),
+            moisture_range=(0, 100),
             icons={"grass": 1},
             options=None
         )
@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from Core.climate import distance_to_water, moisture_map, temperature_map
+from data_models.generation import ClimateSettings, GenerationSettings
+from factories.world_factory import WorldFactory
+
+
+def _ridge_map(rows: int = 32, cols: int = 200) -> np.ndarray:
+    """Ocean in the west, flat land rising to a north-south ridge in the middle."""
+    heights = np.full((rows, cols), 0.1, dtype=np.float32)
+    heights[:, :40] = -0.5
+    x = np.arange(cols, dtype=np.float32)
+    heights += np.maximum(0.0, 0.8 - np.abs(x - 120) / 20.0)[None, :]
+    return heights
+
+
+class TestTemperature(unittest.TestCase):
+    def test_colder_towards_poles_and_with_elevation(self):
+        settings = ClimateSettings(temperature_noise=0.0, latitude_range=(0.0, 80.0))
+        heights = np.zeros((64, 8), dtype=np.float32)
+        heights[:, 4:] = 0.5
+        temperature = temperature_map(heights, 0.0, settings)
+
+        self.assertEqual(temperature.dtype, np.float32)
+        self.assertTrue((np.diff(temperature[:, 0]) < 0).all())
+        np.testing.assert_allclose(temperature[:, 0] - temperature[:, 4], 0.5 * 6000.0 * 6.5 / 1000.0, rtol=1e-4)
+
+
+class TestMoisture(unittest.TestCase):
+    def setUp(self):
+        self.settings = ClimateSettings(moisture_noise=0.0, coastal_precipitation=0.0)
+
+    def test_windward_slopes_are_wetter_than_the_rain_shadow(self):
+        moisture = moisture_map(_ridge_map(), 0.0, self.settings)
+        windward, leeward = moisture[:, 110].mean(), moisture[:, 140].mean()
+        self.assertGreater(windward, 2 * leeward)
+        self.assertGreater(moisture[:, 50].mean(), moisture[:, 100].mean())
+
+    def test_wind_direction_mirrors_the_sweep(self):
+        heights = _ridge_map()
+        west = moisture_map(heights, 0.0, self.settings)
+        east = moisture_map(heights[:, ::-1].copy(), 0.0, self.settings.model_copy(update={"wind_from": "east"}))
+        np.testing.assert_allclose(east[:, ::-1], west, rtol=1e-5)
+        north = moisture_map(heights.T.copy(), 0.0, self.settings.model_copy(update={"wind_from": "north"}))
+        np.testing.assert_allclose(north.T, west, rtol=1e-5)
+
+    def test_precipitation_is_capped(self):
+        heights = _ridge_map()
+        heights[:, 100:120] *= 50.0
+        moisture = moisture_map(heights, 0.0, self.settings.model_copy(update={"precipitation_cap": 2000.0}))
+        self.assertLessEqual(moisture.max(), 2000.0)
+        self.assertTrue(np.isfinite(moisture).all())
+
+    def test_distance_to_water(self):
+        water = np.zeros((5, 7), dtype=bool)
+        water[2, 0] = True
+        water[0, 6] = True
+        distance = distance_to_water(water)
+        self.assertEqual(distance[2, 0], 0)
+        self.assertEqual(distance[2, 3], 3)
+        self.assertEqual(distance[4, 6], 4)
+        self.assertGreater(distance_to_water(np.zeros((3, 3), dtype=bool)).min(), 3)
+
+
+class TestClimateStage(unittest.TestCase):
+    def test_generates_climate_layers(self):
+        world = WorldFactory.create_world(GenerationSettings(width=96, height=64, seed=3))
+        for layer in (world.temperature_map, world.moisture_map):
+            self.assertEqual(layer.shape, (64, 96))
+            self.assertEqual(layer.dtype, np.float32)
+            self.assertTrue(np.isfinite(layer).all())
+        self.assertGreaterEqual(world.moisture_map.min(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
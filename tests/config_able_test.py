@@ -0,0 +1,66 @@
+import pickle
+import time
+import unittest
+from datetime import datetime, timezone
+
+from Utilities.configAble import RateLimitedLogger, _TimestampPatcher
+
+
+class _RecordingLogger:
+    def __init__(self):
+        self.records = []
+
+    def opt(self, **kwargs):
+        return self
+
+    def log(self, level, message, *args, **kwargs):
+        self.records.append((level, message.format(*args, **kwargs)))
+
+
+class TestRateLimitedLogger(unittest.TestCase):
+    def test_suppresses_repeats_within_interval(self):
+        recorder = _RecordingLogger()
+        hot_log = RateLimitedLogger(recorder, interval=60.0)
+        for op in ("a", "b", "c"):
+            hot_log.info("Executing noise operation: {}", op)
+        hot_log.warning("Other message")
+
+        self.assertEqual(recorder.records, [("INFO", "Executing noise operation: a"), ("WARNING", "Other message")])
+
+    def test_reports_suppressed_count(self):
+        recorder = _RecordingLogger()
+        hot_log = RateLimitedLogger(recorder, interval=0.05)
+        for tick in range(3):
+            hot_log.info("tick {}", tick)
+        time.sleep(0.06)
+        hot_log.info("tick {}", 3)
+
+        self.assertEqual(recorder.records, [("INFO", "tick 0"), ("INFO", "tick 3 (2 similar suppressed)")])
+
+    def test_bound_operations_and_names_are_limited_separately(self):
+        recorder = _RecordingLogger()
+        hot_log = RateLimitedLogger(recorder, interval=60.0, name="NoiseGenerator")
+        other = RateLimitedLogger(recorder, interval=60.0, name="Other")
+        for op in ("fbm", "erosion", "fbm"):
+            hot_log.bind(op).info("Executing noise operation: {}", op)
+        other.info("Executing noise operation: {}", "fbm")
+
+        self.assertEqual(recorder.records, [
+            ("INFO", "Executing noise operation: fbm"),
+            ("INFO", "Executing noise operation: erosion"),
+            ("INFO", "Executing noise operation: fbm"),
+        ])
+        self.assertIs(hot_log.bind("fbm"), hot_log.bind("fbm"))
+
+
+class TestTimestampPatcher(unittest.TestCase):
+    def test_formats_and_survives_pickling(self):
+        patcher = pickle.loads(pickle.dumps(_TimestampPatcher(timezone.utc, "%Y-%m-%d %H:%M:%S")))
+        record = {"time": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "extra": {}}
+        patcher(record)
+
+        self.assertEqual(record["extra"]["timestamp"], "2024-01-02 03:04:05")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import io, json, unittest
+
+import numpy as np
+
+from Core.contours import isolines, marching_squares, simplify, trace, write_geojson, write_svg
+from Core.noise_ops import NoiseGenerator
+
+
+class TestIsolines(unittest.TestCase):
+    def setUp(self):
+        rows, cols = np.mgrid[0:64, 0:64]
+        self.bump = (10 - np.hypot(cols - 30.3, rows - 20.7)).astype(np.float32)  # Zero on a circle of radius 10
+
+    def test_closed_ring_around_high_ground(self):
+        lines = list(isolines(self.bump, [0.0]))
+
+        self.assertEqual(len(lines), 1)
+        ring = lines[0]
+        self.assertTrue(ring.closed)
+        np.testing.assert_array_equal(ring.points[0], ring.points[-1])
+        np.testing.assert_allclose(np.hypot(ring.points[:, 0] - 30.3, ring.points[:, 1] - 20.7), 10, atol=0.1)
+        # High ground on the left: anticlockwise as drawn, which is a negative shoelace sum with y downwards
+        x, y = ring.points[:, 0], ring.points[:, 1]
+        self.assertLess(np.sum(x[:-1] * y[1:] - x[1:] * y[:-1]), 0)
+
+    def test_open_line_ends_on_the_border(self):
+        rows, cols = np.mgrid[0:16, 0:16]
+        lines = list(isolines((cols - 7.5).astype(np.float32), [0.0]))
+
+        self.assertEqual(len(lines), 1)
+        self.assertFalse(lines[0].closed)
+        np.testing.assert_allclose(lines[0].points, [[7.5, row] for row in range(16)])
+
+    def test_noise_chains_are_continuous_and_use_every_segment(self):
+        height = NoiseGenerator.execute_op("fbm", np.zeros((256, 256), dtype=np.float32), {"scale": 32.0}, seed=3)
+        starts, ends = marching_squares(height, 0.0)
+        points, offsets, closed = trace(height, 0.0)
+
+        self.assertEqual(len(np.unique(starts)), len(starts))  # Every crossing starts exactly one segment
+        self.assertEqual(len(points), len(starts) + len(closed))
+        for index in range(len(closed)):
+            line = points[offsets[index]:offsets[index + 1]]
+            self.assertTrue(np.all(np.abs(np.diff(line, axis=0)) <= 1.0))
+            if closed[index]:
+                np.testing.assert_array_equal(line[0], line[-1])
+            else:
+                self.assertTrue(np.any((line[[0, -1]] <= 0) | (line[[0, -1]] >= 255)))
+
+
+class TestSimplify(unittest.TestCase):
+    def test_keeps_corners_and_points_beyond_tolerance(self):
+        points = np.array([[0, 0], [1, 0.05], [2, 0], [2, 1], [2, 2], [1, 2.4], [0, 2]], dtype=np.float64)
+        simplified, offsets = simplify(points, np.array([0, 4, 7]), 0.1)
+
+        np.testing.assert_array_equal(offsets, [0, 3, 6])
+        np.testing.assert_array_equal(simplified, [[0, 0], [2, 0], [2, 1], [2, 2], [1, 2.4], [0, 2]])
+
+    def test_result_stays_within_tolerance(self):
+        rows, cols = np.mgrid[0:64, 0:64]
+        bump = (20 - np.hypot(cols - 31.7, rows - 32.2)).astype(np.float32)
+        full = next(isolines(bump, [0.0])).points
+        simple = next(isolines(bump, [0.0], tolerance=0.5)).points
+
+        self.assertLess(len(simple), len(full) / 3)
+        # Every dropped point lies within the tolerance of the simplified ring
+        a, b = simple[:-1], simple[1:]
+        chord = b - a
+        t = np.clip(np.einsum('pij,ij->pi', full[:, None] - a, chord) / np.einsum('ij,ij->i', chord, chord), 0, 1)
+        nearest = np.linalg.norm(full[:, None] - (a + t[..., None] * chord), axis=2).min(axis=1)
+        self.assertLessEqual(nearest.max(), 0.5 + 1e-9)
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        rows, cols = np.mgrid[0:32, 0:48]
+        self.height = (8 - np.hypot(cols - 24.5, rows - 16.5)).astype(np.float32)
+
+    def test_geojson_streams_valid_feature_collection(self):
+        buffer = io.StringIO()
+        count = write_geojson(isolines(self.height, [0.0, 4.0]), buffer, shape=self.height.shape, bounds=(-10, -5, 10, 5))
+        document = json.loads(buffer.getvalue())
+
+        self.assertEqual(count, 2)
+        self.assertEqual([feature["properties"]["level"] for feature in document["features"]], [0.0, 4.0])
+        coordinates = np.array(document["features"][0]["geometry"]["coordinates"])
+        self.assertTrue(np.all((coordinates[:, 0] > -10) & (coordinates[:, 0] < 10) & (coordinates[:, 1] > -5) & (coordinates[:, 1] < 5)))
+
+    def test_svg_writes_one_path_per_polyline(self):
+        buffer = io.StringIO()
+        count = write_svg(isolines(self.height, [0.0, 4.0]), buffer, self.height.shape)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(buffer.getvalue().count("<path"), 2)
+        self.assertIn('viewBox="0 0 48 32"', buffer.getvalue())
+        self.assertEqual(buffer.getvalue().count(" Z\""), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from Core.noise_ops import NoiseGenerator, erosion, fbm_noise, hydraulic_erosion, thermal_erosion
+
+
+def _heightmap(size: int = 96) -> np.ndarray:
+    return fbm_noise(np.zeros((size, size), dtype=np.float32), {"scale": 32.0}, seed=7)
+
+
+class TestErosionOps(unittest.TestCase):
+    def test_ops_are_registered(self):
+        self.assertIn("thermal_erosion", NoiseGenerator.list_ops())
+        self.assertIn("hydraulic_erosion", NoiseGenerator.list_ops())
+
+    def test_erodes_float32_buffers_in_place(self):
+        for op in (thermal_erosion, hydraulic_erosion):
+            with self.subTest(op=op.__name__):
+                heights = _heightmap()
+                self.assertIs(op(heights, {"iterations": 5}), heights)
+
+    def test_copies_other_inputs(self):
+        heights = _heightmap().astype(np.float64)
+        result = thermal_erosion(heights, {"iterations": 5})
+        self.assertIsNot(result, heights)
+        self.assertEqual(result.dtype, np.float32)
+
+    def test_thermal_erosion_conserves_material_and_flattens_slopes(self):
+        heights = _heightmap()
+        before_sum, before_slope = heights.sum(dtype=np.float64), np.abs(np.diff(heights)).max()
+        thermal_erosion(heights, {"iterations": 50})
+        self.assertAlmostEqual(heights.sum(dtype=np.float64), before_sum, places=2)
+        self.assertLess(np.abs(np.diff(heights)).max(), before_slope)
+
+    def test_hydraulic_erosion_conserves_material_and_stays_stable(self):
+        heights = _heightmap()
+        original = heights.copy()
+        before_slope = np.abs(np.diff(heights)).max()
+        hydraulic_erosion(heights, {"iterations": 200})
+        self.assertTrue(np.isfinite(heights).all())
+        self.assertAlmostEqual(heights.sum(dtype=np.float64), original.sum(dtype=np.float64), places=1)
+        self.assertGreater(np.abs(heights - original).max(), 0.0)
+        self.assertLessEqual(np.abs(np.diff(heights)).max(), before_slope)
+
+    def test_time_budget_stops_early(self):
+        started = time.perf_counter()
+        hydraulic_erosion(_heightmap(), {"iterations": 10 ** 6, "time_budget": 0.1})
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+    def test_tiled_matches_untiled(self):
+        for op in (thermal_erosion, hydraulic_erosion):
+            with self.subTest(op=op.__name__):
+                heights = _heightmap()
+                expected = op(heights.copy(), {"iterations": 10})
+                tiled = op(heights, {"iterations": 10, "tile_size": 32, "workers": 2})
+                self.assertIs(tiled, heights)
+                np.testing.assert_allclose(tiled, expected, atol=1e-6)
+
+    def test_tiled_time_budget_runs_the_same_iterations_in_every_tile(self):
+        chosen = []
+
+        def record(*args, **kwargs):
+            chosen.append(tiled_iterations(*args, **kwargs))
+            return chosen[-1]
+
+        tiled_iterations = erosion._tiled_iterations
+        heights = _heightmap()
+        expected = heights.copy()
+        started = time.perf_counter()
+        with mock.patch.object(erosion, "_tiled_iterations", side_effect=record):
+            hydraulic_erosion(heights, {"iterations": 10 ** 6, "time_budget": 0.2, "tile_size": 32, "workers": 2})
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+        self.assertLess(chosen[0], 10 ** 6)
+        hydraulic_erosion(expected, {"iterations": chosen[0]})
+        np.testing.assert_allclose(heights, expected, atol=1e-5)
+
+    def test_tiled_time_budget_sizes_tiles_by_the_iterations_chosen(self):
+        heights = _heightmap(256)
+        started = time.perf_counter()
+        hydraulic_erosion(heights.copy(), {"iterations": 3})
+        untiled_iterations = 0.5 * 3 / (time.perf_counter() - started)
+
+        chosen = erosion._tiled_iterations(hydraulic_erosion, heights, {}, 10 ** 6, 64, 2, 0.5)
+
+        # Halos add ~4x the cells here; halos sized for the requested 10**6
+        # iterations would cover the whole map in every tile, ~16x
+        self.assertGreater(chosen, untiled_iterations / 8)
+
+    def test_runs_through_heightmap_pipeline(self):
+        heights = NoiseGenerator.execute_op("thermal_erosion", _heightmap(), {"iterations": 3}, seed=1)
+        self.assertEqual(heights.shape, (96, 96))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from prometheus_client import REGISTRY
+
+from Core.metrics import GenerationMetrics, peak_rss_bytes
+from Core.noise_ops import NoiseGenerator
+
+import numpy as np
+
+
+def _count(op: str) -> float:
+    return REGISTRY.get_sample_value('fmg_noise_op_duration_seconds_count', {'op': op}) or 0.0
+
+
+class TestGenerationMetrics(unittest.TestCase):
+    def test_execute_op_is_timed(self):
+        before = _count('fbm')
+        NoiseGenerator.execute_op('fbm', np.zeros((8, 8), dtype=np.float32), {'octaves': 1})
+
+        self.assertEqual(_count('fbm'), before + 1)
+
+    def test_buffered_samples_replay_into_registry(self):
+        before = _count('fbm')
+        GenerationMetrics.start_buffering()
+        NoiseGenerator.execute_op('fbm', np.zeros((8, 8), dtype=np.float32), {'octaves': 1})
+        samples = GenerationMetrics.drain()
+
+        self.assertEqual(_count('fbm'), before)
+        GenerationMetrics.replay(samples)
+        self.assertEqual(_count('fbm'), before + 1)
+
+    def test_peak_rss_is_positive(self):
+        self.assertGreater(peak_rss_bytes(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
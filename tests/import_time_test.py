@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds each import may take in a fresh interpreter once numpy and pydantic,
+# which every module here needs, are already loaded: about 1.5x the time
+# measured on a development machine (8, 37, 91, 179 and 175 ms), so a
+# regression of that size fails. The best of PROBE_RUNS runs is compared.
+IMPORT_BUDGETS = {
+    "Utilities.configAble": 0.015,
+    "Core.noise_ops": 0.060,
+    "data_models": 0.140,
+    "factories.world_factory": 0.270,
+    "Core.jobs": 0.260,
+}
+PROBE_RUNS = 3
+
+# Modules none of the above may import
+HEAVY_MODULES = ('loguru', 'yaml', 'matplotlib', 'prometheus_client', 'scipy', 'fastapi')
+
+PROBE = """
+import json, os, sys, time
+import numpy, pydantic.main
+log_size = os.path.getsize('Logs/global.log') if os.path.exists('Logs/global.log') else 0
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+from Utilities.configAble import ConfigAble
+print(json.dumps({{
+    'elapsed': elapsed,
+    'config_loaded': ConfigAble._instance is not None and ConfigAble._instance._config is not None,
+    'heavy_modules': [name for name in {heavy_modules!r} if name in sys.modules],
+    'log_written': (os.path.getsize('Logs/global.log') if os.path.exists('Logs/global.log') else 0) != log_size,
+}}))
+"""
+
+
+def _probe(module: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy_modules=HEAVY_MODULES)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    def test_imports_are_within_budget_and_side_effect_free(self):
+        for module, budget in IMPORT_BUDGETS.items():
+            with self.subTest(module=module):
+                results = [_probe(module) for _ in range(PROBE_RUNS)]
+                result = results[0]
+
+                self.assertLess(min(run["elapsed"] for run in results), budget)
+                self.assertFalse(result["config_loaded"])
+                self.assertEqual(result["heavy_modules"], [])
+                self.assertFalse(result["log_written"])
+
+
+if __name__ == "__main__":
+    unittest.main()
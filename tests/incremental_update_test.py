@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from data_models.generation import GenerationSettings
+from data_models.world import Rect
+from factories.world_factory import WorldFactory
+
+DERIVED_LAYERS = ("land_mask", "temperature_map", "moisture_map", "biome_map")
+
+
+class TestIncrementalUpdate(unittest.TestCase):
+    def _edit_and_compare(self, settings: GenerationSettings, rect: Rect):
+        world = WorldFactory.create_world(settings)
+        before = {layer: getattr(world, layer).copy() for layer in DERIVED_LAYERS}
+        world.edit_layer("height_map", rect, world.height_map[rect.slices] + 0.4)
+
+        changed = WorldFactory.update_world(world, settings)
+
+        reference = world.model_copy()
+        for stage in WorldFactory.dependents("height_map"):
+            WorldFactory.stages[stage].run(reference, settings)
+        for layer in DERIVED_LAYERS:
+            # The coastal bonus only looks for water within its reach, so moisture may be off by < 1% of it
+            tolerance = 0.01 * settings.climate.coastal_precipitation if layer == "moisture_map" else 1e-3
+            np.testing.assert_allclose(getattr(world, layer), getattr(reference, layer), atol=tolerance, err_msg=layer)
+
+            # Nothing outside the reported region changed
+            outside = np.ones(getattr(world, layer).shape, dtype=bool)
+            outside[changed[layer].slices] = False
+            np.testing.assert_array_equal(getattr(world, layer)[outside], before[layer][outside], err_msg=layer)
+        self.assertEqual(world.dirty, {})
+        return changed
+
+    def test_partial_update_matches_full_regeneration(self):
+        for wind in ("west", "east", "north", "south"):
+            with self.subTest(wind=wind):
+                settings = GenerationSettings(width=192, height=160, seed=11, climate={"wind_from": wind})
+                self._edit_and_compare(settings, Rect(60, 70, 80, 90))
+
+    def test_update_is_limited_to_the_reach_of_the_edit(self):
+        settings = GenerationSettings(width=400, height=400, seed=5, climate={"coastal_distance": 10.0})
+        changed = self._edit_and_compare(settings, Rect(100, 100, 120, 120))
+
+        self.assertEqual(changed["land_mask"], Rect(100, 100, 120, 120))
+        # Coastal reach of 50 cells on every side, and downwind (west wind) to the map edge
+        self.assertEqual(changed["moisture_map"], Rect(50, 50, 170, 400))
+        self.assertEqual(changed["biome_map"], changed["moisture_map"])
+
+    def test_dependency_graph(self):
+        self.assertEqual(WorldFactory.dependents("height_map"), ["terrain", "climate", "biomes"])
+        self.assertEqual(WorldFactory.dependents("moisture_map"), ["biomes"])
+        self.assertEqual(WorldFactory.dependents("biome_map"), [])
+
+    def test_edit_copies_read_only_layers(self):
+        settings = GenerationSettings(width=64, height=64, seed=2)
+        world = WorldFactory.create_world(settings)
+        shared = world.height_map
+        shared.flags.writeable = False
+
+        world.edit_layer("height_map", Rect(0, 0, 4, 4), 1.0)
+
+        self.assertIsNot(world.height_map, shared)
+        self.assertFalse((shared[:4, :4] == 1.0).all())
+        self.assertEqual(world.dirty["height_map"], Rect(0, 0, 4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import os, pickle, signal, tempfile, time, unittest
+
+import numpy as np
+from pydantic import ValidationError
+
+from Core.cache import WorldStore
+from Core.jobs import WORKER_PRELOAD, JobManager, JobQueueFullError, default_start_method, worker_context
+from Utilities.configAble import ConfigAble
+from data_models.enums import JobStatus
+from data_models.generation import GenerationSettings, HeightmapSettings, NoiseOpSettings
+from factories.world_factory import WorldFactory
+
+
+class TestWorldFactory(unittest.TestCase):
+    def test_create_world_is_deterministic(self):
+        settings = GenerationSettings(width=64, height=48, seed=7)
+        first  = WorldFactory.create_world(settings)
+        second = WorldFactory.create_world(settings)
+
+        self.assertEqual(first.height_map.shape, (48, 64))
+        self.assertEqual(first.height_map.dtype, np.float32)
+        np.testing.assert_array_equal(first.height_map, second.height_map)
+        np.testing.assert_array_equal(first.land_mask, first.height_map > 0.0)
+
+    def test_progress_reports_every_stage(self):
+        stages = []
+        WorldFactory.create_world(GenerationSettings(width=16, height=16, seed=1), progress=lambda stage, i, n: stages.append(stage))
+
+        self.assertEqual(stages, WorldFactory.list_stages() + ["done"])
+
+
+class TestGenerationSettings(unittest.TestCase):
+    def test_rejects_unknown_ops_and_settings_over_the_limits(self):
+        for name, settings in [
+            ("perlin", {}),
+            ("fbm", {"octaves": 64}),
+            ("hydraulic_erosion", {"iterations": 100000}),
+            ("thermal_erosion", {"workers": 1000}),
+            ("thermal_erosion", {"tile_size": -1}),
+        ]:
+            with self.subTest(name=name, settings=settings), self.assertRaises(ValidationError):
+                GenerationSettings(heightmap=HeightmapSettings(ops=[{"name": name, "settings": settings}]))
+
+    def test_accepted_settings_are_passed_on_as_given(self):
+        op = NoiseOpSettings(name="hydraulic_erosion", settings={"iterations": 20, "rain": 0.02})
+        self.assertEqual(op.settings, {"iterations": 20, "rain": 0.02})
+
+
+class TestJobManager(unittest.TestCase):
+    def setUp(self):
+        self.store_directory = tempfile.TemporaryDirectory()
+        self.store = WorldStore(self.store_directory.name)
+        self.manager = JobManager(max_workers=1, max_queue_depth=2, max_cells=512 * 512, store=self.store)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        self.store_directory.cleanup()
+
+    def test_submit_and_complete(self):
+        job = self.manager.submit(GenerationSettings(width=32, height=32, seed=3))
+        job = self.manager.wait(job.id, timeout=60)
+
+        self.assertEqual(job.status, JobStatus.COMPLETED)
+        self.assertEqual(self.manager.get_result(job.id).height_map.shape, (32, 32))
+
+    def test_rejects_oversized_world(self):
+        with self.assertRaises(ValueError):
+            self.manager.submit(GenerationSettings(width=1024, height=1024))
+
+    def test_queue_depth_limit_and_cancel(self):
+        first  = self.manager.submit(GenerationSettings(width=512, height=512, seed=5))
+        second = self.manager.submit(GenerationSettings(width=512, height=512, seed=6))
+        with self.assertRaises(JobQueueFullError):
+            self.manager.submit(GenerationSettings(width=512, height=512, seed=7))
+
+        self.manager.cancel(second.id)
+        self.assertEqual(self.manager.wait(second.id, timeout=60).status, JobStatus.CANCELLED)
+        self.assertIsNone(self.manager.get_result(second.id))
+        self.manager.wait(first.id, timeout=60)
+
+    def test_evicted_and_shut_down_jobs_leave_the_store(self):
+        self.manager.max_stored_results = 1
+        first = self.manager.submit(GenerationSettings(width=32, height=32, seed=1))
+        self.manager.wait(first.id, timeout=60)
+        self.assertEqual(self.store.list_worlds(), [first.id])
+
+        second = self.manager.submit(GenerationSettings(width=32, height=32, seed=2))
+        self.manager.wait(second.id, timeout=60)
+        self.assertEqual(self.store.list_worlds(), [second.id])
+        with self.assertRaises(KeyError):
+            self.manager.get_job(first.id)
+
+        self.manager.shutdown()
+        self.assertEqual(self.store.list_worlds(), [])
+
+    def test_recovers_from_a_killed_worker(self):
+        job = self.manager.submit(GenerationSettings(width=512, height=512, seed=4))
+        deadline = time.monotonic() + 60
+        while not self.manager._executor._processes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for pid in list(self.manager._executor._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        self.assertEqual(self.manager.wait(job.id, timeout=60).status, JobStatus.FAILED)
+        self.assertEqual(self.manager.queue_depth, 0)
+
+        job = self.manager.submit(GenerationSettings(width=32, height=32, seed=3))
+        self.assertEqual(self.manager.wait(job.id, timeout=60).status, JobStatus.COMPLETED)
+
+
+class TestJobManagerWithoutEnqueuedLogging(unittest.TestCase):
+    def setUp(self):
+        self.config_manager = ConfigAble()
+        self.saved_config = self.config_manager.config
+        self.config_manager.config = {**self.saved_config, 'Logger': {**self.saved_config['Logger'], 'enqueue': False}}
+        self.store_directory = tempfile.TemporaryDirectory()
+        self.manager = JobManager(max_workers=1, max_queue_depth=2, max_cells=512 * 512, store=WorldStore(self.store_directory.name))
+
+    def tearDown(self):
+        self.manager.shutdown()
+        self.store_directory.cleanup()
+        self.config_manager.config = self.saved_config
+
+    def test_workers_configure_their_own_logger(self):
+        self.assertIsNone(self.config_manager.share_logger())
+        pickle.dumps((self.config_manager.config, self.config_manager.share_logger()))
+
+        job = self.manager.submit(GenerationSettings(width=32, height=32, seed=3))
+        job = self.manager.wait(job.id, timeout=60)
+
+        self.assertEqual(job.status, JobStatus.COMPLETED)
+
+
+class TestWorker(unittest.TestCase):
+    def test_worker_context_preloads_shared_and_caller_modules(self):
+        context = worker_context(default_start_method(), ['batch.runner'])
+
+        self.assertEqual(context.get_start_method(), default_start_method())
+        if default_start_method() == 'forkserver':
+            from multiprocessing import forkserver
+            self.assertEqual(forkserver._forkserver._preload_modules, [*WORKER_PRELOAD, 'batch.runner'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from data_models import Cell, Records
+from data_models.common import expandable
+from data_models.grid import Grid
+from data_models.enums import TerrainType
+from data_models.models import Burg
+
+
+class TestConstructBatch(unittest.TestCase):
+    def test_matches_validated_construction(self):
+        trusted = Cell.construct_batch({"id": [1, 2], "name": ["a", "b"], "height": [0.5, 1.5], "terrain": [TerrainType.LAND] * 2})
+        validated = [Cell(id=1, name="a", height=0.5, terrain=TerrainType.LAND), Cell(id=2, name="b", height=1.5, terrain=TerrainType.LAND)]
+
+        self.assertEqual(trusted, validated)
+        self.assertEqual(trusted[0].model_dump(), validated[0].model_dump())
+        self.assertEqual(trusted[0].model_fields_set, validated[0].model_fields_set)
+        self.assertEqual(list(trusted[0].__dict__), list(validated[0].__dict__))
+
+    def test_mutable_defaults_are_not_shared(self):
+        first, second = Cell.construct_batch({"id": [1, 2]})
+        first.neighbors.append(2)
+        self.assertEqual(second.neighbors, [])
+
+    def test_unknown_columns_become_extras(self):
+        burg = Burg.construct_batch({"id": [7], "population": [1200]})[0]
+        self.assertEqual(burg.population, 1200)
+        self.assertEqual(burg, Burg(id=7, population=1200))
+
+    def test_assignment_updates_only_that_instance(self):
+        first, second = Cell.construct_batch({"id": [1, 2]})
+        first.height = 3.0
+        self.assertIn("height", first.model_fields_set)
+        self.assertNotIn("height", second.model_fields_set)
+
+    def test_missing_required_field_raises(self):
+        with self.assertRaises(ValueError):
+            Cell.construct_batch({"name": ["a"]})
+
+    def test_private_attributes_get_their_defaults(self):
+        class Tracked(expandable):
+            _visits: list = PrivateAttr(default_factory=list)
+            _owner: str = PrivateAttr(default="none")
+
+        first, second = Tracked.construct_batch({"id": [1, 2], "_owner": ["a", "b"]})
+        first._visits.append(1)
+
+        self.assertEqual(second._visits, [])
+        self.assertEqual((first._owner, second._owner), ("a", "b"))
+        self.assertEqual(first.__pydantic_private__, Tracked.model_construct(id=1, _owner="a", _visits=[1]).__pydantic_private__)
+        self.assertEqual(first.__pydantic_extra__, {})
+
+
+class TestRecords(unittest.TestCase):
+    def setUp(self):
+        self.records = Records(Cell, {"id": np.arange(10), "height": np.linspace(0, 1, 10, dtype=np.float32)})
+
+    def test_rows_convert_on_demand(self):
+        cell = self.records[3]
+        self.assertIsInstance(cell, Cell)
+        self.assertIs(type(cell.id), int)
+        self.assertIs(type(cell.height), float)
+        self.assertEqual(cell.id, 3)
+        self.assertEqual(self.records[-1].id, 9)
+        with self.assertRaises(IndexError):
+            self.records[10]
+
+    def test_iteration_and_bulk_conversion_agree(self):
+        self.assertEqual(len(self.records), 10)
+        self.assertEqual(list(self.records), self.records.to_models())
+        np.testing.assert_array_equal(self.records.column("id"), np.arange(10))
+
+    def test_columns_must_have_equal_lengths(self):
+        with self.assertRaises(ValueError):
+            Records(Cell, {"id": [1, 2], "height": [0.5]})
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(width=3, height=2)
+
+    def test_cells_are_records_built_on_access(self):
+        self.assertIsInstance(self.grid.cells, Records)
+        self.assertEqual(len(self.grid.cells), 6)
+        cell = self.grid.cells[4]
+        self.assertEqual(cell.name, "1-1")
+        self.assertEqual(cell.id, hash("1-1"))
+        self.assertEqual(self.grid.get_cell(cell.id), cell)
+        self.assertIsNone(self.grid.get_cell(12345))
+
+    def test_neighbors_in_grid_order(self):
+        ids = {name: hash(name) for name in ("0-0", "0-1", "0-2", "1-0", "1-1", "1-2")}
+        self.assertEqual(self.grid.cells[0].neighbors, [ids["0-1"], ids["1-0"], ids["1-1"]])
+        self.assertEqual(self.grid.cells[4].neighbors, [ids["1-0"], ids["1-2"], ids["0-1"], ids["0-0"], ids["0-2"]])
+
+    def test_serializes_rows_of_cells_and_validates_them_back(self):
+        data = self.grid.model_dump(mode="json")
+        self.assertEqual([[cell["name"] for cell in row] for row in data["cells"]], [["0-0", "0-1", "0-2"], ["1-0", "1-1", "1-2"]])
+
+        restored = Grid.model_validate(data)
+        self.assertEqual(restored.cells.to_models(), self.grid.cells.to_models())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from Core.sampling import decode_points, sample_world
+from data_models.world import World
+
+
+class TestSampleWorld(unittest.TestCase):
+    def setUp(self):
+        heights = np.arange(12, dtype=np.float32).reshape(3, 4)  # height = 4 * row + column
+        self.world = World(width=4, height=3, height_map=heights, land_mask=heights > 5, biome_map=np.arange(12, dtype=np.int16).reshape(3, 4))
+
+    def test_bilinear_matches_cell_centres_and_interpolates_between_them(self):
+        points = np.array([[0, 0], [3, 2], [1.5, 0], [2, 1.25], [0.5, 0.5]], dtype=np.float32)
+        heights = sample_world(self.world, points, ["height_map"])["height_map"]
+        np.testing.assert_allclose(heights, [0, 11, 1.5, 7, 2.5])
+
+    def test_nearest_for_categorical_and_when_not_interpolating(self):
+        points = np.array([[1.4, 0.6], [2.6, 1.4]], dtype=np.float32)
+        samples = sample_world(self.world, points, ["height_map", "biome_map", "land_mask"], interpolate=False)
+        np.testing.assert_array_equal(samples["height_map"], [5, 7])
+        np.testing.assert_array_equal(samples["biome_map"], [5, 7])
+        np.testing.assert_array_equal(samples["land_mask"], [False, True])
+
+    def test_points_outside_the_map_are_clamped(self):
+        points = np.array([[-10, -10], [100, 100]], dtype=np.float32)
+        np.testing.assert_allclose(sample_world(self.world, points, ["height_map"])["height_map"], [0, 11])
+
+    def test_defaults_to_every_generated_layer(self):
+        self.assertEqual(set(sample_world(self.world, np.zeros((1, 2)))), {"height_map", "land_mask", "biome_map"})
+
+    def test_rejects_unknown_missing_or_malformed_input(self):
+        with self.assertRaises(ValueError):
+            sample_world(self.world, np.zeros((1, 2)), ["owner"])
+        with self.assertRaises(ValueError):
+            sample_world(self.world, np.zeros((1, 2)), ["moisture_map"])
+        with self.assertRaises(ValueError):
+            sample_world(self.world, np.zeros((2, 3)))
+        for bad in (np.nan, np.inf, -np.inf):
+            with self.assertRaises(ValueError):
+                sample_world(self.world, np.array([[1.0, 1.0], [bad, 2.0]]))
+
+    def test_decode_points(self):
+        points = np.array([[1.5, 2.5], [3.0, 4.0]], dtype='<f4')
+        np.testing.assert_array_equal(decode_points(points.tobytes()), points)
+        with self.assertRaises(ValueError):
+            decode_points(b"\x00" * 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import json, os, shutil, tempfile, unittest
+from unittest import mock
+
+import numpy as np
+
+from Core.cache import DiskStore, LRUByteCache, WorldCache
+from Utilities.configAble import ConfigAble
+from data_models.generation import GenerationSettings, TerrainSettings
+from factories.world_factory import WorldFactory
+
+
+class TestLRUByteCache(unittest.TestCase):
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = LRUByteCache(max_bytes=2 * 400)
+        cache.put("a", {"layer": np.zeros(100, dtype=np.float32)})
+        cache.put("b", {"layer": np.zeros(100, dtype=np.float32)})
+        cache.get("a")
+        cache.put("c", {"layer": np.zeros(100, dtype=np.float32)})
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.current_bytes, 800)
+
+    def test_stored_arrays_are_read_only(self):
+        cache = LRUByteCache(max_bytes=1024)
+        cache.put("a", {"layer": np.zeros(4, dtype=np.float32)})
+
+        with self.assertRaises(ValueError):
+            cache.get("a")["layer"][0] = 1.0
+
+    def test_arrays_too_large_to_store_are_read_only_too(self):
+        cache = LRUByteCache(max_bytes=8)
+        layer = np.zeros(4, dtype=np.float32)
+        cache.put("a", {"layer": layer})
+
+        self.assertNotIn("a", cache)
+        self.assertFalse(layer.flags.writeable)
+
+
+class TestDiskStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DiskStore(self.tmp.name, max_bytes=1024 ** 2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_entry_evicted_after_loading_is_still_returned(self):
+        self.store.put("ab12", {"layer": np.arange(4, dtype=np.float32)})
+        with mock.patch("Core.cache.world_cache.os.utime", side_effect=FileNotFoundError):
+            layers = self.store.get("ab12")
+
+        np.testing.assert_array_equal(layers["layer"], np.arange(4, dtype=np.float32))
+
+    def test_scans_for_eviction_only_after_enough_writes(self):
+        store = DiskStore(self.tmp.name, max_bytes=64 * 1024)
+        with mock.patch.object(store, "_evict", wraps=store._evict) as evict:
+            for index in range(64):
+                store.put(f"{index:04x}", {"layer": np.zeros(256, dtype=np.float32)})
+
+        total = sum(entry.stat().st_size for entry in store.path.rglob("*.npz"))
+        self.assertLessEqual(evict.call_count, 16)
+        self.assertLessEqual(total, store.max_bytes + store.max_bytes // store.SCAN_FRACTION)
+        self.assertIsNone(store.get("0000"))
+        self.assertIsNotNone(store.get("003f"))
+
+
+class TestWorldCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = WorldCache(memory_bytes=64 * 1024 ** 2, disk_path=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cached_world_matches_uncached(self):
+        settings = GenerationSettings(width=64, height=64, seed=11)
+        WorldFactory.create_world(settings, cache=self.cache)
+        cached   = WorldFactory.create_world(settings, cache=self.cache)
+        uncached = WorldFactory.create_world(settings)
+
+        self.assertEqual(self.cache.stats["memory_hits"], len(WorldFactory.list_stages()))
+        np.testing.assert_array_equal(cached.height_map, uncached.height_map)
+        np.testing.assert_array_equal(cached.land_mask, uncached.land_mask)
+
+    def test_downstream_change_reuses_upstream_stages(self):
+        WorldFactory.create_world(GenerationSettings(width=64, height=64, seed=11), cache=self.cache)
+        changed = GenerationSettings(width=64, height=64, seed=11, terrain=TerrainSettings(sea_level=0.2))
+        world = WorldFactory.create_world(changed, cache=self.cache)
+
+        self.assertEqual(self.cache.stats["memory_hits"], 1)
+        np.testing.assert_array_equal(world.land_mask, world.height_map > 0.2)
+
+    def test_disk_tier_survives_a_new_memory_tier(self):
+        settings = GenerationSettings(width=32, height=32, seed=5)
+        WorldFactory.create_world(settings, cache=self.cache)
+        fresh = WorldCache(memory_bytes=64 * 1024 ** 2, disk_path=self.tmp.name)
+        WorldFactory.create_world(settings, cache=fresh)
+
+        self.assertEqual(fresh.stats["disk_hits"], len(WorldFactory.list_stages()))
+        self.assertEqual(fresh.stats["misses"], 0)
+
+    def test_biome_data_change_reuses_upstream_stages(self):
+        config_manager = ConfigAble()
+        saved_config = config_manager.config
+        biome_data_path = os.path.join(self.tmp.name, "biome_data.json")
+        shutil.copy(saved_config["WorldCache"]["biome_data_path"], biome_data_path)
+        config_manager.config = {**saved_config, "WorldCache": {**saved_config["WorldCache"], "biome_data_path": biome_data_path}}
+        self.addCleanup(setattr, config_manager, "config", saved_config)
+
+        settings = GenerationSettings(width=32, height=32, seed=5)
+        WorldFactory.create_world(settings, cache=self.cache)
+        with open(biome_data_path, "r") as file:
+            biome_data = json.load(file)
+        biome_data["Basic"]["Hot desert"]["max_moisture"] += 1000
+        with open(biome_data_path, "w") as file:
+            json.dump(biome_data, file)
+        WorldFactory.create_world(settings, cache=self.cache)
+
+        self.assertEqual(self.cache.stats["memory_hits"], len(WorldFactory.list_stages()) - 1)
+        self.assertEqual(self.cache.stats["misses"], len(WorldFactory.list_stages()) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os, tempfile, unittest
+
+import numpy as np
+
+from Core.cache import WorldStore
+from data_models.world import Rect, World
+
+
+def _world(seed: int, size: int = 32) -> World:
+    heights = np.random.default_rng(seed).standard_normal((size, size)).astype(np.float32)
+    return World(width=size, height=size, seed=seed, name=f"World {seed}", height_map=heights, land_mask=heights > 0)
+
+
+class TestWorldStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = WorldStore(self.directory.name, max_bytes=1024 ** 3)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_attach_returns_read_only_views_of_the_shared_files(self):
+        world = _world(1)
+        self.assertTrue(self.store.put("w1", world))
+        self.assertFalse(self.store.put("w1", _world(2)))
+
+        with self.store.open("w1") as shared:
+            self.assertEqual((shared.seed, shared.name, shared.width), (1, "World 1", 32))
+            np.testing.assert_array_equal(shared.height_map, world.height_map)
+            np.testing.assert_array_equal(shared.land_mask, world.land_mask)
+            self.assertIsNone(shared.biome_map)
+            self.assertFalse(shared.height_map.flags.writeable)
+            self.assertIsInstance(shared.height_map.base, np.memmap)
+            # Editing copies the layer instead of writing through to the store
+            shared.edit_layer("height_map", Rect(0, 0, 1, 1), 5.0)
+            self.assertEqual(shared.height_map[0, 0], 5.0)
+        with self.store.open("w1") as again:
+            self.assertEqual(again.height_map[0, 0], world.height_map[0, 0])
+
+    def test_references_are_counted_per_process(self):
+        self.store.put("w1", _world(1))
+        first = self.store.attach("w1")
+        second = self.store.attach("w1")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.store.refcount("w1"), 1)
+        self.store.release("w1")
+        self.assertEqual(self.store.refcount("w1"), 1)
+        self.store.release("w1")
+        self.assertEqual(self.store.refcount("w1"), 0)
+
+        # Leases of live processes count, those of processes that have exited do not
+        leases = os.path.join(self.directory.name, "w1", "leases")
+        open(os.path.join(leases, str(os.getppid())), "w").close()
+        open(os.path.join(leases, str(2 ** 22 + 1)), "w").close()
+        self.assertEqual(self.store.refcount("w1"), 1)
+        self.assertFalse(self.store.remove("w1"))
+
+    def test_evicts_least_recently_used_unreferenced_worlds(self):
+        self.store.put("w1", _world(1))
+        self.store.max_bytes = int(self.store.nbytes("w1") * 2.5)
+        held = self.store.attach("w1")
+        self.store.put("w2", _world(2))
+        os.utime(os.path.join(self.directory.name, "w2", "meta.json"), (0, 0))  # Oldest
+        self.store.put("w3", _world(3))
+
+        self.assertEqual(self.store.list_worlds(), ["w1", "w3"])
+        self.store.release("w1")
+        self.store.put("w4", _world(4))
+        self.assertEqual(self.store.list_worlds(), ["w3", "w4"])
+        self.assertEqual(held.height_map.shape, (32, 32))  # Mapped views outlive eviction
+
+    def test_missing_and_invalid_ids(self):
+        with self.assertRaises(KeyError):
+            self.store.attach("missing")
+        with self.assertRaises(ValueError):
+            self.store.attach("../escape")
+
+
+if __name__ == "__main__":
+    unittest.main()